@@ -6,9 +6,15 @@ POSTECH Datathon 2026
 import streamlit as st
 import pandas as pd
 import numpy as np
-import pickle
+import json
+import os
+import time
+from datetime import datetime
 import plotly.graph_objects as go
 import plotly.express as px
+from floresta import Floresta
+from instrumentacao import carregar_execucoes, rss_mb
+from limiares import CurvaLimiar
 
 # Configuração da página
 st.set_page_config(
@@ -73,31 +79,103 @@ st.markdown("""
 # CARREGAR DADOS
 # ============================================================================
 
-@st.cache_data
+def assinatura(caminho):
+    """(arquivo, mtime, tamanho) de cada arquivo; muda quando o treino regrava."""
+    if os.path.isdir(caminho):
+        arquivos = [os.path.join(caminho, nome) for nome in sorted(os.listdir(caminho))]
+    else:
+        arquivos = [caminho]
+    return tuple((a, os.stat(a).st_mtime_ns, os.stat(a).st_size) for a in arquivos)
+
+def _medir_carga(ler, caminho, versao):
+    """Carrega o artefato e guarda junto tempo, memória e versão lida."""
+    rss_antes = rss_mb()
+    inicio = time.perf_counter()
+    valor = ler(caminho)
+    carga_ms = (time.perf_counter() - inicio) * 1000
+    rss_depois = rss_mb()
+    return {
+        'valor': valor,
+        'carga_ms': carga_ms,
+        'rss_mb': None if rss_antes is None else rss_depois - rss_antes,
+        'disco_mb': sum(tamanho for _, _, tamanho in versao) / 2**20,
+        'carregado_em': datetime.now().strftime('%H:%M:%S'),
+    }
+
+def _ler_json(caminho):
+    with open(caminho) as f:
+        return json.load(f)
+
+# Uma instância por processo do servidor, compartilhada (somente leitura)
+# por todas as sessões. A assinatura dos arquivos entra na chave: quando o
+# treino regrava models/, a próxima execução recarrega e a versão antiga
+# sai do cache (max_entries=1)
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _recurso_modelo(versao):
+    return _medir_carga(Floresta.carregar, 'models/floresta', versao)
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _recurso_resultados(versao):
+    # Resumo pequeno gerado no treino; os arrays do teste (results.pkl)
+    # não são lidos pelo dashboard
+    return _medir_carga(_ler_json, 'models/resumo.json', versao)
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _recurso_limiares(versao):
+    return _medir_carga(CurvaLimiar.carregar, 'models/limiares.npz', versao)
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _recurso_execucoes(versao):
+    # Histórico de execuções do treino (instrumentacao.py), uma por linha
+    return _medir_carga(carregar_execucoes, 'models/execucoes.jsonl', versao)
+
 def load_model():
     try:
-        with open('models/model.pkl', 'rb') as f:
-            return pickle.load(f)
-    except:
+        return _recurso_modelo(assinatura('models/floresta'))
+    except OSError:
         st.error("❌ Modelo não encontrado!")
         return None
 
-@st.cache_data
 def load_results():
     try:
-        with open('models/results.pkl', 'rb') as f:
-            return pickle.load(f)
-    except:
+        return _recurso_resultados(assinatura('models/resumo.json'))
+    except OSError:
+        return None
+
+def load_limiares():
+    try:
+        return _recurso_limiares(assinatura('models/limiares.npz'))
+    except OSError:
+        return None
+
+def load_execucoes():
+    try:
+        return _recurso_execucoes(assinatura('models/execucoes.jsonl'))
+    except OSError:
         return None
 
-model = load_model()
-results = load_results()
+recurso_modelo = load_model()
+recurso_resultados = load_results()
+recurso_limiares = load_limiares()
 
-if model is None or results is None:
+if recurso_modelo is None or recurso_resultados is None or recurso_limiares is None:
     st.stop()
 
-metrics = results['metrics']
-cm = results['confusion_matrix']
+model = recurso_modelo['valor']
+results = recurso_resultados['valor']
+curva = recurso_limiares['valor']
+
+# Painel de diagnóstico dos artefatos: abrir o app com ?debug=1
+if st.query_params.get('debug') == '1':
+    with st.sidebar:
+        st.markdown("### 🔧 Artefatos carregados")
+        for nome, recurso in (('Modelo', recurso_modelo), ('Resultados', recurso_resultados),
+                              ('Linhas de corte', recurso_limiares)):
+            rss = 'n/d' if recurso['rss_mb'] is None else f"+{recurso['rss_mb']:.1f} MB"
+            st.markdown(
+                f"**{nome}** — carregado às {recurso['carregado_em']}  \n"
+                f"Carga: {recurso['carga_ms']:.1f} ms · RSS: {rss} · Disco: {recurso['disco_mb']:.2f} MB"
+            )
 
 # ============================================================================
 # HEADER
@@ -110,7 +188,7 @@ st.markdown('<p class="subtitle"><strong>Sistema Inteligente de Recrutamento</st
 # TABS
 # ============================================================================
 
-tab1, tab2, tab3 = st.tabs(["📊 Resultados", "💰 Impacto", "ℹ️ Sobre"])
+tab1, tab2, tab_execucoes, tab3 = st.tabs(["📊 Resultados", "💰 Impacto", "⏱️ Execuções", "ℹ️ Sobre"])
 
 # ============================================================================
 # TAB 1: RESULTADOS
@@ -118,6 +196,16 @@ tab1, tab2, tab3 = st.tabs(["📊 Resultados", "💰 Impacto", "ℹ️ Sobre"])
 
 with tab1:
     st.markdown("### Desempenho do Modelo")
+    
+    # Métricas e matriz na linha de corte escolhida: busca binária nos
+    # scores ordenados do teste (models/limiares.npz), sem recalcular
+    limiar = st.slider(
+        "✂️ Linha de corte (score mínimo para recomendar)",
+        min_value=0.0, max_value=1.0, value=0.5, step=0.01,
+        help="Candidatos com score acima da linha são recomendados"
+    )
+    metrics = {**results['metrics'], **curva.metricas(limiar)}
+    cm = curva.matriz(limiar)
     st.markdown("")
     
     # Métricas principais
@@ -247,38 +335,43 @@ with tab1:
     with col2:
         st.markdown("#### 📈 Como o Modelo Classifica")
         
-        y_test = results['y_test']
-        y_proba = results['y_proba']
+        # Histogramas já contados no treino (models/resumo.json)
+        histograma = results['histograma']
+        bordas = np.array(histograma['bordas'])
+        centros = (bordas[:-1] + bordas[1:]) / 2
+        largura = bordas[1] - bordas[0]
         
         # Criar gráfico mais intuitivo
         fig = go.Figure()
         
         # Candidatos ruins (vermelho)
-        fig.add_trace(go.Histogram(
-            x=y_proba[y_test == 0],
+        fig.add_trace(go.Bar(
+            x=centros,
+            y=histograma['negativos'],
+            width=largura,
             name='❌ Não Foram Contratados',
             marker_color='#ff6b6b',
             opacity=0.7,
-            nbinsx=30,
             hovertemplate='Score: %{x:.0%}<br>Quantidade: %{y}<extra></extra>'
         ))
         
         # Candidatos bons (verde)
-        fig.add_trace(go.Histogram(
-            x=y_proba[y_test == 1],
+        fig.add_trace(go.Bar(
+            x=centros,
+            y=histograma['positivos'],
+            width=largura,
             name='✅ Foram Contratados',
             marker_color='#51cf66',
             opacity=0.7,
-            nbinsx=30,
             hovertemplate='Score: %{x:.0%}<br>Quantidade: %{y}<extra></extra>'
         ))
         
         # Linha de corte
         fig.add_vline(
-            x=0.5, 
+            x=limiar, 
             line_dash="dash", 
             line_color="black",
-            annotation_text="Linha de Corte (50%)",
+            annotation_text=f"Linha de Corte ({limiar:.0%})",
             annotation_position="top"
         )
         
@@ -443,6 +536,61 @@ with tab2:
         st.plotly_chart(fig, use_container_width=True)
         st.markdown("**96% mais rápido** ⚡")
 
+# ============================================================================
+# TAB EXECUÇÕES: TEMPO E MEMÓRIA POR ETAPA DO TREINO
+# ============================================================================
+
+# Últimas execuções mostradas nos gráficos
+MAX_EXECUCOES = 30
+
+with tab_execucoes:
+    st.markdown("### ⏱️ Etapas do Treino por Execução")
+
+    recurso_execucoes = load_execucoes()
+    if recurso_execucoes is None or not recurso_execucoes['valor']:
+        st.info("Nenhuma execução registrada ainda: rode `python treinar_modelo.py` "
+                "(grava models/execucoes.jsonl).")
+    else:
+        execucoes = recurso_execucoes['valor'][-MAX_EXECUCOES:]
+        etapas = pd.DataFrame([
+            {
+                'execucao': f"#{i} {execucao['inicio'].replace('T', ' ')}",
+                'etapa': etapa['nome'],
+                'tempo_s': etapa['tempo_s'],
+                'cpu_s': etapa['cpu_s'] + etapa['cpu_filhos_s'],
+                'pico_rss_mb': etapa['pico_rss_mb'],
+                'linhas_entrada': etapa['linhas_entrada'],
+                'linhas_saida': etapa['linhas_saida'],
+            }
+            for i, execucao in enumerate(execucoes, 1)
+            for etapa in execucao['etapas']
+        ])
+
+        col1, col2 = st.columns(2)
+        with col1:
+            fig = px.bar(etapas, x='execucao', y='tempo_s', color='etapa',
+                         title="Tempo por etapa (s)")
+            fig.update_layout(height=420, xaxis_title=None, yaxis_title="Segundos")
+            st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            fig = px.line(etapas, x='execucao', y='pico_rss_mb', color='etapa', markers=True,
+                          title="Pico de RSS por etapa (MB)")
+            fig.update_layout(height=420, xaxis_title=None, yaxis_title="MB")
+            st.plotly_chart(fig, use_container_width=True)
+
+        ultima = execucoes[-1]
+        parametros = ultima['parametros']
+        st.markdown(
+            f"#### Última execução — {ultima['inicio'].replace('T', ' ')}  \n"
+            f"Total: {ultima['tempo_total_s']:.1f}s · Pico de RSS: {ultima['pico_rss_processo_mb']:.0f} MB · "
+            f"{ultima['cpus']} CPUs · desbalanceamento `{parametros.get('desbalanceamento')}` · "
+            f"split `{parametros.get('split')}` · cache: {'sim' if parametros.get('cache') else 'não'}"
+        )
+        st.dataframe(
+            etapas[etapas['execucao'] == etapas['execucao'].iloc[-1]].drop(columns='execucao'),
+            hide_index=True, use_container_width=True,
+        )
+
 # ============================================================================
 # TAB 3: SOBRE
 # ============================================================================
@@ -0,0 +1,41 @@
+"""
+DECISION AI - Atualização incremental do histórico de candidaturas
+POSTECH Datathon 2026
+
+Uso: python atualizar_historico.py novos_prospects.json [--historico models/historico.npz]
+
+Anexa as candidaturas de um prospects.json de delta (mesmo formato do
+original) ao snapshot de agregados usado pelo serviço de pontuação, sem
+reprocessar o histórico inteiro. O arquivo é trocado de forma atômica e um
+servico.py em execução passa a usá-lo na requisição seguinte, sem reiniciar.
+"""
+
+import argparse
+import time
+
+from features import Historico
+from ingestao import ler_prospects
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Anexa prospects novos ao histórico")
+    parser.add_argument('prospects')
+    parser.add_argument('--historico', default='models/historico.npz')
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    historico = Historico.carregar(args.historico)
+    delta, _ = ler_prospects(args.prospects)
+    antes = historico.n_linhas
+
+    historico.atualizar(delta)
+    historico.salvar(args.historico)
+
+    print(f"  Candidaturas novas: {len(delta):,}")
+    print(f"  Histórico: {antes:,} -> {historico.n_linhas:,} candidaturas")
+    print(f"  Candidatos: {len(historico.ids_candidatos):,} | Vagas: {len(historico.ids_vagas):,}")
+    print(f"✅ {args.historico} atualizado em {time.perf_counter() - inicio:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
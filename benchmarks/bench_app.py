@@ -0,0 +1,59 @@
+"""
+DECISION AI - Benchmark do tempo até a primeira renderização do dashboard
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_app.py [app.py ...]
+
+Roda no diretório do projeto (com models/ já gerado). Para cada script,
+executa o app com o streamlit.testing em um subprocesso novo: a primeira
+sessão paga a carga dos artefatos (cache frio) e as seguintes reaproveitam
+o cache do processo (cache quente). Passar uma versão antiga do app.py
+permite comparar antes/depois.
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+SESSOES = 5
+
+
+def medir(script):
+    """Sessões sucessivas do app no mesmo processo; imprime JSON com tempos."""
+    from streamlit.testing.v1 import AppTest
+
+    tempos = []
+    for _ in range(SESSOES):
+        app = AppTest.from_file(script, default_timeout=60)
+        inicio = time.perf_counter()
+        app.run()
+        tempos.append(time.perf_counter() - inicio)
+        assert not app.exception, app.exception
+    print(json.dumps({
+        'frio_ms': tempos[0] * 1000,
+        'quente_ms': min(tempos[1:]) * 1000,
+        'pico_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def main():
+    scripts = sys.argv[1:] or ['app.py']
+
+    print(f"{'script':<24} {'frio (ms)':>10} {'quente (ms)':>12} {'pico RSS (MB)':>14}")
+    for script in scripts:
+        saida = subprocess.run(
+            [sys.executable, __file__, '--medir', os.path.abspath(script)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        r = json.loads(saida.strip().splitlines()[-1])
+        print(f"{script:<24} {r['frio_ms']:>10.1f} {r['quente_ms']:>12.1f} {r['pico_rss_mb']:>14.1f}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--medir':
+        medir(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,83 @@
+"""
+DECISION AI - Benchmark das estratégias de desbalanceamento
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_desbalanceamento.py [estratégia ...]
+
+Roda no diretório do projeto, com o cache de features já gerado pelo
+treinar_modelo.py. Cada estratégia de desbalanceamento.py roda em um
+subprocesso próprio (pico de RSS isolado) com o split e a floresta do
+treino, e é avaliada no mesmo conjunto de teste.
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from desbalanceamento import ESTRATEGIAS
+
+
+def medir(estrategia):
+    from sklearn.metrics import f1_score, precision_score, recall_score, roc_auc_score
+    from sklearn.model_selection import train_test_split
+
+    from cache_colunar import CacheColunar
+    from desbalanceamento import criar_modelo, reamostrador
+    from treinar_modelo import ARQUIVOS_DADOS
+
+    df, info = CacheColunar(ARQUIVOS_DADOS).carregar_df('features')
+    X, y = df[info['features']].to_numpy(np.float32), df['is_hired']
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+
+    inicio = time.perf_counter()
+    amostrador = reamostrador(estrategia)
+    if amostrador is not None:
+        X_train, y_train = amostrador.fit_resample(X_train, y_train)
+    t_reamostrar = time.perf_counter() - inicio
+
+    modelo = criar_modelo(estrategia)
+    inicio = time.perf_counter()
+    modelo.fit(X_train, y_train)
+    t_ajuste = time.perf_counter() - inicio
+
+    y_pred = modelo.predict(X_test)
+    print(json.dumps({
+        'linhas': len(y_train),
+        'reamostrar_s': t_reamostrar,
+        'ajuste_s': t_ajuste,
+        'pico_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'precision': precision_score(y_test, y_pred),
+        'recall': recall_score(y_test, y_pred),
+        'f1': f1_score(y_test, y_pred),
+        'auc': roc_auc_score(y_test, modelo.predict_proba(X_test)[:, 1]),
+    }))
+
+
+def main():
+    estrategias = sys.argv[1:] or ESTRATEGIAS
+
+    print(f"{'estratégia':<15} {'linhas':>8} {'reamostrar':>11} {'ajuste':>8} {'pico RSS':>9} "
+          f"{'precision':>9} {'recall':>7} {'F1':>7} {'AUC':>7}")
+    for estrategia in estrategias:
+        saida = subprocess.run(
+            [sys.executable, __file__, '--medir', estrategia],
+            check=True, capture_output=True, text=True
+        ).stdout
+        r = json.loads(saida.strip().splitlines()[-1])
+        print(f"{estrategia:<15} {r['linhas']:>8,} {r['reamostrar_s']:>10.2f}s {r['ajuste_s']:>7.1f}s "
+              f"{r['pico_rss_mb']:>7.0f}MB {r['precision']:>9.2%} {r['recall']:>7.2%} "
+              f"{r['f1']:>7.2%} {r['auc']:>7.2%}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--medir':
+        medir(sys.argv[2])
+    else:
+        main()
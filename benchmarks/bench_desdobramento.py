@@ -0,0 +1,56 @@
+"""
+DECISION AI - Benchmark do desdobramento de prospects (passo [2/5])
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_desdobramento.py [pasta_dados] [repeticoes]
+
+Compara o loop original por candidatura com os buffers colunares de
+ingestao.desdobrar_prospects sobre o mesmo prospects.json já em memória, e
+confere que as duas tabelas são iguais linha a linha.
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from bench_ingestao import desdobrar_legado
+from ingestao import datas_para_epoch, desdobrar_prospects
+
+
+def cronometrar(funcao, repeticoes):
+    """Melhor tempo de `repeticoes` execuções e o último resultado."""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def main():
+    pasta = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    repeticoes = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    with open(os.path.join(pasta, 'prospects.json')) as f:
+        prospects_dict = json.load(f)
+
+    t_legado, df_legado = cronometrar(lambda: desdobrar_legado(prospects_dict), repeticoes)
+    t_colunar, (df_colunar, _) = cronometrar(
+        lambda: desdobrar_prospects(prospects_dict.items()), repeticoes)
+
+    # O desdobramento colunar já entrega data_candidatura como epoch (int64)
+    df_legado['data_candidatura'] = datas_para_epoch(df_legado['data_candidatura'].tolist())
+    pd.testing.assert_frame_equal(df_legado, df_colunar)
+
+    print(f"Candidaturas: {len(df_colunar):,} (tabelas idênticas)")
+    print(f"  Loop original: {t_legado:.3f}s")
+    print(f"  Colunar:       {t_colunar:.3f}s ({t_legado / t_colunar:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+DECISION AI - Benchmark das features de CV (por candidatura vs. por candidato)
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_features_candidatos.py [pasta_dados]
+
+Cada modo roda em um subprocesso; o custo de memória reportado é quanto o
+pico de RSS subiu durante o cálculo das features, já com os dados carregados.
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from features import FeaturesCandidatos
+from ingestao import ler_cvs, ler_prospects
+
+
+def por_candidatura(df, cv_dict):
+    """Código antigo: texto do CV copiado em cada linha e varrido por skill."""
+    df['cv'] = df['applicant_id'].map(cv_dict).fillna('')
+    df['cv_tamanho'] = df['cv'].str.len()
+    for skill in ['python', 'java', 'sql', 'sap']:
+        df[f'has_{skill}'] = df['cv'].str.lower().str.contains(skill, na=False).astype(int)
+    return df
+
+
+def por_candidato(df, cv_dict):
+    """Store de features por applicant_id, juntado por índice."""
+    candidatos = FeaturesCandidatos.de_cvs(cv_dict)
+    return df.join(candidatos.juntar(df['applicant_id']))
+
+
+MODOS = {'por_candidatura': por_candidatura, 'por_candidato': por_candidato}
+
+
+def pico_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def medir(modo, pasta):
+    df, _ = ler_prospects(os.path.join(pasta, 'prospects.json'))
+    cv_dict, _ = ler_cvs(os.path.join(pasta, 'applicants.json'))
+    antes = pico_rss_mb()
+    inicio = time.perf_counter()
+    MODOS[modo](df, cv_dict)
+    print(json.dumps({
+        'modo': modo,
+        'tempo_s': time.perf_counter() - inicio,
+        'aumento_pico_mb': pico_rss_mb() - antes,
+    }))
+
+
+def main():
+    pasta = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    print(f"{'modo':<16} {'tempo (s)':>10} {'+pico RSS (MB)':>15}")
+    for modo in MODOS:
+        saida = subprocess.run(
+            [sys.executable, __file__, '--medir', modo, pasta],
+            check=True, capture_output=True, text=True
+        ).stdout
+        r = json.loads(saida.strip().splitlines()[-1])
+        print(f"{r['modo']:<16} {r['tempo_s']:>10.2f} {r['aumento_pico_mb']:>15.1f}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--medir':
+        medir(sys.argv[2], sys.argv[3])
+    else:
+        main()
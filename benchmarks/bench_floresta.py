@@ -0,0 +1,125 @@
+"""
+DECISION AI - Benchmark da floresta achatada (floresta.py) x pickle
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_floresta.py [pasta_modelos]
+
+Treina uma Random Forest com os hiperparâmetros do treino sobre o conjunto
+de teste de results.pkl (replicado com ruído até o tamanho do treino, para
+as árvores ficarem do tamanho real), grava nos dois formatos e compara:
+carga a frio (incluindo importar o sklearn, no caso do pickle) e RSS em
+subprocessos próprios, igualdade exata de predict_proba e latência por
+tamanho de lote.
+"""
+
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from floresta import Floresta
+
+LINHAS_TREINO = 100_000
+
+
+def rss_mb():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+
+
+def carregar(modo, pasta):
+    if modo == 'pickle':
+        with open(os.path.join(pasta, 'model.pkl'), 'rb') as f:
+            return pickle.load(f)
+    return Floresta.carregar(os.path.join(pasta, 'floresta'))
+
+
+def medir(modo, pasta, X):
+    """Carga a frio + primeira predição; imprime JSON com tempos e RSS."""
+    rss_antes = rss_mb()
+    inicio = time.perf_counter()
+    modelo = carregar(modo, pasta)
+    t_carga = time.perf_counter() - inicio
+    if modo == 'pickle':
+        modelo.n_jobs = 1
+    inicio = time.perf_counter()
+    modelo.predict_proba(np.load(X))
+    t_primeira = time.perf_counter() - inicio
+    print(json.dumps({
+        'modo': modo,
+        'carga_ms': t_carga * 1000,
+        'primeira_ms': t_primeira * 1000,
+        'rss_mb': rss_mb() - rss_antes,
+    }))
+
+
+def latencia(modelo, X, repeticoes=20):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        modelo.predict_proba(X)
+    return (time.perf_counter() - inicio) / repeticoes * 1000
+
+
+def main():
+    from sklearn.ensemble import RandomForestClassifier
+
+    modelos = sys.argv[1] if len(sys.argv) > 1 else 'models'
+    with open(os.path.join(modelos, 'results.pkl'), 'rb') as f:
+        resultados = pickle.load(f)
+
+    rng = np.random.default_rng(42)
+    X_teste, y_teste = resultados['X_test'], resultados['y_test']
+    idx = rng.integers(len(X_teste), size=LINHAS_TREINO)
+    X_treino = X_teste[idx] + rng.normal(scale=0.05, size=(LINHAS_TREINO, X_teste.shape[1]))
+    modelo = RandomForestClassifier(n_estimators=100, max_depth=10, random_state=42,
+                                    class_weight='balanced', n_jobs=-1)
+    modelo.fit(X_treino, y_teste[idx])
+    floresta = Floresta.de_modelo(modelo)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        with open(os.path.join(pasta, 'model.pkl'), 'wb') as f:
+            pickle.dump(modelo, f)
+        floresta.salvar(os.path.join(pasta, 'floresta'))
+        caminho_X = os.path.join(pasta, 'X.npy')
+        np.save(caminho_X, X_teste[:100])
+
+        tamanho_pickle = os.path.getsize(os.path.join(pasta, 'model.pkl'))
+        tamanho_floresta = sum(e.stat().st_size for e in os.scandir(os.path.join(pasta, 'floresta')))
+
+        print(f"{floresta.n_arvores} árvores, {len(floresta.feature):,} nós")
+        print(f"\n{'formato':<9} {'disco (MB)':>10} {'carga (ms)':>11} {'1ª predição (ms)':>17} {'RSS (MB)':>9}")
+        for modo, tamanho in (('pickle', tamanho_pickle), ('floresta', tamanho_floresta)):
+            saida = subprocess.run(
+                [sys.executable, __file__, '--medir', modo, pasta, caminho_X],
+                check=True, capture_output=True, text=True
+            ).stdout
+            r = json.loads(saida.strip().splitlines()[-1])
+            print(f"{modo:<9} {tamanho / 2**20:>10.1f} {r['carga_ms']:>11.1f} "
+                  f"{r['primeira_ms']:>17.1f} {r['rss_mb']:>9.1f}")
+
+        # Igualdade exata com o sklearn somando as árvores na ordem
+        modelo.n_jobs = 1
+        floresta = Floresta.carregar(os.path.join(pasta, 'floresta'))
+        com_nan = X_teste.copy()
+        com_nan[::7, 0] = np.nan
+        for X in (X_teste, com_nan):
+            assert np.array_equal(modelo.predict_proba(X), floresta.predict_proba(X))
+
+        print(f"\n{'lote':>6} {'sklearn (ms)':>13} {'floresta (ms)':>14}")
+        for tamanho in (1, 10, 100, 1_000, len(X_teste)):
+            X = X_teste[:tamanho]
+            print(f"{len(X):>6,} {latencia(modelo, X):>13.2f} {latencia(floresta, X):>14.2f}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--medir':
+        medir(sys.argv[2], sys.argv[3], sys.argv[4])
+    else:
+        main()
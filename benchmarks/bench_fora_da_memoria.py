@@ -0,0 +1,102 @@
+"""
+Benchmark: treino em memória x treino fora da memória (--fora-da-memoria).
+
+Uso: python benchmarks/bench_fora_da_memoria.py [pasta] [--escala 1] [--memoria-mb 1024]
+                                                [--tolerancia-auc 0.02] [--tolerancia-f1 0.05]
+
+`pasta` precisa ter data/ com os três JSONs; sem ela, gera dados
+sintéticos (gerar_dados.py) em uma pasta temporária na `--escala` pedida.
+Roda treinar_modelo.py dos dois jeitos, sem cache, e confere:
+
+  - a matriz de features em disco é idêntica à do treino em memória;
+  - ROC-AUC e F1 no mesmo conjunto de teste ficam dentro das tolerâncias;
+  - o pico de RSS do treino fora da memória fica abaixo de --memoria-mb.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from cache_colunar import CacheColunar
+from gerar_dados import gerar
+from treinar_modelo import ARQUIVOS_DADOS
+
+
+def treinar(pasta, *args):
+    """treinar_modelo.py sem cache em `pasta`; (métricas, execucao.json)."""
+    shutil.rmtree(os.path.join(pasta, 'cache'), ignore_errors=True)
+    subprocess.run([sys.executable, os.path.join(RAIZ, 'treinar_modelo.py'), *args],
+                   cwd=pasta, check=True, capture_output=True, text=True)
+    with open(os.path.join(pasta, 'models', 'resumo.json')) as f:
+        metricas = json.load(f)['metrics']
+    with open(os.path.join(pasta, 'models', 'execucao.json')) as f:
+        return metricas, json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('pasta', nargs='?')
+    parser.add_argument('--escala', type=float, default=1)
+    parser.add_argument('--memoria-mb', type=int, default=1024)
+    parser.add_argument('--tolerancia-auc', type=float, default=0.02)
+    parser.add_argument('--tolerancia-f1', type=float, default=0.05)
+    args = parser.parse_args()
+
+    temporaria = None
+    pasta = args.pasta
+    if pasta is None:
+        temporaria = tempfile.mkdtemp(prefix='fora_da_memoria_')
+        pasta = temporaria
+        print(f"Gerando dados sintéticos ({args.escala:g}x) em {pasta}...")
+        gerar(os.path.join(pasta, 'data'), args.escala)
+
+    try:
+        print("Treino em memória (SMOTE)...")
+        em_memoria, execucao_memoria = treinar(pasta)
+        # A matriz do treino em memória fica no cache: guardar antes do
+        # próximo treino apagá-lo
+        os.chdir(pasta)
+        cache = CacheColunar(ARQUIVOS_DADOS)
+        df, info = cache.carregar_df('features')
+        X_memoria = df[info['features']].to_numpy(np.float32)
+        del df
+
+        print(f"Treino fora da memória (--memoria-mb {args.memoria_mb})...")
+        fora, execucao_fora = treinar(pasta, '--fora-da-memoria', '--memoria-mb', str(args.memoria_mb))
+        X_fora = np.load(os.path.join(cache.arquivo('matriz'), 'X.npy'), mmap_mode='r')
+        features_iguais = np.array_equal(X_memoria, X_fora)
+    finally:
+        os.chdir(RAIZ)
+        if temporaria is not None:
+            shutil.rmtree(temporaria, ignore_errors=True)
+
+    print(f"\n{'':<16} {'em memória':>12} {'fora':>12}")
+    for nome in ('precision', 'recall', 'f1', 'auc'):
+        print(f"{nome:<16} {em_memoria[nome]:>12.4f} {fora[nome]:>12.4f}")
+    print(f"{'tempo (s)':<16} {execucao_memoria['tempo_total_s']:>12.1f} "
+          f"{execucao_fora['tempo_total_s']:>12.1f}")
+    print(f"{'pico RSS (MB)':<16} {execucao_memoria['pico_rss_processo_mb']:>12.0f} "
+          f"{execucao_fora['pico_rss_processo_mb']:>12.0f}")
+
+    print(f"\n{'etapa (fora)':<22} {'tempo':>8} {'pico RSS':>9}")
+    for etapa in execucao_fora['etapas']:
+        print(f"{etapa['nome']:<22} {etapa['tempo_s']:>7.1f}s {etapa['pico_rss_mb']:>7.0f}MB")
+
+    assert features_iguais, "matriz em disco difere das features do treino em memória"
+    assert abs(fora['auc'] - em_memoria['auc']) <= args.tolerancia_auc, "ROC-AUC fora da tolerância"
+    assert abs(fora['f1'] - em_memoria['f1']) <= args.tolerancia_f1, "F1 fora da tolerância"
+    assert execucao_fora['pico_rss_processo_mb'] <= args.memoria_mb, "pico de RSS acima do limite"
+    print("\n✓ Mesmas features, métricas dentro da tolerância e pico de RSS abaixo do limite")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+DECISION AI - Benchmark da atualização incremental do histórico
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_historico.py [pasta_dados]
+
+Compara Historico.atualizar (lote novo aplicado no lugar) com recalcular os
+agregados do zero sobre histórico + lote, para históricos de 1x e 10x e
+lotes de 100 a 10.000 candidaturas, conferindo que os dois batem.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from features import Historico
+from ingestao import ler_prospects
+
+
+def como_dict(ids, valores):
+    return dict(zip(ids.tolist(), valores.tolist()))
+
+
+def conferir(incremental, completo):
+    assert incremental.n_linhas == completo.n_linhas
+    for ids, coluna in [('ids_candidatos', 'aplicacoes'), ('ids_candidatos', 'contratacoes'),
+                        ('ids_vagas', 'candidaturas_vaga')]:
+        assert (como_dict(getattr(incremental, ids), getattr(incremental, coluna))
+                == como_dict(getattr(completo, ids), getattr(completo, coluna))), coluna
+
+
+def main():
+    pasta = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    df, _ = ler_prospects(os.path.join(pasta, 'prospects.json'))
+    df = df[['job_id', 'applicant_id', 'is_hired']]
+    rng = np.random.default_rng(42)
+    deslocamento = int(df['applicant_id'].max()) + 1
+
+    print(f"{'histórico':>10} {'lote':>7} {'delta (ms)':>11} {'do zero (ms)':>13}")
+    for escala in (1, 10):
+        copias = [df.assign(applicant_id=df['applicant_id'] + k * deslocamento) for k in range(escala)]
+        historico_df = pd.concat(copias, ignore_index=True)
+        snapshot = Historico.de_prospects(historico_df)
+
+        for tamanho in (100, 1_000, 10_000):
+            # Metade candidatos já vistos, metade novos
+            delta = historico_df.iloc[rng.integers(len(historico_df), size=tamanho)].copy()
+            delta.loc[delta.index[::2], 'applicant_id'] += escala * deslocamento
+            delta = delta.reset_index(drop=True)
+
+            incremental = Historico(snapshot.ids_candidatos, snapshot.aplicacoes,
+                                    snapshot.contratacoes, snapshot.ids_vagas,
+                                    snapshot.candidaturas_vaga, snapshot.n_linhas)
+            inicio = time.perf_counter()
+            ordem = incremental.atualizar(delta)
+            t_delta = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            junto = pd.concat([historico_df, delta], ignore_index=True)
+            completo = Historico.de_prospects(junto)
+            t_zero = time.perf_counter() - inicio
+
+            conferir(incremental, completo)
+            ordem_lote = junto.groupby('job_id').cumcount().to_numpy()[len(historico_df):] + 1
+            assert (ordem == ordem_lote).all()
+
+            print(f"{len(historico_df):>10,} {tamanho:>7,} {t_delta * 1000:>11.2f} {t_zero * 1000:>13.2f}")
+
+
+if __name__ == '__main__':
+    main()
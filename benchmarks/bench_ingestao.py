@@ -0,0 +1,127 @@
+"""
+DECISION AI - Benchmark da ingestão (json.load vs. streaming)
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_ingestao.py [pasta_dados]
+
+Cada carregador roda em um subprocesso próprio para que o pico de RSS
+(ru_maxrss) de um não contamine o outro.
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+
+def desdobrar_legado(prospects_dict):
+    """Loop original por candidatura do passo [2/5]."""
+    data_list = []
+    for job_id, job_data in prospects_dict.items():
+        job_id_int = int(job_id)
+        for prospect in job_data.get('prospects', []):
+            try:
+                codigo = prospect.get('codigo', '0')
+                applicant_id = int(codigo) if codigo and codigo != '' else 0
+                comentario = str(prospect.get('comentario', '')).lower()
+                situacao = str(prospect.get('situacao_candidado', '')).lower()
+                is_hired = 1 if ('contratado' in comentario or 'contratado' in situacao) else 0
+                if applicant_id > 0:
+                    data_list.append({
+                        'job_id': job_id_int,
+                        'applicant_id': applicant_id,
+                        'is_hired': is_hired,
+                        'data_candidatura': prospect.get('data_candidatura', ''),
+                        'recrutador': prospect.get('recrutador', '')
+                    })
+            except:
+                continue
+    return pd.DataFrame(data_list)
+
+
+def carregar_legado(pasta):
+    """Carregador original do treinar_modelo.py (três json.load + loop)."""
+    with open(os.path.join(pasta, 'vagas.json')) as f:
+        vagas = json.load(f)
+    with open(os.path.join(pasta, 'prospects.json')) as f:
+        prospects_dict = json.load(f)
+    with open(os.path.join(pasta, 'applicants.json')) as f:
+        applicants = json.load(f)
+
+    df = desdobrar_legado(prospects_dict)
+
+    cv_dict = {}
+    for k, v in applicants.items():
+        try:
+            cv_dict[int(k)] = str(v.get('cv_pt', ''))
+        except:
+            continue
+    return len(vagas), df, cv_dict
+
+
+def carregar_streaming(pasta):
+    """Carregador incremental (ingestao.py)."""
+    from ingestao import contar_registros, ler_prospects, ler_cvs
+
+    n_vagas = contar_registros(os.path.join(pasta, 'vagas.json'))
+    df, _ = ler_prospects(os.path.join(pasta, 'prospects.json'))
+    cv_dict, _ = ler_cvs(os.path.join(pasta, 'applicants.json'))
+    return n_vagas, df, cv_dict
+
+
+CARREGADORES = {'legado': carregar_legado, 'streaming': carregar_streaming}
+
+
+def medir(modo, pasta):
+    """Roda um carregador e imprime JSON com tempo, pico de RSS e tamanhos."""
+    inicio = time.perf_counter()
+    n_vagas, df, cv_dict = CARREGADORES[modo](pasta)
+    tempo = time.perf_counter() - inicio
+    pico_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({
+        'modo': modo,
+        'tempo_s': tempo,
+        'pico_rss_mb': pico_mb,
+        'vagas': n_vagas,
+        'candidaturas': len(df),
+        'applicants': len(cv_dict),
+    }))
+
+
+def main():
+    pasta = sys.argv[1] if len(sys.argv) > 1 else 'data'
+
+    resultados = []
+    for modo in CARREGADORES:
+        saida = subprocess.run(
+            [sys.executable, __file__, '--medir', modo, pasta],
+            check=True, capture_output=True, text=True
+        ).stdout
+        resultados.append(json.loads(saida.strip().splitlines()[-1]))
+
+    # Os dois caminhos precisam produzir a mesma tabela
+    _, df_legado, cv_legado = carregar_legado(pasta)
+    _, df_stream, cv_stream = carregar_streaming(pasta)
+    # A ingestão já entrega data_candidatura como epoch (int64)
+    from ingestao import datas_para_epoch
+    df_legado['data_candidatura'] = datas_para_epoch(df_legado['data_candidatura'].tolist())
+    pd.testing.assert_frame_equal(df_legado, df_stream)
+    assert cv_legado == cv_stream
+
+    print(f"{'modo':<10} {'tempo (s)':>10} {'pico RSS (MB)':>14} {'candidaturas':>13} {'applicants':>11}")
+    for r in resultados:
+        print(f"{r['modo']:<10} {r['tempo_s']:>10.2f} {r['pico_rss_mb']:>14.1f} "
+              f"{r['candidaturas']:>13,} {r['applicants']:>11,}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--medir':
+        medir(sys.argv[2], sys.argv[3])
+    else:
+        main()
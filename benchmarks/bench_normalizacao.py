@@ -0,0 +1,151 @@
+"""
+DECISION AI - Benchmark do treino e da pontuação com e sem StandardScaler
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_normalizacao.py
+
+Roda no diretório do projeto, com o cache de features já gerado pelo
+treinar_modelo.py. Cada variante roda em subprocessos próprios (pico de
+RSS isolado):
+
+  normalizada  X em float64 + StandardScaler (o treino antigo, --normalizar)
+  crua         X em float32, sem scaler (o padrão)
+
+Etapas medidas:
+
+  treino     treinar_modelo.treinar completo (SMOTE, CV sem vazamento e
+             modelo final): tempo e pico de RSS
+  pontuacao  floresta do artefato em models/floresta/ pontuando todas as
+             candidaturas com ranking.pontuar_em_lotes: linhas/s e pico de
+             memória alocada pelo NumPy durante a pontuação (tracemalloc)
+
+E confere:
+
+  - a floresta com o scaler embutido devolve, sobre as features cruas,
+    exatamente o mesmo que o sklearn sobre scaler.transform(X);
+  - a mesma floresta dá exatamente o mesmo resultado com X em float32 ou
+    float64 (as árvores já comparam em float32);
+  - entre as duas variantes (modelos treinados de novo), quantos scores e
+    decisões do teste mudam.
+"""
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+VARIANTES = ['normalizada', 'crua']
+
+
+def _dados():
+    from cache_colunar import CacheColunar
+    from treinar_modelo import ARQUIVOS_DADOS
+
+    df, info = CacheColunar(ARQUIVOS_DADOS).carregar_df('features')
+    return df[info['features']], df['is_hired'], info['features']
+
+
+def medir_treino(variante, pasta):
+    from sklearn.metrics import f1_score, roc_auc_score
+    from sklearn.model_selection import train_test_split
+
+    from floresta import Floresta
+    from treinar_modelo import treinar
+
+    X, y, features = _dados()
+    normalizar = variante == 'normalizada'
+
+    inicio = time.perf_counter()
+    modelo, scaler, X_test, y_test = treinar(X, y, normalizar=normalizar)
+    tempo = time.perf_counter() - inicio
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    # Referência: o sklearn somando as árvores na ordem
+    modelo.set_params(n_jobs=1)
+    esperado = modelo.predict_proba(X_test)
+    floresta = Floresta.de_modelo(modelo, scaler, features)
+    floresta.salvar(os.path.join(pasta, variante))
+
+    # Artefato único: recebe o X de teste cru, sem scaler por fora
+    _, X_test_cru = train_test_split(X, test_size=0.2, random_state=42, stratify=y)
+    assert np.array_equal(Floresta.carregar(os.path.join(pasta, variante)).predict_proba(X_test_cru),
+                          esperado), "floresta com scaler embutido diverge do sklearn"
+    if not normalizar:
+        assert np.array_equal(modelo.predict_proba(X_test.astype(np.float64)), esperado), \
+            "float32 e float64 divergem"
+
+    proba = esperado[:, 1]
+    np.save(os.path.join(pasta, f"{variante}_teste.npy"), proba)
+    print(json.dumps({
+        'tempo_s': tempo,
+        'pico_rss_mb': pico,
+        'f1': f1_score(y_test, proba > 0.5),
+        'auc': roc_auc_score(y_test, proba),
+    }))
+
+
+def medir_pontuacao(variante, pasta):
+    from floresta import Floresta
+    from ranking import pontuar_em_lotes
+
+    X, _, _ = _dados()
+    floresta = Floresta.carregar(os.path.join(pasta, variante))
+
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    pontuar_em_lotes(floresta, X)
+    tempo = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(json.dumps({
+        'linhas_s': len(X) / tempo,
+        'pico_alocado_mb': pico / 2 ** 20,
+        'artefato_mb': sum(os.path.getsize(os.path.join(pasta, variante, nome))
+                           for nome in os.listdir(os.path.join(pasta, variante))) / 2 ** 20,
+    }))
+
+
+def _rodar(etapa, variante, pasta):
+    saida = subprocess.run(
+        [sys.executable, __file__, '--medir', etapa, variante, pasta],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(saida.strip().splitlines()[-1])
+
+
+def main():
+    with tempfile.TemporaryDirectory() as pasta:
+        treino = {v: _rodar('treino', v, pasta) for v in VARIANTES}
+        pontuacao = {v: _rodar('pontuacao', v, pasta) for v in VARIANTES}
+        scores = {v: np.load(os.path.join(pasta, f"{v}_teste.npy")) for v in VARIANTES}
+
+    print("✓ floresta com scaler embutido == sklearn sobre scaler.transform (bit a bit)")
+    print("✓ floresta crua: X float32 == X float64 (bit a bit)\n")
+
+    print(f"{'variante':<12} {'treino':>8} {'pico RSS':>9} {'F1':>7} {'AUC':>7} "
+          f"{'pontuação':>12} {'pico alocado':>13} {'artefato':>9}")
+    for v in VARIANTES:
+        t, p = treino[v], pontuacao[v]
+        print(f"{v:<12} {t['tempo_s']:>7.1f}s {t['pico_rss_mb']:>7.0f}MB {t['f1']:>7.2%} {t['auc']:>7.2%} "
+              f"{p['linhas_s']:>8,.0f} l/s {p['pico_alocado_mb']:>11.1f}MB {p['artefato_mb']:>7.1f}MB")
+
+    a, b = scores['normalizada'], scores['crua']
+    print(f"\nModelos treinados de novo, {len(a):,} linhas de teste:")
+    print(f"  scores idênticos:   {np.mean(a == b):.2%} (maior diferença {np.abs(a - b).max():.4f})")
+    print(f"  decisões (> 0.5) iguais: {np.mean((a > 0.5) == (b > 0.5)):.2%}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--medir':
+        {'treino': medir_treino, 'pontuacao': medir_pontuacao}[sys.argv[2]](sys.argv[3], sys.argv[4])
+    else:
+        main()
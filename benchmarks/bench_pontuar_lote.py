@@ -0,0 +1,134 @@
+"""
+DECISION AI - Benchmark da pontuação em lote (pontuar_lote.py)
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_pontuar_lote.py [data/prospects.json] [processos ...]
+     (padrão: 1 2 4 processos)
+
+Roda no diretório do projeto, com models/ já gerado pelo treinar_modelo.py.
+Confere, nos dois contextos, que a pontuação em lote dá exatamente os
+scores da tabela inteira em memória (calcular_features / features_novas +
+Floresta), com o modelo de models/ e com uma floresta pequena do outro
+tipo (normalizada ou não) ajustada na hora. Depois mede vazão e pico de RSS, em subprocessos, para a
+entrada e para uma cópia 4x maior (vagas repetidas com ids novos): o pico
+não deve acompanhar o tamanho da entrada.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from features import FeaturesCandidatos, Historico, calcular_features, features_novas
+from floresta import Floresta
+from ingestao import iterar_objeto, ler_prospects
+from pontuar_lote import carregar_saida, pontuar_arquivo
+from ranking import pontuar_em_lotes
+from similaridade import IndiceTextos
+
+REPETICOES = 4
+
+
+def replicar(origem, destino, vezes):
+    """prospects.json com as vagas repetidas `vezes` vezes, com job_ids novos."""
+    registros = list(iterar_objeto(origem))
+    deslocamento = max(int(job_id) for job_id, _ in registros) + 1
+    with open(destino, 'w', encoding='utf-8') as f:
+        f.write('{')
+        for r in range(vezes):
+            for i, (job_id, dados) in enumerate(registros):
+                separador = ',' if r or i else ''
+                f.write(f'{separador}"{int(job_id) + r * deslocamento}": {json.dumps(dados)}')
+        f.write('}')
+
+
+def outro_tipo(caminho, pasta):
+    """
+    Cópia de models/ com uma floresta pequena do tipo oposto ao de
+    models/floresta (com StandardScaler se ela não tem, e vice-versa).
+    """
+    modelo = Floresta.carregar('models/floresta')
+    shutil.copytree('models', pasta, ignore=shutil.ignore_patterns('floresta'))
+    candidatos = FeaturesCandidatos.carregar('models/candidatos.npz')
+    df, _ = ler_prospects(caminho)
+    X, _ = calcular_features(df, candidatos, indice_textos=IndiceTextos.carregar('models/textos'))
+    X = X[modelo.features].to_numpy(np.float64)
+
+    scaler = None if modelo.normalizada else StandardScaler().fit(X)
+    rf = RandomForestClassifier(n_estimators=20, max_depth=12, random_state=42, n_jobs=-1)
+    rf.fit(X if scaler is None else scaler.transform(X), df['is_hired'])
+    Floresta.de_modelo(rf, scaler, modelo.features).salvar(os.path.join(pasta, 'floresta'))
+    return pasta
+
+
+def conferir(caminho, pasta, pasta_modelos='models'):
+    modelo = Floresta.carregar(os.path.join(pasta_modelos, 'floresta'))
+    candidatos = FeaturesCandidatos.carregar(os.path.join(pasta_modelos, 'candidatos.npz'))
+    indice_textos = IndiceTextos.carregar(os.path.join(pasta_modelos, 'textos'))
+    df, _ = ler_prospects(caminho)
+    tipo = 'normalizada' if modelo.normalizada else 'sem normalização'
+
+    X, _ = calcular_features(df, candidatos, indice_textos=indice_textos)
+    # Lotes pequenos para passar por várias fronteiras de lote
+    pontuar_arquivo(caminho, os.path.join(pasta, 'arquivo'), pasta_modelos, linhas_por_lote=1000)
+    saida = carregar_saida(os.path.join(pasta, 'arquivo'))
+    assert np.array_equal(saida['job_id'], df['job_id'])
+    assert np.array_equal(saida['applicant_id'], df['applicant_id'])
+    assert np.array_equal(saida['score'], pontuar_em_lotes(modelo, X[modelo.features]))
+    print(f"✓ floresta {tipo}, contexto arquivo: {len(df):,} scores iguais aos de calcular_features")
+
+    historico = Historico.carregar(os.path.join(pasta_modelos, 'historico.npz'))
+    X = features_novas(df, historico, candidatos, indice_textos)[modelo.features]
+    pontuar_arquivo(caminho, os.path.join(pasta, 'historico'), pasta_modelos, contexto='historico',
+                    processos=2, linhas_por_lote=1000)
+    saida = carregar_saida(os.path.join(pasta, 'historico'))
+    assert np.array_equal(saida['score'], modelo.predict_proba(X)[:, 1])
+    print(f"✓ floresta {tipo}, contexto historico: {len(df):,} scores iguais aos de features_novas")
+
+
+def medir(caminho, processos, saida):
+    r = pontuar_arquivo(caminho, saida, processos=processos)
+    print(json.dumps(r))
+
+
+def main():
+    caminho = sys.argv[1] if len(sys.argv) > 1 else 'data/prospects.json'
+    lista_processos = [int(p) for p in sys.argv[2:]] or [1, 2, 4]
+
+    with tempfile.TemporaryDirectory() as pasta:
+        conferir(caminho, pasta)
+        conferir(caminho, pasta, outro_tipo(caminho, os.path.join(pasta, 'models_outro_tipo')))
+        print()
+
+        maior = os.path.join(pasta, 'prospects_maior.json')
+        replicar(caminho, maior, REPETICOES)
+        entradas = [('1x', caminho), (f'{REPETICOES}x', maior)]
+
+        print(f"{'entrada':<8} {'processos':>9} {'linhas':>10} {'leitura':>8} {'pontuação':>10} "
+              f"{'vazão':>12} {'RSS principal':>14} {'RSS pool':>9}")
+        for nome, entrada in entradas:
+            for processos in lista_processos:
+                saida = subprocess.run(
+                    [sys.executable, __file__, '--medir', entrada, str(processos),
+                     os.path.join(pasta, 'medida')],
+                    check=True, capture_output=True, text=True
+                ).stdout
+                r = json.loads(saida.strip().splitlines()[-1])
+                print(f"{nome:<8} {processos:>9} {r['linhas']:>10,} {r['leitura_s']:>7.1f}s "
+                      f"{r['pontuacao_s']:>9.1f}s {r['linhas'] / r['tempo_s']:>8,.0f} l/s "
+                      f"{r['pico_rss_mb']:>12.0f}MB {r['pico_rss_processos_mb']:>7.0f}MB")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--medir':
+        medir(sys.argv[2], int(sys.argv[3]), sys.argv[4])
+    else:
+        main()
@@ -0,0 +1,119 @@
+"""
+DECISION AI - Benchmark do ranking por vaga
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_ranking.py [pasta_dados] [pasta_modelos]
+
+Pontua todas as candidaturas em lotes, monta o índice top-K e mede a
+latência de consulta para cada vaga de vagas.json (inclusive as sem
+candidatos), além do custo de atualizar o índice com um lote novo. O
+top-K do índice é conferido contra a ordenação completa das candidaturas.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from features import FeaturesCandidatos, calcular_features
+from floresta import Floresta
+from ingestao import iterar_objeto, ler_prospects
+from ranking import IndiceRanking, pontuar_em_lotes
+from similaridade import IndiceTextos
+
+K = 20
+
+
+def top_completo(df, job_id, k):
+    """Referência: ordena todas as candidaturas da vaga."""
+    vaga = df[df['job_id'] == job_id]
+    vaga = vaga.sort_values(['score', 'applicant_id'], ascending=[False, True])
+    vaga = vaga.drop_duplicates('applicant_id')
+    return list(zip(vaga['applicant_id'].tolist()[:k], vaga['score'].tolist()[:k]))
+
+
+def main():
+    pasta = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    modelos = sys.argv[2] if len(sys.argv) > 2 else 'models'
+
+    modelo = Floresta.carregar(os.path.join(modelos, 'floresta'))
+    candidatos = FeaturesCandidatos.carregar(os.path.join(modelos, 'candidatos.npz'))
+
+    df, _ = ler_prospects(os.path.join(pasta, 'prospects.json'))
+    caminho_textos = os.path.join(modelos, 'textos')
+    indice_textos = IndiceTextos.carregar(caminho_textos) if os.path.exists(caminho_textos) else None
+    X, _ = calcular_features(df, candidatos, indice_textos=indice_textos)
+    X = X[modelo.features]
+
+    inicio = time.perf_counter()
+    scores = pontuar_em_lotes(modelo, X)
+    t_pontuar = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    indice = IndiceRanking.construir(df['job_id'], df['applicant_id'], scores)
+    t_construir = time.perf_counter() - inicio
+
+    with tempfile.TemporaryDirectory() as tmp:
+        caminho = os.path.join(tmp, 'ranking.npz')
+        indice.salvar(caminho)
+        inicio = time.perf_counter()
+        indice = IndiceRanking.carregar(caminho)
+        t_carregar = time.perf_counter() - inicio
+
+    print(f"Candidaturas pontuadas: {len(df):,} em {t_pontuar:.2f}s")
+    print(f"Índice (k={indice.k}): {len(indice):,} vagas, construído em {t_construir * 1000:.1f} ms,"
+          f" carregado em {t_carregar * 1000:.1f} ms")
+
+    # Latência de consulta em todas as vagas
+    vagas = [int(job_id) for job_id, _ in iterar_objeto(os.path.join(pasta, 'vagas.json'))]
+    tempos = np.empty(len(vagas))
+    for i, job_id in enumerate(vagas):
+        inicio = time.perf_counter()
+        indice.top(job_id, K)
+        tempos[i] = time.perf_counter() - inicio
+    tempos *= 1e6
+    print(f"\nConsulta top-{K} em {len(vagas):,} vagas:")
+    print(f"  p50 {np.percentile(tempos, 50):.1f} µs   p99 {np.percentile(tempos, 99):.1f} µs"
+          f"   máx {tempos.max():.1f} µs   total {tempos.sum() / 1000:.1f} ms")
+
+    # Conferência contra a ordenação completa
+    tabela = pd.DataFrame({'job_id': df['job_id'], 'applicant_id': df['applicant_id'], 'score': scores})
+    rng = np.random.default_rng(42)
+    amostra = rng.choice(tabela['job_id'].unique(), size=min(200, tabela['job_id'].nunique()), replace=False)
+    for job_id in amostra.tolist():
+        assert indice.top(job_id, K) == top_completo(tabela, job_id, K), job_id
+
+    # Atualização incremental x reconstrução, com candidatos novos e repontuados.
+    # Na base fica um score por (vaga, candidato), o maior, como no índice
+    tabela = tabela.sort_values('score').drop_duplicates(['job_id', 'applicant_id'], keep='last')
+    print(f"\n{'lote':>7} {'atualizar (ms)':>15} {'reconstruir (ms)':>17}")
+    for tamanho in (100, 1_000, 10_000):
+        lote = tabela.iloc[rng.integers(len(tabela), size=tamanho)].copy()
+        lote.loc[lote.index[::2], 'applicant_id'] += int(tabela['applicant_id'].max()) + 1
+        lote['score'] = rng.random(tamanho)
+        lote = lote.drop_duplicates(['job_id', 'applicant_id'], keep='last')
+
+        atualizado = IndiceRanking.construir(tabela['job_id'], tabela['applicant_id'], tabela['score'])
+        inicio = time.perf_counter()
+        atualizado.atualizar(lote['job_id'], lote['applicant_id'], lote['score'])
+        t_atualizar = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        junto = pd.concat([tabela, lote], ignore_index=True)
+        junto = junto.drop_duplicates(['job_id', 'applicant_id'], keep='last')
+        IndiceRanking.construir(junto['job_id'], junto['applicant_id'], junto['score'])
+        t_reconstruir = time.perf_counter() - inicio
+
+        for job_id in lote['job_id'].unique().tolist()[:200]:
+            assert atualizado.top(job_id, K) == top_completo(junto, job_id, K), job_id
+
+        print(f"{tamanho:>7,} {t_atualizar * 1000:>15.1f} {t_reconstruir * 1000:>17.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+DECISION AI - Benchmark da recuperação de candidatos em duas etapas
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_recuperacao.py [models]
+
+Roda no diretório do projeto, com models/ já gerado pelo treinar_modelo.py.
+Monta o Recuperador de recuperacao.py e compara com a força bruta:
+
+  - primeira etapa: recall@50 dos vizinhos de texto (IVF, 200 por vaga)
+    contra o top-50 exato do cosseno TF-IDF, por número de listas sondadas
+  - duas etapas: recall@K do re-ranking contra a floresta pontuando todos
+    os candidatos, e a latência das duas formas
+
+Recall com empates: conta como acerto todo candidato devolvido com score
+pelo menos igual ao K-ésimo da força bruta. Confere também que o
+re-ranking dá os mesmos scores que a força bruta para os mesmos candidatos.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from features import FeaturesCandidatos, Historico
+from floresta import Floresta
+from recuperacao import N_VIZINHOS, Recuperador
+from similaridade import IndiceTextos
+
+CONSULTAS = 100
+TOP_TEXTO = 50
+KS = [10, 20, 50]
+
+
+def main():
+    pasta = sys.argv[1] if len(sys.argv) > 1 else 'models'
+    rng = np.random.default_rng(42)
+
+    modelo = Floresta.carregar(os.path.join(pasta, 'floresta'))
+    historico = Historico.carregar(os.path.join(pasta, 'historico.npz'))
+    candidatos = FeaturesCandidatos.carregar(os.path.join(pasta, 'candidatos.npz'))
+    textos = IndiceTextos.carregar(os.path.join(pasta, 'textos'))
+
+    inicio = time.perf_counter()
+    recuperador = Recuperador.construir(modelo, historico, candidatos, textos)
+    t_construir = time.perf_counter() - inicio
+    with tempfile.TemporaryDirectory() as tmp:
+        recuperador.salvar(tmp + '/recuperacao')
+        disco = sum(os.path.getsize(os.path.join(tmp, 'recuperacao', n))
+                    for n in os.listdir(tmp + '/recuperacao'))
+        recuperador = Recuperador.carregar(tmp + '/recuperacao', modelo, historico, candidatos, textos)
+
+        vetorial = recuperador.vetorial
+        n_listas = len(vetorial.centroides)
+        print(f"Índice: {len(textos.ids_cvs):,} candidatos, {len(vetorial.ids):,} com CV em "
+              f"{n_listas} listas ({recuperador.dimensoes} dimensões), "
+              f"{len(recuperador.destaques)} destaques")
+        print(f"  construído em {t_construir:.1f}s, {disco / 2 ** 20:.1f}MB em disco")
+
+        linhas = rng.choice(len(textos.ids_vagas), CONSULTAS, replace=False)
+        job_ids = [int(textos.ids_vagas[linha]) for linha in linhas]
+
+        # Primeira etapa: vizinhos de texto contra o cosseno TF-IDF exato
+        exatos = []
+        for linha in linhas:
+            cosseno = (textos.cvs @ textos.vagas[linha].T).toarray().ravel()
+            exatos.append(set(textos.ids_cvs[np.argsort(-cosseno, kind='stable')[:TOP_TEXTO]].tolist()))
+
+        print(f"\nPrimeira etapa: recall@{TOP_TEXTO} de texto em {N_VIZINHOS} vizinhos "
+              f"({CONSULTAS} vagas)")
+        print(f"{'sondas':>8} {'recall':>8} {'p50 (ms)':>9}")
+        for n_sondas in [4, 8, 16, 32, n_listas]:
+            recalls, tempos = [], []
+            for job_id, exato in zip(job_ids, exatos):
+                vetor = recuperador.vetor_vaga(job_id)
+                inicio = time.perf_counter()
+                vizinhos, _ = vetorial.buscar(vetor, N_VIZINHOS, n_sondas)
+                tempos.append(time.perf_counter() - inicio)
+                recalls.append(len(exato & set(vizinhos.tolist())) / len(exato))
+            print(f"{n_sondas:>8} {np.mean(recalls):>8.3f} {np.median(tempos) * 1000:>9.2f}")
+
+        # Duas etapas contra a floresta pontuando todos os candidatos
+        recalls = {k: [] for k in KS}
+        t_duas, t_bruta, tamanhos = [], [], []
+        for job_id in job_ids:
+            inicio = time.perf_counter()
+            ids, scores = recuperador.recomendar(job_id, max(KS))
+            t_duas.append(time.perf_counter() - inicio)
+            inicio = time.perf_counter()
+            ids_bruta, scores_bruta = recuperador.forca_bruta(job_id, max(KS))
+            t_bruta.append(time.perf_counter() - inicio)
+            tamanhos.append(len(recuperador.candidatos_vaga(job_id)))
+
+            assert np.array_equal(scores, recuperador.pontuar(job_id, ids))
+            comuns, i, j = np.intersect1d(ids, ids_bruta, return_indices=True)
+            assert np.array_equal(scores[i], scores_bruta[j])
+            for k in KS:
+                recalls[k].append(np.mean(scores[:k] >= scores_bruta[k - 1]))
+        print("\n✓ re-ranking com os mesmos scores da força bruta")
+
+        print(f"\nDuas etapas x força bruta ({CONSULTAS} vagas, {np.mean(tamanhos):.0f} "
+              f"candidatos re-ranqueados em média)")
+        print("  " + "  ".join(f"recall@{k}: {np.mean(recalls[k]):.3f}" for k in KS))
+        print(f"{'':>14} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+        for nome, tempos in [('duas etapas', t_duas), ('força bruta', t_bruta)]:
+            tempos = np.array(tempos) * 1000
+            print(f"{nome:>14} {np.percentile(tempos, 50):>9.1f} {np.percentile(tempos, 99):>9.1f}")
+        print(f"  {np.median(t_bruta) / np.median(t_duas):.0f}x mais rápido")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+DECISION AI - Benchmark do índice de similaridade vaga x CV
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_similaridade.py [pasta_dados]
+
+Monta o índice TF-IDF de similaridade.py, mede a similaridade de todas as
+candidaturas em lote e a consulta de um CV novo contra todas as vagas, no
+índice como está e com as vagas repetidas até 10x o tamanho do vagas.json
+real (14.081). Confere o lote contra o produto par a par e o top-K da
+consulta contra a ordenação completa.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from scipy import sparse
+
+from ingestao import ler_cvs, ler_prospects, ler_textos_vagas
+from similaridade import IndiceTextos
+
+VAGAS_REAIS = 14081
+K = 20
+CONSULTAS = 200
+
+
+def latencias(indice, textos):
+    tempos = np.empty(len(textos))
+    for i, texto in enumerate(textos):
+        inicio = time.perf_counter()
+        indice.vagas_para_texto(texto, K)
+        tempos[i] = time.perf_counter() - inicio
+    return tempos * 1000
+
+
+def main():
+    pasta = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    rng = np.random.default_rng(42)
+
+    textos_vagas = ler_textos_vagas(os.path.join(pasta, 'vagas.json'))
+    cv_dict, _ = ler_cvs(os.path.join(pasta, 'applicants.json'))
+    df, _ = ler_prospects(os.path.join(pasta, 'prospects.json'))
+
+    inicio = time.perf_counter()
+    indice = IndiceTextos.construir(textos_vagas, cv_dict)
+    t_construir = time.perf_counter() - inicio
+    with tempfile.TemporaryDirectory() as tmp:
+        indice.salvar(tmp + '/textos')
+        disco = sum(os.path.getsize(os.path.join(tmp, 'textos', n)) for n in os.listdir(tmp + '/textos'))
+        inicio = time.perf_counter()
+        indice = IndiceTextos.carregar(tmp + '/textos')
+        t_carregar = time.perf_counter() - inicio
+
+        print(f"Índice: {len(indice.ids_vagas):,} vagas ({indice.vagas.nnz:,} termos), "
+              f"{len(indice.ids_cvs):,} CVs ({indice.cvs.nnz:,} termos)")
+        print(f"  construído em {t_construir:.2f}s, {disco / 2 ** 20:.1f}MB em disco, "
+              f"carregado em {t_carregar * 1000:.1f} ms")
+
+        # Todas as candidaturas em lote
+        inicio = time.perf_counter()
+        sim = indice.similaridade(df['job_id'], df['applicant_id'])
+        t_lote = time.perf_counter() - inicio
+        print(f"\nSimilaridade de {len(df):,} candidaturas: {t_lote * 1000:.0f} ms "
+              f"({len(df) / t_lote:,.0f} candidaturas/s)")
+
+        linhas_vagas = indice.linhas_vagas(df['job_id'])
+        linhas_cvs = indice.linhas_cvs(df['applicant_id'])
+        for i in rng.choice(len(df), 500):
+            if linhas_vagas[i] < 0 or linhas_cvs[i] < 0:
+                assert sim[i] == 0
+                continue
+            esperado = (indice.vagas[linhas_vagas[i]] @ indice.cvs[linhas_cvs[i]].T).toarray()[0, 0]
+            assert np.isclose(sim[i], esperado, rtol=1e-6, atol=1e-7)
+        print("  ✓ igual ao produto par a par (500 amostras)")
+
+        # Um CV novo contra todas as vagas
+        com_texto = [texto for texto in cv_dict.values() if texto]
+        textos = [com_texto[i] for i in rng.choice(len(com_texto), CONSULTAS)]
+        for texto in textos[:20]:
+            ids, scores = indice.vagas_para_texto(texto, K)
+            todos_ids, todos = indice.vagas_para_texto(texto)
+            assert np.array_equal(scores, todos[:K]) and np.array_equal(ids, todos_ids[:K])
+
+        print(f"\nCV novo contra todas as vagas (top-{K}, {CONSULTAS} consultas):")
+        print(f"{'vagas':>10} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+        t = latencias(indice, textos)
+        print(f"{len(indice.ids_vagas):>10,} {np.percentile(t, 50):>9.2f} {np.percentile(t, 99):>9.2f}")
+
+        repeticoes = -(-10 * VAGAS_REAIS // len(indice.ids_vagas))
+        maior = IndiceTextos(
+            indice.idf, np.arange(len(indice.ids_vagas) * repeticoes, dtype=np.int64),
+            sparse.vstack([indice.vagas] * repeticoes, format='csr'),
+            indice.ids_cvs, indice.cvs,
+        )
+        t = latencias(maior, textos)
+        print(f"{len(maior.ids_vagas):>10,} {np.percentile(t, 50):>9.2f} {np.percentile(t, 99):>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
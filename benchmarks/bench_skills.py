@@ -0,0 +1,66 @@
+"""
+DECISION AI - Benchmark da extração de skills
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_skills.py [pasta_dados]
+
+Mede o tempo das colunas has_* com o código antigo (str.lower().str.contains
+por skill, sobre o CV copiado em cada candidatura) e com o extrator de
+skills.py (um passe por CV único, via features.FeaturesCandidatos), para
+vocabulários de 4, 40 e 400 termos.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingestao import ler_cvs, ler_prospects
+from features import FeaturesCandidatos
+
+TERMOS_REAIS = [
+    'python', 'java', 'sql', 'sap', 'javascript', 'typescript', 'react', 'angular',
+    'node.js', 'c#', 'c++', '.net', 'php', 'ruby', 'go', 'kotlin', 'swift', 'scala',
+    'oracle', 'mysql', 'postgresql', 'mongodb', 'aws', 'azure', 'gcp', 'docker',
+    'kubernetes', 'linux', 'git', 'jenkins', 'excel', 'power bi', 'tableau', 'spark',
+    'hadoop', 'abap', 'sap fi', 'sap mm', 'scrum', 'itil',
+]
+
+
+def vocabulario(tamanho):
+    """Termos reais completados com termos sintéticos até `tamanho`."""
+    termos = TERMOS_REAIS[:tamanho]
+    termos += [f'skill{i}' for i in range(tamanho - len(termos))]
+    return termos
+
+
+def legado(df, cv_dict, termos):
+    cv = df['applicant_id'].map(cv_dict).fillna('')
+    for termo in termos:
+        cv.str.lower().str.contains(termo, na=False, regex=False).astype(int)
+
+
+def extrator(df, cv_dict, termos):
+    FeaturesCandidatos.de_cvs(cv_dict, termos).juntar(df['applicant_id'])
+
+
+def main():
+    pasta = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    df, _ = ler_prospects(os.path.join(pasta, 'prospects.json'))
+    cv_dict, _ = ler_cvs(os.path.join(pasta, 'applicants.json'))
+    print(f"Candidaturas: {len(df):,} | CVs: {len(cv_dict):,}")
+
+    print(f"{'termos':>7} {'antigo (s)':>11} {'extrator (s)':>13}")
+    for tamanho in (4, 40, 400):
+        termos = vocabulario(tamanho)
+        tempos = []
+        for funcao in (legado, extrator):
+            inicio = time.perf_counter()
+            funcao(df, cv_dict, termos)
+            tempos.append(time.perf_counter() - inicio)
+        print(f"{tamanho:>7} {tempos[0]:>11.2f} {tempos[1]:>13.2f}")
+
+
+if __name__ == '__main__':
+    main()
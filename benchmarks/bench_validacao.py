@@ -0,0 +1,95 @@
+"""
+DECISION AI - Benchmark do tempo total de treino (modelo final + CV 5 dobras)
+POSTECH Datathon 2026
+
+Uso: python benchmarks/bench_validacao.py [núcleos ...]    (padrão: 8 32)
+
+Roda no diretório do projeto, com o cache de features já gerado pelo
+treinar_modelo.py. Para cada número de núcleos, cada modo roda em um
+subprocesso preso a esses núcleos (sched_setaffinity), simulando uma
+máquina daquele tamanho:
+
+  legado       fit com n_jobs=-1 + cross_val_score(n_jobs=-1) aninhado
+  pool         validacao.validar: dobras x blocos de árvores em um pool
+  reaproveitar idem, com o modelo final montado das dobras (5 ajustes)
+
+Números de núcleos maiores que os da máquina são pulados.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MODOS = ['legado', 'pool', 'reaproveitar']
+
+
+def dados_treino():
+    """X_train_bal e y_train_bal exatamente como no passo [4/5]."""
+    import numpy as np
+    from imblearn.over_sampling import SMOTE
+    from sklearn.model_selection import train_test_split
+
+    from cache_colunar import CacheColunar
+    from treinar_modelo import ARQUIVOS_DADOS
+
+    df, info = CacheColunar(ARQUIVOS_DADOS).carregar_df('features')
+    X, y = df[info['features']].to_numpy(np.float32), df['is_hired']
+    X_train, _, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+    X_bal, y_bal = SMOTE(random_state=42).fit_resample(X_train, y_train)
+    return X_bal, y_bal.to_numpy()
+
+
+def medir(modo, nucleos):
+    os.sched_setaffinity(0, range(nucleos))
+
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.model_selection import StratifiedKFold, cross_val_score
+
+    from validacao import dobras_simples, validar
+
+    X, y = dados_treino()
+    modelo = RandomForestClassifier(n_estimators=100, max_depth=10, random_state=42,
+                                    class_weight='balanced', n_jobs=-1)
+    cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
+
+    inicio = time.perf_counter()
+    if modo == 'legado':
+        modelo.fit(X, y)
+        scores = cross_val_score(modelo, X, y, cv=cv, scoring='f1', n_jobs=-1)
+    else:
+        reaproveitar = modo == 'reaproveitar'
+        _, dobras = validar(modelo, dobras_simples(X, y, cv), None if reaproveitar else (X, y),
+                            n_jobs=nucleos, reaproveitar=reaproveitar)
+        scores = [dobra['f1'] for dobra in dobras]
+    tempo = time.perf_counter() - inicio
+
+    print(json.dumps({'tempo_s': tempo, 'f1': sum(scores) / len(scores), 'linhas': len(y)}))
+
+
+def main():
+    nucleos = [int(n) for n in sys.argv[1:]] or [8, 32]
+    disponiveis = len(os.sched_getaffinity(0))
+
+    print(f"{'núcleos':>7} {'modo':<13} {'tempo (s)':>10} {'CV F1':>7}")
+    for n in nucleos:
+        if n > disponiveis:
+            print(f"{n:>7} (pulado: máquina com {disponiveis} núcleos)")
+            continue
+        for modo in MODOS:
+            saida = subprocess.run(
+                [sys.executable, __file__, '--medir', modo, str(n)],
+                check=True, capture_output=True, text=True
+            ).stdout
+            r = json.loads(saida.strip().splitlines()[-1])
+            print(f"{n:>7} {modo:<13} {r['tempo_s']:>10.1f} {r['f1']:>7.4f}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--medir':
+        medir(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
@@ -0,0 +1,111 @@
+"""
+DECISION AI - Teste de carga do serviço de pontuação
+POSTECH Datathon 2026
+
+Uso: python benchmarks/carga_servico.py [--url http://host:porta] [--modelos models]
+                                        [--requisicoes 500] [--concorrencia 4]
+
+Sem --url, sobe `servico.py` em um subprocesso. Para cada tamanho de lote,
+dispara requisições concorrentes e reporta vazão e latência p50/p99.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from features import Historico
+
+TAMANHOS_LOTE = [1, 10, 100, 1000]
+
+# Metas para requisições de uma candidatura
+META_P50_MS = 10
+META_P99_MS = 50
+
+
+def requisitar(url, corpo):
+    requisicao = urllib.request.Request(
+        url + '/pontuar', data=corpo, headers={'Content-Type': 'application/json'}
+    )
+    inicio = time.perf_counter()
+    with urllib.request.urlopen(requisicao) as resposta:
+        resposta.read()
+    return (time.perf_counter() - inicio) * 1000
+
+
+def esperar_servico(url, limite_s=120):
+    fim = time.time() + limite_s
+    while time.time() < fim:
+        try:
+            with urllib.request.urlopen(url + '/saude'):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"serviço não respondeu em {url}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--url')
+    parser.add_argument('--modelos', default='models')
+    parser.add_argument('--requisicoes', type=int, default=500)
+    parser.add_argument('--concorrencia', type=int, default=4)
+    args = parser.parse_args()
+
+    processo = None
+    url = args.url
+    if url is None:
+        url = 'http://127.0.0.1:8765'
+        processo = subprocess.Popen(
+            [sys.executable, os.path.join(RAIZ, 'servico.py'),
+             '--porta', '8765', '--modelos', args.modelos],
+            stdout=subprocess.DEVNULL
+        )
+
+    try:
+        esperar_servico(url)
+
+        # Candidaturas de candidatos e vagas reais do histórico
+        historico = Historico.carregar(os.path.join(args.modelos, 'historico.npz'))
+        rng = np.random.default_rng(42)
+
+        print(f"{'lote':>6} {'req/s':>8} {'cand/s':>10} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+        for tamanho in TAMANHOS_LOTE:
+            corpos = []
+            for _ in range(args.requisicoes):
+                candidatos = rng.choice(historico.ids_candidatos, tamanho)
+                vagas = rng.choice(historico.ids_vagas, tamanho)
+                corpos.append(json.dumps([
+                    {'job_id': int(j), 'applicant_id': int(a)} for j, a in zip(vagas, candidatos)
+                ]).encode())
+
+            inicio = time.perf_counter()
+            with ThreadPoolExecutor(args.concorrencia) as pool:
+                latencias = np.array(list(pool.map(lambda c: requisitar(url, c), corpos)))
+            duracao = time.perf_counter() - inicio
+
+            p50, p99 = np.percentile(latencias, [50, 99])
+            print(f"{tamanho:>6} {len(corpos) / duracao:>8.1f} {len(corpos) * tamanho / duracao:>10.0f} "
+                  f"{p50:>9.1f} {p99:>9.1f}")
+
+            if tamanho == 1:
+                ok = p50 <= META_P50_MS and p99 <= META_P99_MS
+                print(f"       meta p50 <= {META_P50_MS}ms, p99 <= {META_P99_MS}ms: "
+                      f"{'✓' if ok else '✗'}")
+    finally:
+        if processo is not None:
+            processo.terminate()
+            processo.wait()
+
+
+if __name__ == '__main__':
+    main()
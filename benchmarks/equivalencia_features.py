@@ -0,0 +1,138 @@
+"""
+DECISION AI - Equivalência entre features em lote e incrementais
+POSTECH Datathon 2026
+
+Uso: python benchmarks/equivalencia_features.py [pasta_dados] [amostras]
+
+Para cada candidatura de teste (candidatos e vagas existentes e novos),
+compara features.features_novas contra os agregados do histórico com a
+última linha de features.calcular_features sobre histórico + candidatura,
+com a similaridade de texto vaga x CV (similaridade.IndiceTextos).
+Depois mede o custo por candidatura com históricos de 1x e 10x o tamanho,
+que deve ficar constante.
+
+No modo ponto no tempo, confere calcular_features(ponto_no_tempo=True)
+contra o serviço visto dia a dia (features_novas das candidaturas de um dia,
+depois Historico.atualizar com elas) e contra a definição direta, filtrando
+a tabela para cada candidatura, em uma amostra.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from features import FeaturesCandidatos, Historico, calcular_features, features_novas
+from ingestao import ler_cvs, ler_prospects, ler_textos_vagas
+from similaridade import IndiceTextos
+
+
+def conferir(df, candidatos, indice_textos, cv_dict, amostras, rng):
+    historico = Historico.de_prospects(df)
+    linhas = rng.choice(len(df), amostras)
+    novo_id = int(df['applicant_id'].max()) + 1
+    nova_vaga = int(df['job_id'].max()) + 1
+
+    casos = []
+    for i, linha in enumerate(linhas):
+        job_id = int(df['job_id'].iat[linha])
+        applicant_id = int(df['applicant_id'].iat[linha])
+        if i % 4 == 1:
+            applicant_id = novo_id + i
+        elif i % 4 == 2:
+            job_id = nova_vaga + i
+        casos.append((job_id, applicant_id))
+
+    for job_id, applicant_id in casos:
+        nova = pd.DataFrame({'job_id': [job_id], 'applicant_id': [applicant_id], 'is_hired': [0]})
+        lote, features = calcular_features(pd.concat([df, nova], ignore_index=True), candidatos,
+                                           indice_textos=indice_textos)
+        esperado = lote.iloc[[-1]].reset_index(drop=True)
+
+        # Pelo store e pelo texto do CV enviado junto
+        for com_cv in (False, True):
+            entrada = nova[['job_id', 'applicant_id']].copy()
+            if com_cv:
+                entrada['cv'] = [cv_dict.get(applicant_id, '')]
+            obtido = features_novas(entrada, historico, candidatos, indice_textos)[features]
+            pd.testing.assert_frame_equal(esperado, obtido, check_dtype=False)
+
+    return len(casos)
+
+
+def conferir_ponto_no_tempo(df, candidatos, indice_textos, amostras, rng):
+    X, features = calcular_features(df, candidatos, ponto_no_tempo=True, indice_textos=indice_textos)
+
+    # Dia a dia, como o serviço: pontua o dia e só então o anexa ao histórico
+    historico = Historico.vazio()
+    obtido = []
+    inicio = time.perf_counter()
+    for _, dia in df.groupby('data_candidatura', sort=True):
+        obtido.append(features_novas(dia, historico, candidatos, indice_textos).set_index(dia.index))
+        historico.atualizar(dia)
+    t_dia_a_dia = time.perf_counter() - inicio
+    obtido = pd.concat(obtido).loc[df.index, features]
+    pd.testing.assert_frame_equal(X, obtido, check_dtype=False)
+
+    # Definição direta, uma candidatura por vez
+    inicio = time.perf_counter()
+    linhas = rng.choice(len(df), amostras, replace=False)
+    for linha in linhas:
+        data = df['data_candidatura'].iat[linha]
+        antes = df[df['data_candidatura'] < data]
+        do_candidato = antes[antes['applicant_id'] == df['applicant_id'].iat[linha]]
+        total = len(do_candidato) + 1
+        assert X['total_aplicacoes'].iat[linha] == total
+        assert X['taxa_sucesso'].iat[linha] == do_candidato['is_hired'].sum() / total
+        assert X['ordem_aplicacao'].iat[linha] == (antes['job_id'] == df['job_id'].iat[linha]).sum() + 1
+    t_filtro = (time.perf_counter() - inicio) / amostras * len(df)
+
+    inicio = time.perf_counter()
+    calcular_features(df, candidatos, ponto_no_tempo=True, indice_textos=indice_textos)
+    t_lote = time.perf_counter() - inicio
+    return t_lote, t_dia_a_dia, t_filtro
+
+
+def custo_incremental(df, candidatos, escala, rng, repeticoes=200):
+    """Tempo médio de features_novas para uma candidatura, histórico `escala`x."""
+    deslocamento = int(df['applicant_id'].max()) + 1
+    copias = [df.assign(applicant_id=df['applicant_id'] + k * deslocamento) for k in range(escala)]
+    historico = Historico.de_prospects(pd.concat(copias, ignore_index=True))
+
+    linha = df.iloc[[rng.integers(len(df))]][['job_id', 'applicant_id']]
+    features_novas(linha, historico, candidatos)
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        features_novas(linha, historico, candidatos)
+    return (time.perf_counter() - inicio) / repeticoes * 1000
+
+
+def main():
+    pasta = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    amostras = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    rng = np.random.default_rng(42)
+
+    df, _ = ler_prospects(os.path.join(pasta, 'prospects.json'))
+    cv_dict, _ = ler_cvs(os.path.join(pasta, 'applicants.json'))
+    candidatos = FeaturesCandidatos.de_cvs(cv_dict)
+    indice_textos = IndiceTextos.construir(ler_textos_vagas(os.path.join(pasta, 'vagas.json')), cv_dict)
+
+    n = conferir(df, candidatos, indice_textos, cv_dict, amostras, rng)
+    print(f"✓ {n} candidaturas: modo incremental idêntico ao modo lote")
+
+    t_lote, t_dia_a_dia, t_filtro = conferir_ponto_no_tempo(df, candidatos, indice_textos, amostras, rng)
+    print("✓ ponto no tempo: lote idêntico ao serviço dia a dia e ao filtro por candidatura")
+    print(f"  {len(df):,} linhas: ordenação + somas {t_lote:.2f}s | dia a dia {t_dia_a_dia:.2f}s | "
+          f"filtro por linha ~{t_filtro:.0f}s (estimado de {amostras} linhas)")
+
+    for escala in (1, 10):
+        ms = custo_incremental(df, candidatos, escala, rng)
+        print(f"  histórico {escala:>2}x ({len(df) * escala:,} linhas): {ms:.2f} ms por candidatura")
+
+
+if __name__ == '__main__':
+    main()
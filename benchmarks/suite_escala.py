@@ -0,0 +1,265 @@
+"""
+DECISION AI - Suíte de benchmarks em escala (1x, 10x, 100x)
+POSTECH Datathon 2026
+
+Uso: python benchmarks/suite_escala.py [--escalas 1 10 100] [--pasta /tmp/decision_escala]
+                                        [--treino-ate 100] [--cpus -1] [--semente 42]
+                                        [--referencia resultados.json] [--tolerancia 1.5]
+
+Para cada escala (múltiplo das 53.759 candidaturas reais), gera os dados
+com gerar_dados.py em <pasta>/<escala>x/data (reaproveitados se já
+gerados com os mesmos parâmetros) e mede, cada etapa em um subprocesso
+para o pico de RSS ser só dela:
+
+  ingestão    ler_prospects + ler_cvs + ler_textos_vagas
+  treino      treinar_modelo.py completo e sem cache em <pasta>/<escala>x;
+              tempo, CPU e pico de RSS por etapa vêm de models/execucao.json
+              (instrumentacao.py)
+  pontuação   pontuar_lote.pontuar_arquivo sobre o prospects.json inteiro
+
+Escalas acima de --treino-ate não treinam: pontuam com o modelo da maior
+escala treinada (a vazão da pontuação não depende do tamanho do treino).
+Uma etapa que falha (sem memória, por exemplo) fica registrada com o erro
+e a suíte segue.
+
+Os resultados vão para <pasta>/resultados.json. Com --referencia (um
+resultados.json anterior), compara o tempo por candidatura de cada etapa
+na mesma escala e termina com código 1 se alguma ficou mais de
+--tolerancia vezes mais lenta.
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from gerar_dados import FRACAO_CV, gerar
+
+ARQUIVOS = ['vagas.json', 'prospects.json', 'applicants.json']
+# Etapas mais curtas que isso (nas duas execuções) não contam como regressão: é ruído
+TEMPO_MINIMO_S = 1.0
+
+
+# ============================================================================
+# MEDIDAS (cada uma roda em um subprocesso)
+# ============================================================================
+def _pico_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def medir_ingestao(pasta_dados):
+    from ingestao import ler_cvs, ler_prospects, ler_textos_vagas
+
+    tempos = {}
+    inicio = time.perf_counter()
+    df, _ = ler_prospects(os.path.join(pasta_dados, 'prospects.json'))
+    tempos['prospects_s'] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    ler_cvs(os.path.join(pasta_dados, 'applicants.json'))
+    tempos['applicants_s'] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    ler_textos_vagas(os.path.join(pasta_dados, 'vagas.json'))
+    tempos['vagas_s'] = time.perf_counter() - inicio
+
+    mb = sum(os.path.getsize(os.path.join(pasta_dados, nome)) for nome in ARQUIVOS) / 2**20
+    return {'linhas': len(df), 'mb': mb, 'tempo_s': sum(tempos.values()), **tempos,
+            'pico_rss_mb': _pico_rss_mb()}
+
+
+def medir_pontuacao(pasta_dados, pasta_modelos, saida):
+    from pontuar_lote import pontuar_arquivo
+
+    return pontuar_arquivo(os.path.join(pasta_dados, 'prospects.json'), saida, pasta_modelos)
+
+
+def _em_subprocesso(*args):
+    """JSON da última linha do `--medir` ou {'erro': ...}."""
+    r = subprocess.run([sys.executable, __file__, '--medir', *args], capture_output=True, text=True)
+    if r.returncode != 0:
+        return {'erro': f"código {r.returncode}: {r.stderr.strip().splitlines()[-1:] or ''}"}
+    return json.loads(r.stdout.strip().splitlines()[-1])
+
+
+def _treinar(pasta_escala, cpus):
+    """treinar_modelo.py sem cache; resumo de models/execucao.json ou {'erro': ...}."""
+    shutil.rmtree(os.path.join(pasta_escala, 'cache'), ignore_errors=True)
+    inicio = time.perf_counter()
+    r = subprocess.run([sys.executable, os.path.join(RAIZ, 'treinar_modelo.py'), '--cpus', str(cpus)],
+                       cwd=pasta_escala, capture_output=True, text=True)
+    if r.returncode != 0:
+        return {'erro': f"código {r.returncode}: {r.stderr.strip().splitlines()[-1:] or ''}",
+                'tempo_s': time.perf_counter() - inicio}
+    with open(os.path.join(pasta_escala, 'models', 'execucao.json')) as f:
+        execucao = json.load(f)
+    return {
+        'tempo_s': execucao['tempo_total_s'],
+        'pico_rss_mb': execucao['pico_rss_processo_mb'],
+        'etapas': {e['nome']: {'tempo_s': e['tempo_s'], 'cpu_s': e['cpu_s'] + e['cpu_filhos_s'],
+                               'pico_rss_mb': e['pico_rss_mb']}
+                   for e in execucao['etapas']},
+    }
+
+
+# ============================================================================
+# SUÍTE
+# ============================================================================
+def _nome(escala):
+    return f"{escala:g}x"
+
+
+def preparar_dados(pasta_escala, escala, semente, fracao_cv):
+    """Gera os JSONs da escala, a menos que já existam com os mesmos parâmetros."""
+    pasta_dados = os.path.join(pasta_escala, 'data')
+    caminho_meta = os.path.join(pasta_dados, 'geracao.json')
+    parametros = {'escala': escala, 'semente': semente, 'fracao_cv': fracao_cv}
+    if os.path.exists(caminho_meta):
+        with open(caminho_meta) as f:
+            meta = json.load(f)
+        if meta['parametros'] == parametros and all(
+                os.path.exists(os.path.join(pasta_dados, nome)) for nome in ARQUIVOS):
+            return {**meta['estatisticas'], 'tempo_s': meta['tempo_s'], 'reaproveitado': True}
+
+    inicio = time.perf_counter()
+    estatisticas = gerar(pasta_dados, escala, semente, fracao_cv)
+    tempo = time.perf_counter() - inicio
+    with open(caminho_meta, 'w') as f:
+        json.dump({'parametros': parametros, 'estatisticas': estatisticas, 'tempo_s': tempo}, f)
+    return {**estatisticas, 'tempo_s': tempo, 'reaproveitado': False}
+
+
+def _por_candidatura(resultado):
+    """(tempo por candidatura em µs, tempo em s) de cada etapa medida."""
+    n = resultado['geracao']['candidaturas']
+    medidas = {}
+    for etapa in ('ingestao', 'treino', 'pontuacao'):
+        r = resultado.get(etapa) or {}
+        if 'tempo_s' in r and 'erro' not in r:
+            medidas[etapa] = (r['tempo_s'] / n * 1e6, r['tempo_s'])
+    for nome, e in ((resultado.get('treino') or {}).get('etapas') or {}).items():
+        medidas[f"treino/{nome}"] = (e['tempo_s'] / n * 1e6, e['tempo_s'])
+    return medidas
+
+
+def comparar(resultados, referencia, tolerancia):
+    """Imprime as razões contra a referência; retorna as regressões."""
+    anteriores = {r['escala']: r for r in referencia['resultados']}
+    regressoes = []
+    print(f"\nComparação com a referência (tempo por candidatura, tolerância {tolerancia:g}x)")
+    print(f"{'escala':>7} {'etapa':<34} {'antes (µs)':>11} {'agora (µs)':>11} {'razão':>7}")
+    for resultado in resultados:
+        if resultado['escala'] not in anteriores:
+            continue
+        antes = _por_candidatura(anteriores[resultado['escala']])
+        for etapa, (agora, tempo) in _por_candidatura(resultado).items():
+            if etapa not in antes or antes[etapa][0] <= 0:
+                continue
+            razao = agora / antes[etapa][0]
+            regrediu = razao > tolerancia and max(tempo, antes[etapa][1]) >= TEMPO_MINIMO_S
+            marca = ' ⚠️' if regrediu else ''
+            print(f"{_nome(resultado['escala']):>7} {etapa:<34} {antes[etapa][0]:>11.1f} "
+                  f"{agora:>11.1f} {razao:>6.2f}x{marca}")
+            if regrediu:
+                regressoes.append((resultado['escala'], etapa, razao))
+    return regressoes
+
+
+def _celula(r, chave_vazao=None):
+    if not r:
+        return f"{'-':>22}"
+    if 'erro' in r:
+        return f"{'falhou':>22}"
+    if chave_vazao:
+        return f"{r[chave_vazao] / r['tempo_s']:>9,.0f} l/s {r['pico_rss_mb']:>6.0f}MB"
+    return f"{r['tempo_s']:>10.1f}s {r['pico_rss_mb']:>7.0f}MB"
+
+
+def imprimir(resultados):
+    print(f"\n{'escala':>7} {'candidaturas':>13} {'geração':>8} {'ingestão':>22} {'treino':>22} "
+          f"{'pontuação':>22}")
+    for r in resultados:
+        print(f"{_nome(r['escala']):>7} {r['geracao']['candidaturas']:>13,} "
+              f"{r['geracao']['tempo_s']:>7.0f}s {_celula(r.get('ingestao'), 'linhas')} "
+              f"{_celula(r.get('treino'))} {_celula(r.get('pontuacao'), 'linhas')}")
+
+    # Etapas do treino lado a lado: onde o tempo e a memória crescem
+    treinadas = [r for r in resultados if (r.get('treino') or {}).get('etapas')]
+    if not treinadas:
+        return
+    etapas = list(dict.fromkeys(nome for r in treinadas for nome in r['treino']['etapas']))
+    print(f"\n{'etapa do treino':<24}" + ''.join(f"{_nome(r['escala']):>18}" for r in treinadas))
+    for nome in etapas:
+        linha = f"{nome:<24}"
+        for r in treinadas:
+            e = r['treino']['etapas'].get(nome)
+            linha += f"{e['tempo_s']:>9.1f}s {e['pico_rss_mb']:>5.0f}MB" if e else f"{'-':>18}"
+        print(linha)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks do Decision AI em escala")
+    parser.add_argument('--escalas', type=float, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--pasta', default='/tmp/decision_escala')
+    parser.add_argument('--treino-ate', type=float, default=float('inf'),
+                        help="maior escala que treina; acima dela, pontua com o último modelo")
+    parser.add_argument('--cpus', type=int, default=-1)
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--fracao-cv', type=float, default=FRACAO_CV)
+    parser.add_argument('--referencia', help="resultados.json anterior para comparar")
+    parser.add_argument('--tolerancia', type=float, default=1.5)
+    args = parser.parse_args()
+
+    resultados = []
+    pasta_modelos = None
+    for escala in sorted(args.escalas):
+        pasta_escala = os.path.join(args.pasta, _nome(escala))
+        pasta_dados = os.path.join(pasta_escala, 'data')
+        print(f"[{_nome(escala)}] gerando dados...", flush=True)
+        resultado = {'escala': escala,
+                     'geracao': preparar_dados(pasta_escala, escala, args.semente, args.fracao_cv)}
+
+        print(f"[{_nome(escala)}] ingestão...", flush=True)
+        resultado['ingestao'] = _em_subprocesso('ingestao', pasta_dados)
+
+        if escala <= args.treino_ate:
+            print(f"[{_nome(escala)}] treino...", flush=True)
+            resultado['treino'] = _treinar(pasta_escala, args.cpus)
+            if 'erro' not in resultado['treino']:
+                pasta_modelos = os.path.join(pasta_escala, 'models')
+
+        if pasta_modelos is not None:
+            print(f"[{_nome(escala)}] pontuação...", flush=True)
+            resultado['pontuacao'] = _em_subprocesso('pontuacao', pasta_dados, pasta_modelos,
+                                                     os.path.join(pasta_escala, 'scores'))
+            resultado['pontuacao']['modelos'] = pasta_modelos
+            shutil.rmtree(os.path.join(pasta_escala, 'scores'), ignore_errors=True)
+
+        resultados.append(resultado)
+        # Parcial a cada escala: uma escala grande que estoura não perde as outras
+        with open(os.path.join(args.pasta, 'resultados.json'), 'w') as f:
+            json.dump({'parametros': vars(args), 'cpus': os.cpu_count(), 'resultados': resultados},
+                      f, indent=1)
+
+    imprimir(resultados)
+    print(f"\nResultados em {os.path.join(args.pasta, 'resultados.json')}")
+
+    if args.referencia:
+        with open(args.referencia) as f:
+            referencia = json.load(f)
+        if comparar(resultados, referencia, args.tolerancia):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--medir':
+        etapa, caminhos = sys.argv[2], sys.argv[3:]
+        medida = medir_ingestao(*caminhos) if etapa == 'ingestao' else medir_pontuacao(*caminhos)
+        print(json.dumps(medida))
+    else:
+        main()
@@ -0,0 +1,230 @@
+"""
+DECISION AI - Busca de hiperparâmetros da Random Forest
+POSTECH Datathon 2026
+
+Uso: python buscar_hiperparametros.py [--modo halving|aleatoria] [--tentativas 27]
+                                      [--cpus N] [--trabalhadores W] [--semente 42]
+
+Sorteia configurações da floresta e da proporção do SMOTE e avalia cada uma
+em um pool de processos, sobre a matriz de features em cache do treino.
+Cada processo treina sua floresta com cpus // trabalhadores threads, então
+o total nunca passa de --cpus.
+
+A avaliação usa só a parte de treino do split do treinar_modelo.py: um
+quarto dela vira validação, e o SMOTE é aplicado apenas no restante. No
+modo halving, todas as configurações começam com 1/9 das linhas e só o
+melhor terço avança a cada rodada (1/9 -> 1/3 -> tudo).
+
+Cada tentativa concluída é anexada a um .jsonl na pasta do cache (mesma
+chave de dados): rodar de novo com os mesmos argumentos retoma de onde
+parou.
+"""
+
+import argparse
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from imblearn.over_sampling import SMOTE
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import f1_score, roc_auc_score
+from sklearn.model_selection import train_test_split
+from threadpoolctl import threadpool_limits
+
+from cache_colunar import CacheColunar
+from treinar_modelo import ARQUIVOS_DADOS, carregar_dados, criar_features, em_cache
+
+ESPACO = {
+    'n_estimators': [50, 100, 200, 400],
+    'max_depth': [6, 8, 10, 12, 16, None],
+    'min_samples_leaf': [1, 2, 5, 10],
+    'max_features': ['sqrt', 0.5, 1.0],
+    'class_weight': ['balanced', None],
+    # Proporção minoria/maioria após o SMOTE; None = sem SMOTE
+    'smote': [None, 0.25, 0.5, 1.0],
+}
+
+FATOR_HALVING = 3
+RODADAS_HALVING = 3
+
+
+def sortear_configuracoes(n, semente):
+    """`n` configurações distintas, sempre as mesmas para a mesma semente."""
+    rng = np.random.default_rng(semente)
+    configuracoes, vistas = [], set()
+    limite = math.prod(len(v) for v in ESPACO.values())
+    while len(configuracoes) < min(n, limite):
+        config = {nome: valores[rng.integers(len(valores))] for nome, valores in ESPACO.items()}
+        chave = json.dumps(config, sort_keys=True)
+        if chave not in vistas:
+            vistas.add(chave)
+            configuracoes.append(config)
+    return configuracoes
+
+
+# ============================================================================
+# AVALIAÇÃO (roda nos processos do pool)
+# ============================================================================
+_DADOS = {}
+
+
+def _iniciar_trabalhador(X_ajuste, y_ajuste, X_validacao, y_validacao, n_jobs):
+    # Dados chegam uma vez por processo; BLAS/OpenMP ficam em uma thread para
+    # não somar com as threads da floresta
+    threadpool_limits(1)
+    _DADOS.update(X_ajuste=X_ajuste, y_ajuste=y_ajuste, X_validacao=X_validacao,
+                  y_validacao=y_validacao, n_jobs=n_jobs)
+
+
+def _avaliar(config, fracao, semente):
+    inicio = time.perf_counter()
+    X, y = _DADOS['X_ajuste'], _DADOS['y_ajuste']
+    if fracao < 1:
+        X, _, y, _ = train_test_split(X, y, train_size=fracao, random_state=semente, stratify=y)
+
+    if config['smote'] is not None and config['smote'] > y.mean() / (1 - y.mean()):
+        X, y = SMOTE(sampling_strategy=config['smote'], random_state=semente).fit_resample(X, y)
+
+    modelo = RandomForestClassifier(
+        n_estimators=config['n_estimators'],
+        max_depth=config['max_depth'],
+        min_samples_leaf=config['min_samples_leaf'],
+        max_features=config['max_features'],
+        class_weight=config['class_weight'],
+        random_state=semente,
+        n_jobs=_DADOS['n_jobs'],
+    )
+    modelo.fit(X, y)
+
+    proba = modelo.predict_proba(_DADOS['X_validacao'])[:, 1]
+    y_validacao = _DADOS['y_validacao']
+    return {
+        'f1': f1_score(y_validacao, proba > 0.5),
+        'auc': roc_auc_score(y_validacao, proba),
+        'linhas': len(y),
+        'tempo_s': time.perf_counter() - inicio,
+    }
+
+
+# ============================================================================
+# CHECKPOINT
+# ============================================================================
+def _chave(config, rodada):
+    return json.dumps({'rodada': rodada, **config}, sort_keys=True)
+
+
+def ler_checkpoint(caminho):
+    """Tentativas já concluídas, por (configuração, rodada)."""
+    concluidas = {}
+    if os.path.exists(caminho):
+        with open(caminho) as f:
+            for linha in f:
+                try:
+                    tentativa = json.loads(linha)
+                except json.JSONDecodeError:
+                    # Linha cortada por uma interrupção no meio da escrita
+                    continue
+                concluidas[_chave(tentativa['config'], tentativa['rodada'])] = tentativa
+    return concluidas
+
+
+def _anexar(caminho, tentativa):
+    with open(caminho, 'a') as f:
+        f.write(json.dumps(tentativa) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def rodar_rodada(pool, configuracoes, rodada, fracao, semente, concluidas, checkpoint):
+    """Avalia as configurações que faltam na rodada; retorna todas as tentativas."""
+    pendentes = {}
+    for config in configuracoes:
+        if _chave(config, rodada) not in concluidas:
+            pendentes[pool.submit(_avaliar, config, fracao, semente)] = config
+
+    print(f"\n  Rodada {rodada + 1}: {len(configuracoes)} configurações, "
+          f"{fracao:.0%} das linhas ({len(configuracoes) - len(pendentes)} retomadas)")
+    for futuro in as_completed(pendentes):
+        tentativa = {'config': pendentes[futuro], 'rodada': rodada, **futuro.result()}
+        _anexar(checkpoint, tentativa)
+        concluidas[_chave(tentativa['config'], rodada)] = tentativa
+        print(f"    F1 {tentativa['f1']:.4f}  AUC {tentativa['auc']:.4f}  "
+              f"{tentativa['tempo_s']:6.1f}s  {json.dumps(tentativa['config'])}")
+
+    return [concluidas[_chave(config, rodada)] for config in configuracoes]
+
+
+def imprimir_ranking(tentativas, n=10):
+    print("\n" + "=" * 60)
+    print("RANKING (maior rodada alcançada, depois F1)")
+    print("=" * 60)
+    ordenadas = sorted(tentativas, key=lambda t: (t['rodada'], t['f1']), reverse=True)
+    print(f"{'#':>3} {'rodada':>6} {'F1':>7} {'AUC':>7} {'linhas':>8} {'tempo':>7}  configuração")
+    for i, t in enumerate(ordenadas[:n], 1):
+        print(f"{i:>3} {t['rodada'] + 1:>6} {t['f1']:>7.4f} {t['auc']:>7.4f} {t['linhas']:>8,} "
+              f"{t['tempo_s']:>6.1f}s  {json.dumps(t['config'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Busca de hiperparâmetros do Decision AI")
+    parser.add_argument('--modo', choices=['halving', 'aleatoria'], default='halving')
+    parser.add_argument('--tentativas', type=int, default=27)
+    parser.add_argument('--cpus', type=int, default=os.cpu_count())
+    parser.add_argument('--trabalhadores', type=int, default=None,
+                        help="processos simultâneos (padrão: --cpus)")
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    trabalhadores = min(args.trabalhadores or args.cpus, args.cpus)
+    n_jobs = max(1, args.cpus // trabalhadores)
+
+    print("DECISION AI - Busca de hiperparâmetros\n")
+
+    cache = CacheColunar(ARQUIVOS_DADOS)
+    usar_cache = em_cache(cache)
+    df, cv_dict, textos_vagas = carregar_dados(cache, usar_cache)
+    X, y, _, _, _ = criar_features(df, cv_dict, textos_vagas, cache, usar_cache)
+    del df, cv_dict, textos_vagas
+
+    # Mesmo split do treino: o conjunto de teste fica fora da busca
+    X_train, _, y_train, _ = train_test_split(
+        X.to_numpy(np.float64), y.to_numpy(), test_size=0.2, random_state=42, stratify=y
+    )
+    X_ajuste, X_validacao, y_ajuste, y_validacao = train_test_split(
+        X_train, y_train, test_size=0.25, random_state=args.semente, stratify=y_train
+    )
+
+    configuracoes = sortear_configuracoes(args.tentativas, args.semente)
+    checkpoint = cache.arquivo(f"busca_{args.modo}_{args.tentativas}_{args.semente}.jsonl")
+    concluidas = ler_checkpoint(checkpoint)
+
+    print(f"\n  Busca {args.modo}: {len(configuracoes)} configurações")
+    print(f"  CPUs: {args.cpus} = {trabalhadores} processos x {n_jobs} threads por floresta")
+    print(f"  Checkpoint: {checkpoint} ({len(concluidas)} tentativas concluídas)")
+
+    if args.modo == 'halving':
+        fracoes = [FATOR_HALVING ** -(RODADAS_HALVING - 1 - r) for r in range(RODADAS_HALVING)]
+    else:
+        fracoes = [1.0]
+
+    tentativas = []
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(trabalhadores, initializer=_iniciar_trabalhador,
+                             initargs=(X_ajuste, y_ajuste, X_validacao, y_validacao, n_jobs)) as pool:
+        for rodada, fracao in enumerate(fracoes):
+            resultado = rodar_rodada(pool, configuracoes, rodada, fracao, args.semente,
+                                     concluidas, checkpoint)
+            tentativas.extend(resultado)
+            # Só o melhor terço segue para a próxima rodada
+            resultado.sort(key=lambda t: t['f1'], reverse=True)
+            configuracoes = [t['config'] for t in resultado[:math.ceil(len(resultado) / FATOR_HALVING)]]
+
+    imprimir_ranking(tentativas)
+    print(f"\n✅ Busca concluída em {time.perf_counter() - inicio:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+DECISION AI - Cache colunar em disco
+POSTECH Datathon 2026
+
+Guarda tabelas intermediárias do treino (prospects desdobrados, matriz de
+features) como um .npy por coluna, em uma pasta nomeada pelo hash do
+conteúdo dos JSONs de entrada. Qualquer mudança nos dados gera outra chave,
+o que invalida o cache automaticamente.
+
+O formato (uma pasta com um .npy por array mais meta.json, escrita ao lado
+e trocada de forma atômica, lida via memory-map) é o mesmo dos artefatos de
+models/ (floresta, textos, recuperação) e das saídas de pontuar_lote.py,
+que usam salvar_arrays/carregar_arrays.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+# Incrementar quando o formato ou o cálculo das tabelas em cache mudar
+VERSAO_CACHE = 4
+
+
+def hash_arquivos(caminhos):
+    """SHA-256 do conteúdo de todos os `caminhos`, na ordem dada."""
+    h = hashlib.sha256(f"v{VERSAO_CACHE}".encode())
+    for caminho in caminhos:
+        with open(caminho, 'rb') as f:
+            h.update(hashlib.file_digest(f, 'sha256').digest())
+    return h.hexdigest()
+
+
+def pasta_temporaria(pasta):
+    """Pasta `pasta`.tmp vazia, onde o conteúdo é escrito antes de trocar_pasta."""
+    tmp = pasta.rstrip(os.sep) + '.tmp'
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    return tmp
+
+
+def trocar_pasta(tmp, pasta):
+    """Põe `tmp` no lugar de `pasta`: um leitor nunca vê a pasta pela metade."""
+    pasta = pasta.rstrip(os.sep)
+    shutil.rmtree(pasta, ignore_errors=True)
+    os.replace(tmp, pasta)
+
+
+def salvar_arrays(pasta, arrays, **meta):
+    """Um .npy por item de `arrays` (nome -> array) mais `meta` em meta.json, com troca atômica."""
+    tmp = pasta_temporaria(pasta)
+    for nome, array in arrays.items():
+        np.save(os.path.join(tmp, f"{nome}.npy"), array, allow_pickle=False)
+    with open(os.path.join(tmp, 'meta.json'), 'w') as f:
+        json.dump(meta, f)
+    trocar_pasta(tmp, pasta)
+
+
+def carregar_arrays(pasta):
+    """(arrays por nome, via memory-map e somente leitura; meta.json) de uma pasta de salvar_arrays."""
+    with open(os.path.join(pasta, 'meta.json')) as f:
+        meta = json.load(f)
+    arrays = {nome[:-len('.npy')]: np.load(os.path.join(pasta, nome), mmap_mode='r')
+              for nome in sorted(os.listdir(pasta)) if nome.endswith('.npy')}
+    return arrays, meta
+
+
+class CacheColunar:
+    """Tabelas em cache para um conjunto de arquivos de entrada."""
+
+    def __init__(self, arquivos, pasta='cache'):
+        self.chave = hash_arquivos(arquivos)
+        self.pasta = os.path.join(pasta, self.chave[:16])
+
+    def arquivo(self, nome):
+        """Caminho de um artefato avulso dentro da pasta do cache."""
+        os.makedirs(self.pasta, exist_ok=True)
+        return os.path.join(self.pasta, nome)
+
+    def contem(self, nome):
+        # Tabelas só aparecem com o nome final quando completas (ver salvar_df)
+        return os.path.exists(os.path.join(self.pasta, nome))
+
+    def salvar_df(self, nome, df, **info):
+        """Grava `df` coluna a coluna; `info` vai junto no meta.json."""
+        arrays, colunas = {}, []
+        for i, col in enumerate(df.columns):
+            serie = df[col]
+            texto = not pd.api.types.is_numeric_dtype(serie)
+            arrays[str(i)] = serie.astype(str).to_numpy(dtype=str) if texto else serie.to_numpy()
+            colunas.append({'nome': col, 'texto': texto})
+
+        # Troca atômica: um treino interrompido nunca deixa cache pela metade
+        salvar_arrays(os.path.join(self.pasta, nome), arrays,
+                      chave=self.chave, colunas=colunas, info=info)
+
+    def carregar_df(self, nome):
+        """Retorna (df, info). Colunas numéricas são lidas via memory-map."""
+        arrays, meta = carregar_arrays(os.path.join(self.pasta, nome))
+        dados = {}
+        for i, col in enumerate(meta['colunas']):
+            valores = arrays[str(i)]
+            dados[col['nome']] = valores.tolist() if col['texto'] else np.asarray(valores)
+        return pd.DataFrame(dados, copy=False), meta['info']
@@ -0,0 +1,52 @@
+"""
+DECISION AI - Estratégias para o desbalanceamento de classes
+POSTECH Datathon 2026
+
+  smote           SMOTE com k-NN exato até 50/50 + class_weight='balanced'
+                  (o treino original)
+  smote-balltree  idem, com os vizinhos buscados em uma BallTree
+  pesos           sem linhas sintéticas: só class_weight='balanced'
+  bagging         BalancedRandomForest: cada árvore vê uma amostra
+                  bootstrap com a classe majoritária subamostrada
+
+As duas últimas não dobram o conjunto de treino, então o ajuste da
+floresta custa cerca de metade (pesos) ou bem menos (bagging).
+"""
+
+from imblearn.ensemble import BalancedRandomForestClassifier
+from imblearn.over_sampling import SMOTE
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.neighbors import NearestNeighbors
+
+ESTRATEGIAS = ['smote', 'smote-balltree', 'pesos', 'bagging']
+
+# Mesmo número de vizinhos que o padrão do SMOTE
+K_VIZINHOS = 5
+
+
+def reamostrador(estrategia, random_state=42):
+    """Reamostrador do imblearn da estratégia, ou None se ela não gera linhas."""
+    if estrategia == 'smote':
+        return SMOTE(random_state=random_state)
+    if estrategia == 'smote-balltree':
+        # k + 1: o próprio ponto volta como vizinho mais próximo
+        vizinhos = NearestNeighbors(n_neighbors=K_VIZINHOS + 1, algorithm='ball_tree')
+        return SMOTE(k_neighbors=vizinhos, random_state=random_state)
+    if estrategia in ('pesos', 'bagging'):
+        return None
+    raise ValueError(f"estratégia desconhecida: {estrategia!r}")
+
+
+def criar_modelo(estrategia, n_jobs=-1, random_state=42, **parametros):
+    """Floresta da estratégia com os hiperparâmetros do treino."""
+    parametros = {'n_estimators': 100, 'max_depth': 10, **parametros}
+    if estrategia == 'bagging':
+        return BalancedRandomForestClassifier(
+            sampling_strategy='all', replacement=True, bootstrap=False,
+            random_state=random_state, n_jobs=n_jobs, **parametros
+        )
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"estratégia desconhecida: {estrategia!r}")
+    return RandomForestClassifier(
+        class_weight='balanced', random_state=random_state, n_jobs=n_jobs, **parametros
+    )
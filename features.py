@@ -0,0 +1,442 @@
+"""
+DECISION AI - Features por candidato
+POSTECH Datathon 2026
+
+Features derivadas do CV são calculadas uma única vez por applicant_id e
+guardadas de forma compacta (arrays por feature + matriz esparsa de
+skills). As candidaturas recebem os valores por índice inteiro, sem nunca
+carregar o texto do CV.
+
+Dois modos produzem as mesmas features:
+- lote (calcular_features): groupbys sobre a tabela inteira, usado no treino;
+- incremental (features_novas): uma candidatura nova contra os agregados de
+  Historico, O(1) por candidatura, usado na pontuação online.
+
+features_em_partes dá o mesmo que calcular_features para uma tabela lida em
+pedaços (pontuação em lote), com memória proporcional a um pedaço.
+
+Com ponto_no_tempo=True, calcular_features olha só o passado de cada
+candidatura (dias anteriores a data_candidatura), como o modo incremental
+visto dia a dia: features_novas sobre as candidaturas de um dia e depois
+Historico.atualizar com elas, em ordem de data, dão as mesmas features.
+
+Nos três modos, com um `indice_textos` (similaridade.IndiceTextos) entra
+também a similaridade entre o texto da vaga e o CV.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from skills import SKILLS, ExtratorSkills
+
+FEATURES_COMPORTAMENTAIS = ['total_aplicacoes', 'taxa_sucesso', 'ordem_aplicacao']
+
+# Cosseno TF-IDF entre o texto da vaga e o CV (similaridade.IndiceTextos)
+FEATURE_SIMILARIDADE = 'similaridade_texto'
+
+# Features numéricas sobre o texto do CV (nome -> função do texto).
+# Uma nova feature de CV é só mais uma entrada aqui
+FEATURES_CV = {
+    'cv_tamanho': len,
+}
+
+
+def salvar_npz(caminho, **arrays):
+    """np.savez com troca atômica, para leitores concorrentes (serviço)."""
+    tmp = caminho + '.tmp.npz'
+    np.savez(tmp, **arrays)
+    os.replace(tmp, caminho)
+
+
+class FeaturesCandidatos:
+    """Features de CV indexadas por applicant_id."""
+
+    def __init__(self, ids, valores, matriz_skills, vocabulario=SKILLS):
+        self.ids = ids
+        self.valores = valores
+        self.matriz_skills = matriz_skills
+        self.vocabulario = vocabulario
+        self.skills = list(vocabulario)
+        self._indice = pd.Index(ids)
+        self._extrator = None
+
+    @classmethod
+    def de_cvs(cls, cv_dict, vocabulario=SKILLS):
+        """Calcula as features de cada CV de `cv_dict` (applicant_id -> texto)."""
+        extrator = ExtratorSkills(vocabulario)
+        ids, matriz = extrator.extrair(cv_dict)
+        valores = {
+            nome: np.array([funcao(texto) for texto in cv_dict.values()])
+            for nome, funcao in FEATURES_CV.items()
+        }
+        candidatos = cls(ids, valores, matriz, vocabulario)
+        candidatos._extrator = extrator
+        return candidatos
+
+    @property
+    def colunas(self):
+        return list(self.valores) + [f'has_{skill}' for skill in self.skills]
+
+    def linhas(self, applicant_ids):
+        """Posição de cada applicant_id no store (-1 se não tem CV)."""
+        return self._indice.get_indexer(applicant_ids)
+
+    def juntar(self, applicant_ids):
+        """DataFrame com as features de candidato de cada candidatura (0 sem CV)."""
+        linhas = self.linhas(applicant_ids)
+        tem_cv = linhas >= 0
+        encontradas = linhas[tem_cv]
+
+        colunas = {}
+        for nome, valores in self.valores.items():
+            coluna = np.zeros(len(linhas), dtype=valores.dtype)
+            coluna[tem_cv] = valores[encontradas]
+            colunas[nome] = coluna
+
+        has_skills = np.zeros((len(linhas), len(self.skills)), dtype=np.int64)
+        has_skills[tem_cv] = self.matriz_skills[encontradas].toarray()
+        for i, skill in enumerate(self.skills):
+            colunas[f'has_{skill}'] = has_skills[:, i]
+
+        indice = applicant_ids.index if isinstance(applicant_ids, pd.Series) else None
+        return pd.DataFrame(colunas, index=indice)
+
+    def calcular(self, textos):
+        """Features de CV para textos avulsos, com o mesmo vocabulário do store."""
+        if self._extrator is None:
+            self._extrator = ExtratorSkills(self.vocabulario)
+        avulsos = dict(enumerate(textos))
+        ids, matriz = self._extrator.extrair(avulsos)
+        valores = {
+            nome: np.array([funcao(texto) for texto in textos], dtype=self.valores[nome].dtype)
+            for nome, funcao in FEATURES_CV.items()
+        }
+        return FeaturesCandidatos(ids, valores, matriz, self.vocabulario).juntar(ids)
+
+    def salvar(self, caminho):
+        salvar_npz(
+            caminho,
+            ids=self.ids,
+            nomes=np.array(list(self.valores)),
+            vocabulario=np.array(json.dumps(self.vocabulario)),
+            skills_data=self.matriz_skills.data,
+            skills_indices=self.matriz_skills.indices,
+            skills_indptr=self.matriz_skills.indptr,
+            **{f'valor_{nome}': valores for nome, valores in self.valores.items()}
+        )
+
+    @classmethod
+    def carregar(cls, caminho):
+        with np.load(caminho) as npz:
+            vocabulario = json.loads(npz['vocabulario'].item())
+            ids = npz['ids']
+            valores = {nome: npz[f'valor_{nome}'] for nome in npz['nomes'].tolist()}
+            matriz = sparse.csr_matrix(
+                (npz['skills_data'], npz['skills_indices'], npz['skills_indptr']),
+                shape=(len(ids), len(vocabulario))
+            )
+        return cls(ids, valores, matriz, vocabulario)
+
+
+class _Contadores:
+    """
+    Contadores int64 por id que crescem no lugar.
+
+    Os arrays têm capacidade com folga (dobra quando enche) e a posição de
+    cada id fica num dict, então somar um lote custa O(tamanho do lote).
+    """
+
+    def __init__(self, ids, **colunas):
+        self.n = len(ids)
+        capacidade = max(self.n, 1)
+        self._ids = np.zeros(capacidade, dtype=np.int64)
+        self._ids[:self.n] = ids
+        self._colunas = {}
+        for nome, valores in colunas.items():
+            self._colunas[nome] = np.zeros(capacidade, dtype=np.int64)
+            self._colunas[nome][:self.n] = valores
+        self._posicoes = dict(zip(self._ids[:self.n].tolist(), range(self.n)))
+
+    @property
+    def ids(self):
+        return self._ids[:self.n]
+
+    def coluna(self, nome):
+        return self._colunas[nome][:self.n]
+
+    def posicoes(self, chaves):
+        """Posição de cada id (-1 se desconhecido)."""
+        get = self._posicoes.get
+        return np.fromiter((get(c, -1) for c in np.asarray(chaves).tolist()),
+                           dtype=np.int64, count=len(chaves))
+
+    def buscar(self, nome, chaves):
+        """Valores de `nome` para cada id (0 se desconhecido)."""
+        posicoes = self.posicoes(chaves)
+        encontrados = posicoes >= 0
+        resultado = np.zeros(len(posicoes), dtype=np.int64)
+        resultado[encontrados] = self._colunas[nome][posicoes[encontrados]]
+        return resultado
+
+    def _crescer(self, necessario):
+        capacidade = max(necessario, 2 * len(self._ids))
+        self._ids = np.resize(self._ids, capacidade)
+        for nome, valores in self._colunas.items():
+            crescido = np.zeros(capacidade, dtype=np.int64)
+            crescido[:self.n] = valores[:self.n]
+            self._colunas[nome] = crescido
+
+    def somar(self, chaves, **incrementos):
+        """Soma `incrementos` (arrays alinhados a `chaves`), criando ids novos."""
+        chaves = np.asarray(chaves, dtype=np.int64)
+        posicoes = self.posicoes(chaves)
+
+        novos = pd.unique(chaves[posicoes < 0])
+        if len(novos):
+            if self.n + len(novos) > len(self._ids):
+                self._crescer(self.n + len(novos))
+            inicio = self.n
+            self._ids[inicio:inicio + len(novos)] = novos
+            self._posicoes.update(zip(novos.tolist(), range(inicio, inicio + len(novos))))
+            self.n += len(novos)
+            posicoes = self.posicoes(chaves)
+
+        for nome, incremento in incrementos.items():
+            np.add.at(self._colunas[nome], posicoes, incremento)
+
+
+class Historico:
+    """
+    Contagens de candidaturas passadas por candidato e por vaga.
+
+    Pode ser montado do zero (de_prospects) ou mantido com lotes de
+    candidaturas novas (atualizar), e gravado/lido como snapshot .npz.
+    """
+
+    def __init__(self, ids_candidatos, aplicacoes, contratacoes, ids_vagas,
+                 candidaturas_vaga, n_linhas=None):
+        self._candidatos = _Contadores(ids_candidatos, aplicacoes=aplicacoes,
+                                       contratacoes=contratacoes)
+        self._vagas = _Contadores(ids_vagas, candidaturas=candidaturas_vaga)
+        self.n_linhas = int(np.sum(aplicacoes)) if n_linhas is None else n_linhas
+
+    @classmethod
+    def vazio(cls):
+        vazio = np.zeros(0, dtype=np.int64)
+        return cls(vazio, vazio, vazio, vazio, vazio)
+
+    @classmethod
+    def de_prospects(cls, df):
+        """Agrega a tabela de prospects (job_id, applicant_id, is_hired)."""
+        por_candidato = df.groupby('applicant_id')['is_hired'].agg(['size', 'sum'])
+        por_vaga = df.groupby('job_id').size()
+        return cls(
+            por_candidato.index.to_numpy(dtype=np.int64),
+            por_candidato['size'].to_numpy(dtype=np.int64),
+            por_candidato['sum'].to_numpy(dtype=np.int64),
+            por_vaga.index.to_numpy(dtype=np.int64),
+            por_vaga.to_numpy(dtype=np.int64),
+            n_linhas=len(df),
+        )
+
+    @property
+    def ids_candidatos(self):
+        return self._candidatos.ids
+
+    @property
+    def aplicacoes(self):
+        return self._candidatos.coluna('aplicacoes')
+
+    @property
+    def contratacoes(self):
+        return self._candidatos.coluna('contratacoes')
+
+    @property
+    def ids_vagas(self):
+        return self._vagas.ids
+
+    @property
+    def candidaturas_vaga(self):
+        return self._vagas.coluna('candidaturas')
+
+    def candidato(self, applicant_ids):
+        """(aplicacoes, contratacoes) anteriores de cada candidato (0 se novo)."""
+        return (self._candidatos.buscar('aplicacoes', applicant_ids),
+                self._candidatos.buscar('contratacoes', applicant_ids))
+
+    def vaga(self, job_ids):
+        """Candidaturas anteriores de cada vaga (0 se nova)."""
+        return self._vagas.buscar('candidaturas', job_ids)
+
+    def atualizar(self, delta):
+        """
+        Anexa um lote de prospects novos (job_id, applicant_id, is_hired).
+
+        Atualiza as contagens no lugar, em O(tamanho do lote), e retorna a
+        ordem_aplicacao de cada linha do lote na sua vaga, igual à que
+        calcular_features daria com o lote anexado ao fim do histórico.
+        """
+        job_ids = delta['job_id'].to_numpy(dtype=np.int64)
+        ordem = self.vaga(job_ids) + delta.groupby('job_id').cumcount().to_numpy() + 1
+
+        self._candidatos.somar(
+            delta['applicant_id'].to_numpy(dtype=np.int64),
+            aplicacoes=1,
+            contratacoes=delta['is_hired'].to_numpy(dtype=np.int64),
+        )
+        self._vagas.somar(job_ids, candidaturas=1)
+        self.n_linhas += len(delta)
+        return ordem
+
+    def salvar(self, caminho):
+        salvar_npz(
+            caminho,
+            ids_candidatos=self.ids_candidatos,
+            aplicacoes=self.aplicacoes,
+            contratacoes=self.contratacoes,
+            ids_vagas=self.ids_vagas,
+            candidaturas_vaga=self.candidaturas_vaga,
+            n_linhas=np.int64(self.n_linhas),
+        )
+
+    @classmethod
+    def carregar(cls, caminho):
+        with np.load(caminho) as npz:
+            n_linhas = int(npz['n_linhas']) if 'n_linhas' in npz else None
+            return cls(npz['ids_candidatos'], npz['aplicacoes'], npz['contratacoes'],
+                       npz['ids_vagas'], npz['candidaturas_vaga'], n_linhas)
+
+
+def _anteriores(chaves, datas, valores):
+    """
+    Para cada linha, quantas linhas da mesma chave têm data anterior à sua
+    e a soma de `valores` nelas. Uma ordenação por (chave, data) e somas
+    acumuladas: cada linha lê o acumulado no começo do seu bloco
+    (chave, data) menos o do começo da sua chave.
+    """
+    ordem = np.lexsort((datas, chaves))
+    k, d = chaves[ordem], datas[ordem]
+    posicoes = np.arange(len(ordem))
+    muda_chave = np.r_[True, k[1:] != k[:-1]]
+    muda_bloco = muda_chave | np.r_[True, d[1:] != d[:-1]]
+    inicio_chave = np.maximum.accumulate(np.where(muda_chave, posicoes, 0))
+    inicio_bloco = np.maximum.accumulate(np.where(muda_bloco, posicoes, 0))
+    acumulado = np.r_[0, np.cumsum(valores[ordem])]
+
+    contagem = np.empty(len(ordem), dtype=np.int64)
+    soma = np.empty(len(ordem), dtype=np.int64)
+    contagem[ordem] = inicio_bloco - inicio_chave
+    soma[ordem] = acumulado[inicio_bloco] - acumulado[inicio_chave]
+    return contagem, soma
+
+
+def nomes_features(candidatos, indice_textos):
+    """Nomes das features, na ordem das colunas de X."""
+    extras = [] if indice_textos is None else [FEATURE_SIMILARIDADE]
+    return FEATURES_COMPORTAMENTAIS + candidatos.colunas + extras
+
+
+def calcular_features(df, candidatos, ponto_no_tempo=False, indice_textos=None):
+    """
+    Modo lote: features de todas as candidaturas de `df` (job_id,
+    applicant_id, is_hired e, com `ponto_no_tempo`, data_candidatura), na
+    ordem do arquivo.
+
+    Sem `ponto_no_tempo`, as comportamentais usam a tabela inteira: o
+    histórico completo do candidato (inclusive a própria candidatura e as
+    futuras) e a ordem no arquivo. Com ele, cada candidatura vê só as
+    candidaturas de dias anteriores, como features_novas veria.
+
+    Retorna (X, features), com X indexado como `df`.
+    """
+    X = pd.DataFrame(index=df.index)
+
+    # Comportamentais
+    if ponto_no_tempo:
+        datas = df['data_candidatura'].to_numpy(dtype=np.int64)
+        aplicacoes, contratacoes = _anteriores(
+            df['applicant_id'].to_numpy(dtype=np.int64), datas, df['is_hired'].to_numpy(dtype=np.int64)
+        )
+        vaga, _ = _anteriores(df['job_id'].to_numpy(dtype=np.int64), datas, np.zeros(len(df), np.int64))
+        X['total_aplicacoes'] = aplicacoes + 1
+        X['taxa_sucesso'] = contratacoes / X['total_aplicacoes']
+        X['ordem_aplicacao'] = vaga + 1
+    else:
+        X['total_aplicacoes'] = df.groupby('applicant_id')['applicant_id'].transform('count')
+        total_contratacoes = df.groupby('applicant_id')['is_hired'].transform('sum')
+        X['taxa_sucesso'] = (total_contratacoes / X['total_aplicacoes']).fillna(0)
+        X['ordem_aplicacao'] = df.groupby('job_id').cumcount() + 1
+
+    # CV: juntado por índice a partir do store de candidatos
+    X = X.join(candidatos.juntar(df['applicant_id']))
+    if indice_textos is not None:
+        X[FEATURE_SIMILARIDADE] = indice_textos.similaridade(df['job_id'], df['applicant_id'])
+
+    # Limpar
+    X = X.fillna(0)
+    X = X.replace([np.inf, -np.inf], 0)
+
+    features = nomes_features(candidatos, indice_textos)
+    return X[features], features
+
+
+def features_em_partes(parte, totais, anteriores, candidatos, indice_textos=None):
+    """
+    Features de `parte` (job_id, applicant_id, is_hired), um pedaço de uma
+    tabela lida em sequência, iguais às que calcular_features daria para
+    essas linhas na tabela inteira.
+
+    `totais` é o Historico da tabela inteira (de uma passada anterior) e
+    `anteriores` o dos pedaços já vistos; este é atualizado com `parte`.
+    """
+    applicant_ids = parte['applicant_id'].to_numpy(dtype=np.int64)
+    aplicacoes, contratacoes = totais.candidato(applicant_ids)
+    resultado = pd.DataFrame({
+        'total_aplicacoes': aplicacoes,
+        'taxa_sucesso': contratacoes / aplicacoes,
+        'ordem_aplicacao': anteriores.atualizar(parte),
+    })
+    X = pd.concat([resultado, candidatos.juntar(applicant_ids)], axis=1)
+    if indice_textos is not None:
+        X[FEATURE_SIMILARIDADE] = indice_textos.similaridade(parte['job_id'], applicant_ids)
+    return X
+
+
+def features_novas(candidaturas, historico, candidatos, indice_textos=None):
+    """
+    Features de candidaturas novas (job_id, applicant_id e, opcional, cv).
+
+    Modo incremental: cada candidatura é tratada como se fosse anexada
+    sozinha ao fim do histórico, ainda sem resultado (is_hired=0), e recebe
+    exatamente o que calcular_features daria para ela nessa posição. Com
+    `cv` preenchido, as features de CV vêm do texto; senão, do store.
+    """
+    job_ids = candidaturas['job_id'].to_numpy(dtype=np.int64)
+    applicant_ids = candidaturas['applicant_id'].to_numpy(dtype=np.int64)
+
+    aplicacoes, contratacoes = historico.candidato(applicant_ids)
+    total_aplicacoes = aplicacoes + 1
+    resultado = pd.DataFrame({
+        'total_aplicacoes': total_aplicacoes,
+        'taxa_sucesso': contratacoes / total_aplicacoes,
+        'ordem_aplicacao': historico.vaga(job_ids) + 1,
+    })
+
+    cv = candidatos.juntar(applicant_ids)
+    if indice_textos is not None:
+        cv[FEATURE_SIMILARIDADE] = indice_textos.similaridade(job_ids, applicant_ids)
+    if 'cv' in candidaturas:
+        textos = candidaturas['cv'].to_numpy(dtype=object)
+        com_texto = np.array([isinstance(t, str) for t in textos], dtype=bool)
+        if com_texto.any():
+            do_texto = candidatos.calcular(list(textos[com_texto]))
+            if indice_textos is not None:
+                do_texto[FEATURE_SIMILARIDADE] = indice_textos.similaridade_textos(
+                    job_ids[com_texto], list(textos[com_texto])
+                )
+            cv.loc[com_texto] = do_texto.to_numpy()
+    return pd.concat([resultado, cv], axis=1)
@@ -0,0 +1,180 @@
+"""
+DECISION AI - Random Forest achatada em arrays NumPy
+POSTECH Datathon 2026
+
+Uso: python floresta.py [models/model.pkl] [models/floresta] [models/scaler.pkl]
+     (converte um modelo antigo em pickle para o formato achatado, com o
+     scaler antigo embutido se ele existir)
+
+Os nós de todas as árvores ficam em arrays contíguos (feature, limiar,
+filhos, probabilidades da folha), um .npy por array, lidos via memory-map:
+carregar é quase instantâneo e processos diferentes compartilham as mesmas
+páginas. A inferência percorre todas as árvores ao mesmo tempo e reproduz
+RandomForestClassifier.predict_proba bit a bit (com n_jobs=1, que soma as
+árvores na ordem).
+
+O pré-processamento vai no mesmo artefato: os nomes das features e, se o
+modelo foi treinado sobre dados normalizados, a média e a escala do
+StandardScaler. predict_proba recebe as features cruas.
+"""
+
+import os
+import pickle
+import sys
+
+import numpy as np
+
+from cache_colunar import carregar_arrays, salvar_arrays
+
+ARRAYS = ['feature', 'limiar', 'filhos', 'faltante_esquerda', 'valor', 'raizes']
+# Só existem se o modelo foi treinado com StandardScaler
+ARRAYS_NORMALIZACAO = ['media', 'escala']
+
+# Linhas avaliadas por vez: a matriz de nós é árvores x linhas
+TAMANHO_BLOCO = 8192
+
+
+class Floresta:
+    """Random Forest de classificação em formato de arrays."""
+
+    def __init__(self, feature, limiar, filhos, faltante_esquerda, valor, raizes,
+                 classes, profundidade, features=None, media=None, escala=None):
+        self.feature = feature
+        self.limiar = limiar
+        # (n_nós, 2): filho esquerdo, filho direito
+        self.filhos = filhos
+        self.faltante_esquerda = faltante_esquerda
+        self.valor = valor
+        self.raizes = raizes
+        self.classes_ = np.asarray(classes)
+        self.profundidade = profundidade
+        self.features = features
+        self.media = media
+        self.escala = escala
+
+    @classmethod
+    def de_modelo(cls, modelo, scaler=None, features=None):
+        """
+        Achata um RandomForestClassifier treinado (uma saída). Com `scaler`
+        (StandardScaler ajustado), a normalização passa a ser feita dentro
+        de predict_proba.
+        """
+        arvores = [e.tree_ for e in modelo.estimators_]
+        tamanhos = np.array([a.node_count for a in arvores], dtype=np.int64)
+        raizes = np.concatenate([[0], np.cumsum(tamanhos)[:-1]])
+
+        feature, limiar, filhos, faltante, valor = [], [], [], [], []
+        for raiz, arvore in zip(raizes.tolist(), arvores):
+            nos = np.arange(arvore.node_count, dtype=np.int64) + raiz
+            folha = arvore.children_left == -1
+            # Folhas apontam para si mesmas: o percurso roda um número fixo
+            # de passos sem testar se já chegou
+            feature.append(np.where(folha, 0, arvore.feature).astype(np.int64))
+            limiar.append(arvore.threshold)
+            filhos.append(np.column_stack([
+                np.where(folha, nos, arvore.children_left + raiz),
+                np.where(folha, nos, arvore.children_right + raiz),
+            ]))
+            faltante.append(np.asarray(arvore.missing_go_to_left, dtype=bool))
+            # tree_.value já guarda a fração de cada classe na folha, que é
+            # o que DecisionTreeClassifier.predict_proba devolve
+            valor.append(arvore.value[:, 0, :])
+
+        return cls(
+            np.concatenate(feature), np.concatenate(limiar),
+            np.concatenate(filhos), np.concatenate(faltante),
+            np.ascontiguousarray(np.concatenate(valor)),
+            raizes, modelo.classes_, max(a.max_depth for a in arvores),
+            features=None if features is None else list(features),
+            media=None if scaler is None else scaler.mean_,
+            escala=None if scaler is None else scaler.scale_,
+        )
+
+    @property
+    def n_arvores(self):
+        return len(self.raizes)
+
+    @property
+    def normalizada(self):
+        return self.media is not None
+
+    def predict_proba(self, X):
+        """
+        Mesma saída de RandomForestClassifier.predict_proba (sobre
+        scaler.transform(X), se a floresta é normalizada).
+        """
+        X = np.asarray(X)
+        proba = np.empty((len(X), self.valor.shape[1]))
+        for inicio in range(0, len(X), TAMANHO_BLOCO):
+            bloco = self._preparar(X[inicio:inicio + TAMANHO_BLOCO])
+            proba[inicio:inicio + len(bloco)] = self._proba_bloco(bloco)
+        return proba
+
+    def _preparar(self, X):
+        if self.normalizada:
+            # Mesmas operações, em float64, de StandardScaler.transform
+            X = np.array(X, dtype=np.float64)
+            X -= self.media
+            X /= self.escala
+        # As árvores do sklearn comparam em float32
+        return np.asarray(X, dtype=np.float32)
+
+    def _proba_bloco(self, X):
+        # Nó atual de cada (árvore, linha); cada passo desce um nível em
+        # todas as árvores de uma vez
+        x_plano = X.ravel()
+        base = np.arange(len(X)) * X.shape[1]
+        filhos = self.filhos.reshape(-1)
+        tem_faltantes = np.isnan(x_plano).any()
+
+        nos = np.repeat(np.asarray(self.raizes)[:, None], len(X), axis=1)
+        for _ in range(self.profundidade):
+            x = x_plano[base + self.feature[nos]]
+            if tem_faltantes:
+                direita = ~((x <= self.limiar[nos]) | (np.isnan(x) & self.faltante_esquerda[nos]))
+            else:
+                direita = x > self.limiar[nos]
+            nos = filhos[2 * nos + direita]
+
+        # Soma árvore a árvore, na ordem, como o acumulador do sklearn
+        valores = self.valor[nos]
+        soma = np.zeros((len(X), self.valor.shape[1]))
+        for t in range(self.n_arvores):
+            soma += valores[t]
+        soma /= self.n_arvores
+        return soma
+
+    def salvar(self, pasta):
+        """Arrays e metadados em `pasta` (cache_colunar.salvar_arrays)."""
+        nomes = ARRAYS + (ARRAYS_NORMALIZACAO if self.normalizada else [])
+        salvar_arrays(pasta, {nome: getattr(self, nome) for nome in nomes},
+                      classes=self.classes_.tolist(), profundidade=self.profundidade,
+                      features=self.features, normalizada=self.normalizada)
+
+    @classmethod
+    def carregar(cls, pasta):
+        """Floresta sobre os arrays de `pasta`, abertos via memory-map."""
+        arrays, meta = carregar_arrays(pasta)
+        nomes = ARRAYS + (ARRAYS_NORMALIZACAO if meta.get('normalizada') else [])
+        return cls(**{nome: arrays[nome] for nome in nomes}, classes=meta['classes'],
+                   profundidade=meta['profundidade'], features=meta.get('features'))
+
+
+def main():
+    origem = sys.argv[1] if len(sys.argv) > 1 else 'models/model.pkl'
+    destino = sys.argv[2] if len(sys.argv) > 2 else 'models/floresta'
+    caminho_scaler = sys.argv[3] if len(sys.argv) > 3 else os.path.join(os.path.dirname(origem), 'scaler.pkl')
+    with open(origem, 'rb') as f:
+        modelo = pickle.load(f)
+    scaler = None
+    if os.path.exists(caminho_scaler):
+        with open(caminho_scaler, 'rb') as f:
+            scaler = pickle.load(f)
+    features = getattr(scaler, 'feature_names_in_', getattr(modelo, 'feature_names_in_', None))
+    floresta = Floresta.de_modelo(modelo, scaler, features)
+    floresta.salvar(destino)
+    print(f"{floresta.n_arvores} árvores, {len(floresta.feature):,} nós -> {destino}")
+
+
+if __name__ == '__main__':
+    main()
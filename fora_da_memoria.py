@@ -0,0 +1,208 @@
+"""
+DECISION AI - Treino fora da memória
+POSTECH Datathon 2026
+
+Para volumes em que a tabela de candidaturas, a matriz de features e o
+SMOTE não cabem na RAM (treinar_modelo.py --fora-da-memoria):
+
+  matriz          features calculadas lote a lote, com as duas passadas de
+                  pontuar_lote.py (features_em_partes dá o mesmo que
+                  calcular_features), e gravadas em disco como uma matriz
+                  float32; cada leitura abre a matriz via memory-map e a
+                  fecha em seguida
+  balanceamento   sem linhas sintéticas: cada bloco de árvores treina numa
+                  subamostra ponderada do treino, com probabilidade de
+                  sorteio inversa à frequência da classe (metade positivos,
+                  metade negativos, com reposição), como a estratégia
+                  bagging de desbalanceamento.py
+  floresta        um bloco de validacao.ARVORES_POR_TAREFA árvores por
+                  subamostra, no mesmo pool de threads do treino em
+                  memória; a floresta final junta as árvores dos blocos
+  pontuação       avaliação e ranking numa passada pela matriz, lote a lote
+
+O limite de memória é sobre o RSS do processo: lotes e subamostras são
+dimensionados pelo que sobra entre o RSS no começo de cada passo e
+`memoria_mb`. O que não depende desse dimensionamento são os stores por
+candidato e por vaga (features de CV, índice de textos, contagens), que
+crescem com o número de candidatos e não de candidaturas, e vetores de
+poucos bytes por candidatura (ids, rótulo, scores); `memoria_mb` precisa
+cobri-los.
+"""
+
+import json
+import os
+import resource
+import tempfile
+
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+
+from features import Historico, nomes_features
+from instrumentacao import rss_mb
+from pontuar_lote import SaidaColunar, calcular_lotes, separar_lotes
+from validacao import ARVORES_POR_TAREFA, ajustar_bloco, juntar, todas_arvores
+
+MEMORIA_MB = 2048
+
+# Memória estimada por linha (bytes): DataFrames intermediários de
+# features_em_partes num lote (~600 medidos), e cópia da subamostra mais os
+# arrays de índices, pesos e rótulos do ajuste de uma árvore (além de 4 por
+# feature)
+BYTES_POR_LINHA_LOTE = 1024
+BYTES_POR_LINHA_ARVORE = 96
+
+LINHAS_MINIMAS = 1000
+MAXIMO_LINHAS_LOTE = 1 << 16
+
+
+def _rss_atual_mb():
+    """RSS atual; sem /proc, o pico do processo (nunca menor que o atual)."""
+    rss = rss_mb()
+    return rss if rss is not None else resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _disponivel(memoria_mb):
+    """Bytes entre o RSS atual e `memoria_mb`."""
+    return (memoria_mb - _rss_atual_mb()) * 2**20
+
+
+def _verificar(linhas, memoria_mb, passo):
+    if linhas < LINHAS_MINIMAS:
+        raise ValueError(f"{memoria_mb} MB não bastam para {passo} "
+                         f"(RSS atual {_rss_atual_mb():.0f} MB); aumente --memoria-mb")
+    return linhas
+
+
+def linhas_por_lote(memoria_mb):
+    """Linhas por lote da passada de features dentro de `memoria_mb`."""
+    linhas = int(_disponivel(memoria_mb) // BYTES_POR_LINHA_LOTE)
+    return _verificar(min(linhas, MAXIMO_LINHAS_LOTE), memoria_mb, 'os lotes de features')
+
+
+def linhas_por_bloco(memoria_mb, n_features, n_positivos, n_jobs=-1):
+    """
+    Linhas da subamostra de cada bloco de árvores: o dobro dos positivos
+    do treino (cada negativo só aparece com a frequência de um positivo),
+    ou menos, se as subamostras de `n_jobs` blocos simultâneos não cabem.
+    """
+    por_linha = 4 * n_features + BYTES_POR_LINHA_ARVORE
+    linhas = int(_disponivel(memoria_mb) // (por_linha * effective_n_jobs(n_jobs)))
+    # O mínimo vale para o que cabe na memória, não para o teto pelos
+    # positivos: um treino pequeno usa subamostras pequenas
+    return min(_verificar(linhas, memoria_mb, 'as subamostras do treino'), 2 * n_positivos)
+
+
+class MatrizFeatures:
+    """
+    Matriz de features (float32, linhas na ordem do prospects.json) em
+    disco, com rótulos, ids e o Historico do arquivo.
+    """
+
+    def __init__(self, pasta):
+        self.pasta = pasta
+        with open(os.path.join(pasta, 'meta.json')) as f:
+            meta = json.load(f)
+        self.features = meta['features']
+        self.n_linhas = meta['linhas']
+        self._historico = None
+
+    def __len__(self):
+        return self.n_linhas
+
+    def _coluna(self, nome):
+        return np.load(os.path.join(self.pasta, f"{nome}.npy"))
+
+    @property
+    def y(self):
+        return self._coluna('is_hired')
+
+    @property
+    def job_ids(self):
+        return self._coluna('job_id')
+
+    @property
+    def applicant_ids(self):
+        return self._coluna('applicant_id')
+
+    @property
+    def historico(self):
+        if self._historico is None:
+            self._historico = Historico.carregar(os.path.join(self.pasta, 'historico.npz'))
+        return self._historico
+
+    def linhas(self, indices):
+        """Cópia das linhas `indices` (em ordem crescente, para ler o disco em sequência)."""
+        X = np.load(os.path.join(self.pasta, 'X.npy'), mmap_mode='r')
+        # O mapeamento é desfeito na volta: as páginas lidas saem do RSS
+        return np.array(X[indices])
+
+    def partes(self, tamanho):
+        """(início, cópia de `tamanho` linhas) em ordem, até o fim da matriz."""
+        for inicio in range(0, self.n_linhas, tamanho):
+            yield inicio, self.linhas(slice(inicio, inicio + tamanho))
+
+    @classmethod
+    def construir(cls, caminho_prospects, pasta, candidatos, indice_textos=None,
+                  linhas_lote=MAXIMO_LINHAS_LOTE):
+        """
+        Calcula as features de todas as candidaturas de `caminho_prospects`
+        em lotes de `linhas_lote` e grava a matriz em `pasta` (troca atômica).
+        """
+        features = nomes_features(candidatos, indice_textos)
+        pai = os.path.dirname(os.path.abspath(pasta))
+        with tempfile.TemporaryDirectory(dir=pai) as pasta_lotes:
+            caminhos, totais = separar_lotes(caminho_prospects, pasta_lotes, linhas_lote)
+            saida = SaidaColunar(pasta, totais.n_linhas, X=(np.float32, len(features)),
+                                 is_hired=np.int8, job_id=np.int64, applicant_id=np.int64)
+            for lote, X in calcular_lotes(caminhos, features, candidatos, totais,
+                                          indice_textos=indice_textos):
+                saida.escrever(X=X, is_hired=lote['is_hired'], job_id=lote['job_id'],
+                               applicant_id=lote['applicant_id'])
+        totais.salvar(os.path.join(saida.tmp, 'historico.npz'))
+        saida.fechar(features=features)
+        return cls(pasta)
+
+
+def _subamostra(positivos, negativos, n_linhas, semente):
+    """Índices (ordenados) de metade positivos e metade negativos, com reposição."""
+    rng = np.random.default_rng(semente)
+    metade = n_linhas // 2
+    return np.sort(np.concatenate([rng.choice(positivos, metade), rng.choice(negativos, metade)]))
+
+
+def _ajustar_subamostra(modelo, matriz, y, positivos, negativos, n_linhas, n_arvores, semente):
+    indices = _subamostra(positivos, negativos, n_linhas, semente)
+    return ajustar_bloco(modelo, matriz.linhas(indices), y[indices], n_arvores, semente)
+
+
+def treinar_em_blocos(modelo, matriz, treino, n_linhas, n_jobs=-1):
+    """
+    Floresta com os parâmetros de `modelo` (um RandomForestClassifier),
+    ajustada bloco a bloco sobre subamostras balanceadas de `n_linhas`
+    das linhas `treino` da matriz. Retorna (floresta, tempos de cada bloco).
+    """
+    y = matriz.y
+    treino = np.asarray(treino)
+    positivos = treino[y[treino] == 1]
+    negativos = treino[y[treino] == 0]
+
+    n_arvores = modelo.get_params()['n_estimators']
+    tamanhos = [min(ARVORES_POR_TAREFA, n_arvores - i) for i in range(0, n_arvores, ARVORES_POR_TAREFA)]
+    sementes = np.random.default_rng(modelo.get_params()['random_state']).integers(
+        np.iinfo(np.int32).max, size=len(tamanhos)
+    )
+    saidas = Parallel(n_jobs=n_jobs, prefer='threads')(
+        delayed(_ajustar_subamostra)(modelo, matriz, y, positivos, negativos, n_linhas, tamanho,
+                                     int(semente))
+        for tamanho, semente in zip(tamanhos, sementes)
+    )
+    blocos = [bloco for bloco, _, _ in saidas]
+    return juntar(modelo, blocos, todas_arvores(blocos), n_jobs), [fim - inicio for _, inicio, fim in saidas]
+
+
+def pontuar_matriz(floresta, matriz, linhas_lote=MAXIMO_LINHAS_LOTE):
+    """predict_proba de `floresta` (floresta.Floresta) para todas as linhas da matriz."""
+    proba = np.empty((len(matriz), len(floresta.classes_)))
+    for inicio, X in matriz.partes(linhas_lote):
+        proba[inicio:inicio + len(X)] = floresta.predict_proba(X)
+    return proba
@@ -0,0 +1,312 @@
+"""
+DECISION AI - Gerador de dados sintéticos
+POSTECH Datathon 2026
+
+Uso: python gerar_dados.py [--saida data_sintetico] [--escala 1] [--semente 42]
+                           [--fracao-cv 0.01]
+
+Gera vagas.json, prospects.json e applicants.json no esquema dos arquivos
+reais (os de data/ são ponteiros do Git LFS), com as distribuições do EDA
+(reports/FASE1_EDA_FINAL.md) e `escala` vezes o volume real:
+
+  - 14.081 vagas, 53.759 candidaturas e 42.482 candidatos por unidade de
+    escala
+  - contratação em 5,13% das candidaturas (1:18,5)
+  - 1,27 candidatura por candidato, ~82% com uma só, cauda até ~18
+  - 3,8 candidatos por vaga, mediana 2, cauda longa até 127
+  - 1% dos CVs preenchidos, ~4.000 caracteres (log-normal, até 50.000)
+  - datas em 2023 (45%) e 2024 (55%), quase só em dias úteis
+
+A contratação não é ruído: depende de uma qualidade latente do candidato
+(maior nos que se candidatam mais), de a área do CV bater com a da vaga e
+de o CV estar preenchido, com o intercepto ajustado para a taxa exata.
+O mesmo (escala, semente, fracao_cv) gera sempre os mesmos bytes.
+
+Os arquivos são escritos registro a registro, com a mesma indentação de
+4 espaços do json.dump(..., indent=4), e trocados de forma atômica.
+"""
+
+import argparse
+import json
+import os
+from datetime import date, timedelta
+
+import numpy as np
+
+# Volumes reais (escala 1)
+VAGAS = 14_081
+CANDIDATURAS = 53_759
+CANDIDATOS = 42_482
+
+TAXA_CONTRATACAO = 0.0513
+FRACAO_CV = 0.01
+CV_TAMANHO_MEDIO = 4_000
+CV_TAMANHO_MAXIMO = 50_000
+
+# Tamanho das vagas: log-normal (mediana 2, média 3,8 depois de escalar),
+# com o máximo do EDA, que não cresce com a escala
+_VAGA_MU, _VAGA_SIGMA = 0.55, 1.0
+VAGA_MAXIMO = 127
+# Candidaturas além da primeira, por peso exp(a * qualidade + b * ruído)
+_PESO_QUALIDADE, _PESO_RUIDO = 0.7, 0.8
+
+AREAS = {
+    'dados': ['python', 'sql', 'etl', 'power', 'bi', 'spark', 'databricks', 'estatistica',
+              'modelagem', 'dados', 'analytics', 'pandas', 'machine', 'learning'],
+    'sap': ['sap', 'abap', 'fiori', 'hana', 'mm', 'sd', 'fi', 'co', 's/4hana', 'modulo',
+            'consultor', 'funcional', 'implantacao'],
+    'java': ['java', 'spring', 'microservicos', 'kafka', 'maven', 'hibernate', 'api', 'rest',
+             'backend', 'junit', 'sql'],
+    'web': ['javascript', 'react', 'node.js', 'html', 'css', 'typescript', 'angular',
+            'frontend', 'ux', 'api'],
+    'infra': ['linux', 'aws', 'azure', 'docker', 'kubernetes', 'redes', 'servidores', 'cloud',
+              'devops', 'terraform', 'monitoramento'],
+    'gestao': ['projetos', 'scrum', 'agil', 'pmo', 'gestao', 'stakeholders', 'cronograma',
+               'orcamento', 'lideranca', 'indicadores'],
+}
+COMUNS = ['experiencia', 'anos', 'empresa', 'responsavel', 'desenvolvimento', 'analista',
+          'sistemas', 'cliente', 'equipe', 'atuacao', 'suporte', 'conhecimento', 'ingles',
+          'avancado', 'projeto', 'atividades', 'documentacao', 'requisitos', 'testes',
+          'melhoria', 'processos', 'negocio', 'ferramentas', 'de', 'em', 'com', 'para']
+NIVEIS = ['Júnior', 'Pleno', 'Sênior', 'Especialista']
+SITUACOES_CONTRATADO = ['Contratado pela Decision', 'Contratado como Hunting']
+# Nenhuma contém "contratado": ingestao.py rotula pela substring
+SITUACOES = ['Prospect', 'Encaminhado ao Requisitante', 'Não Aprovado pelo Cliente',
+             'Não Aprovado pelo RH', 'Não Aprovado pelo Requisitante', 'Desistiu', 'Inscrito',
+             'Em avaliação pelo RH', 'Entrevista Técnica', 'Entrevista com Cliente',
+             'Recusado', 'Documentação PJ']
+COMENTARIOS = ['Candidato com perfil aderente', 'Aguardando retorno do cliente',
+               'Encaminhado para entrevista', 'Sem retorno do candidato', 'Pretensão acima',
+               'Perfil sênior para a vaga']
+RECRUTADORES = [f"Recrutador {i:02d}" for i in range(1, 41)]
+
+_INICIO_DATAS = date(2023, 1, 1)
+
+
+def _ajustar_intercepto(logits, taxa):
+    """b tal que a média de sigmoide(b + logits) seja `taxa` (bisseção)."""
+    baixo, alto = -30.0, 30.0
+    for _ in range(60):
+        meio = (baixo + alto) / 2
+        if np.mean(1 / (1 + np.exp(-(meio + logits)))) < taxa:
+            baixo = meio
+        else:
+            alto = meio
+    return (baixo + alto) / 2
+
+
+def _datas(rng, n):
+    """Dias desde 01-01-2023: 45% em 2023, 55% em 2024, 98,9% em dias úteis."""
+    ano = (rng.random(n) >= 0.45).astype(np.int64)
+    dias = np.where(ano == 0, rng.integers(0, 365, n), 365 + rng.integers(0, 366, n))
+    # 01-01-2023 foi domingo: dia % 7 em {0, 6} é fim de semana
+    fim_de_semana = np.isin(dias % 7, [0, 6]) & (rng.random(n) >= 0.011)
+    dias[fim_de_semana] += np.where(dias[fim_de_semana] % 7 == 0, 1, -1)
+    return dias
+
+
+def _formatar_data(dias):
+    return (_INICIO_DATAS + timedelta(days=int(dias))).strftime('%d-%m-%Y')
+
+
+def _texto(rng, area, n_palavras, fracao_area=0.5):
+    palavras_area = AREAS[area]
+    da_area = rng.random(n_palavras) < fracao_area
+    indices_area = rng.integers(0, len(palavras_area), n_palavras)
+    indices_comuns = rng.integers(0, len(COMUNS), n_palavras)
+    return ' '.join(palavras_area[i] if a else COMUNS[j]
+                    for a, i, j in zip(da_area, indices_area, indices_comuns))
+
+
+class _EscritorObjeto:
+    """Objeto JSON de topo escrito chave a chave, como json.dump(indent=4)."""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._f = open(caminho + '.tmp', 'w', encoding='utf-8')
+        self._f.write('{')
+        self._vazio = True
+        self.bytes = 0
+
+    def escrever(self, chave, valor):
+        texto = json.dumps(valor, ensure_ascii=False, indent=4).replace('\n', '\n    ')
+        self._f.write(f"{'' if self._vazio else ','}\n    {json.dumps(chave)}: {texto}")
+        self._vazio = False
+
+    def fechar(self):
+        self._f.write('\n}' if not self._vazio else '}')
+        self.bytes = self._f.tell()
+        self._f.close()
+        os.replace(self.caminho + '.tmp', self.caminho)
+
+
+def gerar(pasta, escala=1.0, semente=42, fracao_cv=FRACAO_CV):
+    """Escreve vagas.json, prospects.json e applicants.json em `pasta`; retorna estatísticas."""
+    os.makedirs(pasta, exist_ok=True)
+    rng = np.random.default_rng(semente)
+    nomes_areas = list(AREAS)
+    n_vagas = max(1, round(VAGAS * escala))
+    n_candidatos = max(1, round(CANDIDATOS * escala))
+    alvo_candidaturas = max(1, round(CANDIDATURAS * escala))
+
+    # Candidatos: área, qualidade latente e CV
+    area_candidato = rng.integers(0, len(nomes_areas), n_candidatos)
+    qualidade = rng.normal(size=n_candidatos)
+    com_cv = rng.random(n_candidatos) < fracao_cv
+    # Log-normal com média CV_TAMANHO_MEDIO (sigma 0,8)
+    tamanho_cv = np.minimum(
+        np.exp(rng.normal(np.log(CV_TAMANHO_MEDIO) - 0.32, 0.8, n_candidatos)), CV_TAMANHO_MAXIMO
+    ).astype(np.int64)
+
+    # Vagas: área e número de candidaturas, somando ~alvo_candidaturas
+    area_vaga = rng.integers(0, len(nomes_areas), n_vagas)
+    tamanhos = np.exp(rng.normal(_VAGA_MU, _VAGA_SIGMA, n_vagas))
+    tamanhos = np.floor(tamanhos * alvo_candidaturas / tamanhos.sum() + rng.random(n_vagas))
+    tamanhos = np.minimum(tamanhos, VAGA_MAXIMO).astype(np.int64)
+    n_candidaturas = int(tamanhos.sum())
+
+    # Candidaturas: todo candidato uma vez (se houver vagas para isso) e as
+    # demais sorteadas com peso pela qualidade
+    extras = max(0, n_candidaturas - n_candidatos)
+    pesos = np.exp(_PESO_QUALIDADE * qualidade + _PESO_RUIDO * rng.normal(size=n_candidatos))
+    candidato = np.concatenate([
+        rng.permutation(n_candidatos)[:n_candidaturas],
+        rng.choice(n_candidatos, extras, p=pesos / pesos.sum()),
+    ])
+    rng.shuffle(candidato)
+    vaga = np.repeat(np.arange(n_vagas), tamanhos)
+    dias = _datas(rng, n_candidaturas)
+    # Dentro de cada vaga, candidaturas em ordem de data
+    ordem = np.lexsort((dias, vaga))
+    candidato, dias = candidato[ordem], dias[ordem]
+
+    # Contratação: qualidade + área igual + CV preenchido
+    logits = (1.2 * qualidade[candidato]
+              + 1.0 * (area_candidato[candidato] == area_vaga[vaga])
+              + 0.7 * com_cv[candidato])
+    intercepto = _ajustar_intercepto(logits, TAXA_CONTRATACAO)
+    contratado = rng.random(n_candidaturas) < 1 / (1 + np.exp(-(intercepto + logits)))
+
+    # vagas.json e prospects.json, vaga a vaga
+    vagas = _EscritorObjeto(os.path.join(pasta, 'vagas.json'))
+    prospects = _EscritorObjeto(os.path.join(pasta, 'prospects.json'))
+    limites = np.concatenate([[0], np.cumsum(tamanhos)])
+    for v in range(n_vagas):
+        area = nomes_areas[area_vaga[v]]
+        titulo = f"Analista {area.title()} {NIVEIS[rng.integers(len(NIVEIS))]}"
+        recrutador = RECRUTADORES[rng.integers(len(RECRUTADORES))]
+        vagas.escrever(str(v + 1), {
+            'informacoes_basicas': {
+                'data_requicisao': _formatar_data(rng.integers(0, 731)),
+                'titulo_vaga': titulo,
+                'vaga_sap': 'Sim' if area == 'sap' else 'Não',
+                'cliente': f"Cliente {rng.integers(1, 300):03d}",
+                'tipo_contratacao': 'CLT Full',
+                'analista_responsavel': recrutador,
+            },
+            'perfil_vaga': {
+                'pais': 'Brasil',
+                'estado': 'São Paulo',
+                'cidade': 'São Paulo',
+                'nivel profissional': titulo.rsplit(' ', 1)[1],
+                'areas_atuacao': area,
+                'principais_atividades': _texto(rng, area, int(rng.integers(30, 80))),
+                'competencia_tecnicas_e_comportamentais': _texto(rng, area, int(rng.integers(15, 40))),
+            },
+            'beneficios': {'valor_venda': '-'},
+        })
+
+        linhas = range(limites[v], limites[v + 1])
+        prospects.escrever(str(v + 1), {
+            'titulo': titulo,
+            'modalidade': '',
+            'prospects': [{
+                'nome': f"Candidato {candidato[i] + 1}",
+                'codigo': str(candidato[i] + 1),
+                'situacao_candidado': (SITUACOES_CONTRATADO[rng.integers(2)] if contratado[i]
+                                       else SITUACOES[rng.integers(len(SITUACOES))]),
+                'data_candidatura': _formatar_data(dias[i]),
+                'ultima_atualizacao': _formatar_data(dias[i] + rng.integers(0, 60)),
+                'comentario': COMENTARIOS[rng.integers(len(COMENTARIOS))] if rng.random() < 0.3 else '',
+                'recrutador': recrutador,
+            } for i in linhas],
+        })
+    vagas.fechar()
+    prospects.fechar()
+
+    # applicants.json
+    candidatos = _EscritorObjeto(os.path.join(pasta, 'applicants.json'))
+    for a in range(n_candidatos):
+        area = nomes_areas[area_candidato[a]]
+        cv = ''
+        if com_cv[a]:
+            # ~9 caracteres por palavra com o espaço
+            cv = _texto(rng, area, max(1, int(tamanho_cv[a]) // 9), fracao_area=0.3)
+        candidatos.escrever(str(a + 1), {
+            'infos_basicas': {
+                'codigo_profissional': str(a + 1),
+                'nome': f"Candidato {a + 1}",
+                'email': f"candidato{a + 1}@email.com",
+                'telefone': f"(11) 9{rng.integers(1000, 9999)}-{rng.integers(1000, 9999)}",
+                'local': 'São Paulo, São Paulo',
+                'inserido_por': RECRUTADORES[rng.integers(len(RECRUTADORES))],
+            },
+            'informacoes_profissionais': {
+                'titulo_profissional': f"Analista {area.title()}",
+                'area_atuacao': area,
+                'nivel_profissional': NIVEIS[rng.integers(len(NIVEIS))],
+            },
+            'formacao_e_idiomas': {
+                'nivel_academico': 'Ensino Superior Completo',
+                'nivel_ingles': ['Nenhum', 'Básico', 'Intermediário', 'Avançado'][rng.integers(4)],
+            },
+            'cv_pt': cv,
+            'cv_en': '',
+        })
+    candidatos.fechar()
+
+    aplicacoes = np.bincount(candidato, minlength=n_candidatos)
+    aplicaram = aplicacoes[aplicacoes > 0]
+    return {
+        'escala': escala,
+        'semente': semente,
+        'vagas': n_vagas,
+        'candidaturas': n_candidaturas,
+        'candidatos': n_candidatos,
+        'contratacoes': int(contratado.sum()),
+        'razao_contratacao': float((~contratado).sum() / max(1, contratado.sum())),
+        'candidaturas_por_candidato': float(aplicaram.mean()),
+        'candidatos_uma_candidatura': float(np.mean(aplicaram == 1)),
+        'max_candidaturas_candidato': int(aplicaram.max()),
+        'candidatos_por_vaga_mediana': float(np.median(tamanhos)),
+        'candidatos_por_vaga_max': int(tamanhos.max()),
+        'cvs_preenchidos': int(com_cv.sum()),
+        'bytes': {'vagas': vagas.bytes, 'prospects': prospects.bytes,
+                  'applicants': candidatos.bytes},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dados sintéticos do Decision AI")
+    parser.add_argument('--saida', default='data_sintetico')
+    parser.add_argument('--escala', type=float, default=1.0,
+                        help="multiplicador do volume real (53.759 candidaturas)")
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--fracao-cv', type=float, default=FRACAO_CV,
+                        help="fração dos candidatos com cv_pt preenchido")
+    args = parser.parse_args()
+
+    r = gerar(args.saida, args.escala, args.semente, args.fracao_cv)
+    print(f"{r['vagas']:,} vagas, {r['candidaturas']:,} candidaturas, {r['candidatos']:,} candidatos "
+          f"-> {args.saida}/")
+    print(f"  Contratações: {r['contratacoes']:,} (1:{r['razao_contratacao']:.1f})")
+    print(f"  Candidaturas por candidato: {r['candidaturas_por_candidato']:.2f} "
+          f"({r['candidatos_uma_candidatura']:.0%} com uma, máx. {r['max_candidaturas_candidato']})")
+    print(f"  Candidatos por vaga: mediana {r['candidatos_por_vaga_mediana']:.0f}, "
+          f"máx. {r['candidatos_por_vaga_max']}")
+    print(f"  CVs preenchidos: {r['cvs_preenchidos']:,}")
+    print("  " + ", ".join(f"{nome}.json {b / 2 ** 20:.1f}MB" for nome, b in r['bytes'].items()))
+
+
+if __name__ == '__main__':
+    main()
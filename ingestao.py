@@ -0,0 +1,249 @@
+"""
+DECISION AI - Ingestão incremental dos JSONs
+POSTECH Datathon 2026
+
+Lê vagas/prospects/applicants registro a registro, sem montar a árvore
+completa de dicts em memória. Cada registro do objeto de topo é
+decodificado, convertido para as colunas de saída e descartado.
+"""
+
+import json
+from array import array
+from itertools import compress
+
+import numpy as np
+import pandas as pd
+
+_DECODER = json.JSONDecoder()
+_ESPACOS = ' \t\n\r'
+TAMANHO_BLOCO = 1 << 20
+
+
+def iterar_objeto(caminho, tamanho_bloco=TAMANHO_BLOCO):
+    """Itera os pares (chave, valor) do objeto JSON de topo de `caminho`."""
+    with open(caminho, encoding='utf-8') as f:
+        buf = f.read(tamanho_bloco)
+        pos = 0
+        fim = not buf
+
+        def ler_mais(pos):
+            nonlocal buf, fim
+            # Descarta o que já foi consumido e cresce o buffer em blocos
+            # (ao menos do tamanho pendente, para valores muito grandes)
+            pendente = buf[pos:]
+            bloco = f.read(max(tamanho_bloco, len(pendente)))
+            fim = not bloco
+            buf = pendente + bloco
+            return 0
+
+        def pular_espacos(pos):
+            while True:
+                while pos < len(buf) and buf[pos] in _ESPACOS:
+                    pos += 1
+                if pos < len(buf) or fim:
+                    return pos
+                pos = ler_mais(pos)
+
+        def decodificar(pos):
+            while True:
+                try:
+                    valor, fim_valor = _DECODER.raw_decode(buf, pos)
+                    # Um número no fim do buffer pode estar truncado
+                    if fim_valor < len(buf) or fim:
+                        return valor, fim_valor
+                except json.JSONDecodeError:
+                    if fim:
+                        raise
+                pos = ler_mais(pos)
+
+        pos = pular_espacos(pos)
+        if pos >= len(buf) or buf[pos] != '{':
+            raise ValueError(f"{caminho}: objeto JSON de topo esperado")
+        pos += 1
+
+        while True:
+            pos = pular_espacos(pos)
+            if pos >= len(buf):
+                raise ValueError(f"{caminho}: JSON truncado")
+            if buf[pos] == '}':
+                return
+            if buf[pos] == ',':
+                pos = pular_espacos(pos + 1)
+
+            chave, pos = decodificar(pos)
+            pos = pular_espacos(pos)
+            if pos >= len(buf) or buf[pos] != ':':
+                raise ValueError(f"{caminho}: ':' esperado após {chave!r}")
+            pos = pular_espacos(pos + 1)
+            valor, pos = decodificar(pos)
+            yield chave, valor
+
+            if pos > tamanho_bloco:
+                buf = buf[pos:]
+                pos = 0
+
+
+def contar_registros(caminho):
+    """Número de registros do objeto de topo."""
+    return sum(1 for _ in iterar_objeto(caminho))
+
+
+# data_candidatura vazia ou inválida (o mesmo valor de NaT em int64): fica
+# antes de qualquer data nas ordenações por tempo
+DATA_AUSENTE = np.iinfo(np.int64).min
+FORMATO_DATA = '%d-%m-%Y'
+
+# Candidaturas acumuladas em colunas brutas antes de cada rotulagem em bloco;
+# limita a memória presa em campos que não vão para a tabela (comentários)
+TAMANHO_LOTE = 1 << 16
+
+
+def _codigo_para_id(codigo):
+    """Código do candidato como inteiro; 0 quando vazio ou inválido."""
+    try:
+        return int(codigo) if codigo and codigo != '' else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def datas_para_epoch(datas):
+    """Datas 'dd-mm-aaaa' como segundos desde 1970 (int64); DATA_AUSENTE se inválidas."""
+    convertidas = pd.to_datetime(pd.Series(datas, dtype=object), format=FORMATO_DATA, errors='coerce')
+    return convertidas.to_numpy(dtype='datetime64[s]').view(np.int64)
+
+
+def _novo_lote():
+    """Buffers (job_id, codigo, comentario, situacao, data, recrutador)."""
+    return array('q'), [], [], [], [], []
+
+
+def _rotular_lote(job_ids, codigos, comentarios, situacoes, datas, recrutadores):
+    """Converte as colunas brutas de um lote em linhas da tabela de prospects."""
+    n = len(job_ids)
+    applicant_id = np.fromiter(map(_codigo_para_id, codigos), dtype=np.int64, count=n)
+
+    # Contratado se comentário ou situação contêm "contratado"
+    is_hired = np.array(
+        ['contratado' in str(c).lower() or 'contratado' in str(s).lower()
+         for c, s in zip(comentarios, situacoes)],
+        dtype=np.int64
+    )
+
+    manter = applicant_id > 0
+    return pd.DataFrame({
+        'job_id': np.frombuffer(job_ids, dtype=np.int64)[manter],
+        'applicant_id': applicant_id[manter],
+        'is_hired': is_hired[manter],
+        'data_candidatura': datas_para_epoch(list(compress(datas, manter))),
+        'recrutador': list(compress(recrutadores, manter)),
+    })
+
+
+def iterar_lotes_prospects(registros, tamanho_lote=TAMANHO_LOTE):
+    """
+    Desdobra pares (job_id, job_data) de prospects.json em tabelas de cerca
+    de `tamanho_lote` candidaturas cada (a última pode vir menor ou vazia).
+
+    Cada candidatura só copia seus campos para colunas brutas; código do
+    candidato, rótulo is_hired e filtro de códigos inválidos são aplicados
+    por lote, sem montar um dict por linha. As tabelas têm as colunas
+    job_id, applicant_id, is_hired, data_candidatura (epoch em segundos,
+    ver datas_para_epoch) e recrutador.
+    """
+    lote = _novo_lote()
+    job_ids, codigos, comentarios, situacoes, datas, recrutadores = lote
+
+    for job_id, job_data in registros:
+        job_id_int = int(job_id)
+
+        for prospect in job_data.get('prospects', []):
+            if not isinstance(prospect, dict):
+                continue
+            get = prospect.get
+            job_ids.append(job_id_int)
+            codigos.append(get('codigo', '0'))
+            comentarios.append(get('comentario', ''))
+            situacoes.append(get('situacao_candidado', ''))
+            datas.append(get('data_candidatura', ''))
+            recrutadores.append(get('recrutador', ''))
+
+        if len(job_ids) >= tamanho_lote:
+            yield _rotular_lote(*lote)
+            lote = _novo_lote()
+            job_ids, codigos, comentarios, situacoes, datas, recrutadores = lote
+
+    yield _rotular_lote(*lote)
+
+
+def desdobrar_prospects(registros, tamanho_lote=TAMANHO_LOTE):
+    """
+    Desdobra pares (job_id, job_data) de prospects.json em uma tabela
+    (lote a lote, ver iterar_lotes_prospects).
+
+    Retorna (df, n_jobs), com df nas colunas job_id, applicant_id, is_hired,
+    data_candidatura e recrutador.
+    """
+    n_jobs = 0
+
+    def contar(registros):
+        nonlocal n_jobs
+        for registro in registros:
+            n_jobs += 1
+            yield registro
+
+    partes = list(iterar_lotes_prospects(contar(registros), tamanho_lote))
+    # Um lote vazio (o último, quando o anterior fechou no fim dos registros)
+    # não entra no concat: sem linhas, recrutador não tem o dtype de texto
+    partes = [parte for parte in partes if len(parte)] or partes[:1]
+    df = pd.concat(partes, ignore_index=True) if len(partes) > 1 else partes[0]
+    return df, n_jobs
+
+
+def ler_prospects(caminho):
+    """Lê e desdobra prospects.json (job -> lista de candidatos) direto em colunas."""
+    return desdobrar_prospects(iterar_objeto(caminho))
+
+
+# Campos de vagas.json que descrevem a vaga: (seção, campo)
+CAMPOS_VAGA = [
+    ('informacoes_basicas', 'titulo_vaga'),
+    ('perfil_vaga', 'principais_atividades'),
+    ('perfil_vaga', 'competencia_tecnicas_e_comportamentais'),
+]
+
+
+def ler_textos_vagas(caminho):
+    """
+    Título, atividades e competências de cada vaga de vagas.json, juntos em
+    um texto. Retorna um dict indexado pelo job_id inteiro.
+    """
+    textos = {}
+    for k, v in iterar_objeto(caminho):
+        try:
+            job_id = int(k)
+        except ValueError:
+            continue
+        partes = []
+        for secao, campo in CAMPOS_VAGA:
+            valor = (v.get(secao) or {}).get(campo) if isinstance(v, dict) else None
+            if valor:
+                partes.append(str(valor))
+        textos[job_id] = ' '.join(partes)
+    return textos
+
+
+def ler_cvs(caminho):
+    """
+    Extrai só o cv_pt de cada candidato de applicants.json.
+
+    Retorna (cv_dict, n_applicants), com cv_dict indexado pelo id inteiro.
+    """
+    cv_dict = {}
+    n_applicants = 0
+    for k, v in iterar_objeto(caminho):
+        n_applicants += 1
+        try:
+            cv_dict[int(k)] = str(v.get('cv_pt', ''))
+        except:
+            continue
+    return cv_dict, n_applicants
@@ -0,0 +1,195 @@
+"""
+DECISION AI - Medição das etapas do treino
+POSTECH Datathon 2026
+
+Cada etapa de um Relatorio registra tempo de relógio, tempo de CPU (do
+processo e dos processos filhos), RSS no começo e no fim, pico de RSS e
+linhas de entrada e de saída. No fim do treino o relatório vai para
+models/execucao.json e ganha uma linha em models/execucoes.jsonl, o
+histórico de execuções que o dashboard plota.
+
+Pico de RSS por etapa: no Linux o pico do processo (VmHWM) é zerado no
+começo de cada etapa escrevendo em /proc/self/clear_refs. Onde isso não é
+possível, o valor é o pico do processo até o fim da etapa, e a etapa sai
+com pico_rss_por_etapa=False.
+
+Ganchos opcionais:
+  perfil       cProfile das etapas escolhidas em <pasta_perfis>/<etapa>.prof
+               (pstats, snakeviz)
+  tracemalloc  pico de memória alocada pelo Python em cada etapa (deixa
+               as alocações bem mais lentas)
+Para amostragem externa (py-spy record --pid), o relatório traz o pid e o
+início e o fim de cada etapa em tempo Unix, para recortar o perfil.
+"""
+
+import cProfile
+import json
+import os
+import platform
+import resource
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+TODAS = 'todas'
+
+
+def rss_mb():
+    """RSS atual do processo em MB (None sem /proc)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except OSError:
+        return None
+
+
+def _zerar_pico_rss():
+    """Zera o VmHWM do processo; False se o sistema não permite."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _pico_rss_mb():
+    try:
+        with open('/proc/self/status') as f:
+            for linha in f:
+                if linha.startswith('VmHWM:'):
+                    return int(linha.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _cpu_s():
+    """(CPU do processo, CPU dos filhos já terminados), usuário + sistema."""
+    proprio = resource.getrusage(resource.RUSAGE_SELF)
+    filhos = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return proprio.ru_utime + proprio.ru_stime, filhos.ru_utime + filhos.ru_stime
+
+
+class Etapa:
+    """O que o código da etapa informa: linhas e dados extras."""
+
+    def __init__(self, nome, linhas_entrada=None):
+        self.nome = nome
+        self.linhas_entrada = linhas_entrada
+        self.linhas_saida = None
+        self.extras = {}
+
+    def registrar(self, **extras):
+        self.extras.update(extras)
+
+
+class Relatorio:
+    """Medidas por etapa de uma execução do treino."""
+
+    def __init__(self, parametros=None, perfil=(), pasta_perfis=None, usar_tracemalloc=False):
+        self.parametros = parametros or {}
+        self.perfil = set(perfil)
+        self.pasta_perfis = pasta_perfis
+        self.usar_tracemalloc = usar_tracemalloc
+        self.etapas = []
+        self.inicio = time.time()
+        self._relogio = time.perf_counter()
+
+    def _perfilar(self, nome):
+        return self.pasta_perfis is not None and (nome in self.perfil or TODAS in self.perfil)
+
+    @contextmanager
+    def etapa(self, nome, linhas_entrada=None):
+        """Mede o bloco `with`; o bloco pode preencher linhas_saida e registrar extras."""
+        etapa = Etapa(nome, linhas_entrada)
+        pico_por_etapa = _zerar_pico_rss()
+        if self.usar_tracemalloc:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+        perfilador = cProfile.Profile() if self._perfilar(nome) else None
+
+        rss_inicio = rss_mb()
+        cpu_inicio, cpu_filhos_inicio = _cpu_s()
+        inicio_unix = time.time()
+        inicio = time.perf_counter()
+        if perfilador is not None:
+            perfilador.enable()
+
+        yield etapa
+
+        if perfilador is not None:
+            perfilador.disable()
+        tempo = time.perf_counter() - inicio
+        cpu, cpu_filhos = _cpu_s()
+        medidas = {
+            'nome': nome,
+            'inicio_unix': inicio_unix,
+            'fim_unix': inicio_unix + tempo,
+            'tempo_s': tempo,
+            'cpu_s': cpu - cpu_inicio,
+            'cpu_filhos_s': cpu_filhos - cpu_filhos_inicio,
+            'rss_inicio_mb': rss_inicio,
+            'rss_fim_mb': rss_mb(),
+            'pico_rss_mb': _pico_rss_mb(),
+            'pico_rss_por_etapa': pico_por_etapa,
+            'linhas_entrada': etapa.linhas_entrada,
+            'linhas_saida': etapa.linhas_saida,
+        }
+        if self.usar_tracemalloc:
+            medidas['pico_python_mb'] = tracemalloc.get_traced_memory()[1] / 2**20
+        if perfilador is not None:
+            os.makedirs(self.pasta_perfis, exist_ok=True)
+            medidas['perfil'] = os.path.join(self.pasta_perfis, f"{nome}.prof")
+            perfilador.dump_stats(medidas['perfil'])
+        self.etapas.append({**medidas, **etapa.extras})
+
+    def como_dict(self):
+        return {
+            'inicio': datetime.fromtimestamp(self.inicio).isoformat(timespec='seconds'),
+            'pid': os.getpid(),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'cpus': os.cpu_count(),
+            'parametros': self.parametros,
+            'tempo_total_s': time.perf_counter() - self._relogio,
+            # O pico do processo é zerado a cada etapa (e ru_maxrss junto):
+            # o da execução é o maior entre as etapas e o atual
+            'pico_rss_processo_mb': max([e['pico_rss_mb'] for e in self.etapas] + [_pico_rss_mb()]),
+            'etapas': self.etapas,
+        }
+
+    def salvar(self, pasta='models'):
+        """execucao.json (troca atômica) e mais uma linha em execucoes.jsonl."""
+        relatorio = self.como_dict()
+        caminho = os.path.join(pasta, 'execucao.json')
+        with open(caminho + '.tmp', 'w') as f:
+            json.dump(relatorio, f, indent=1)
+        os.replace(caminho + '.tmp', caminho)
+        with open(os.path.join(pasta, 'execucoes.jsonl'), 'a') as f:
+            f.write(json.dumps(relatorio) + '\n')
+        return relatorio
+
+    def imprimir(self):
+        print(f"\n{'etapa':<22} {'tempo':>8} {'CPU':>8} {'pico RSS':>9} {'entrada':>10} {'saída':>10}")
+        for e in self.etapas:
+            linhas = [f"{e[c]:>10,}" if e[c] is not None else f"{'-':>10}"
+                      for c in ('linhas_entrada', 'linhas_saida')]
+            print(f"{e['nome']:<22} {e['tempo_s']:>7.1f}s {e['cpu_s'] + e['cpu_filhos_s']:>7.1f}s "
+                  f"{e['pico_rss_mb']:>7.0f}MB {linhas[0]} {linhas[1]}")
+
+
+def carregar_execucoes(caminho='models/execucoes.jsonl'):
+    """Execuções do histórico, da mais antiga para a mais nova (linhas inválidas são puladas)."""
+    execucoes = []
+    with open(caminho) as f:
+        for linha in f:
+            try:
+                execucoes.append(json.loads(linha))
+            except json.JSONDecodeError:
+                # Linha cortada por um treino interrompido no meio da escrita
+                continue
+    return execucoes
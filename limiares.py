@@ -0,0 +1,65 @@
+"""
+DECISION AI - Métricas por linha de corte
+POSTECH Datathon 2026
+
+Os scores do conjunto de teste são guardados ordenados (valores distintos),
+com a contagem acumulada de positivos e negativos acima de cada um. A
+matriz de confusão de qualquer linha de corte sai de uma busca binária,
+sem percorrer o conjunto de teste de novo.
+"""
+
+import numpy as np
+
+from features import salvar_npz
+
+
+def _acumulado_acima(contagens):
+    """Soma de contagens[i:] para cada i, mais um zero no fim."""
+    return np.append(np.cumsum(contagens[::-1])[::-1], 0).astype(np.int64)
+
+
+class CurvaLimiar:
+    """Matriz de confusão e métricas para qualquer linha de corte."""
+
+    def __init__(self, scores, positivos_acima, negativos_acima):
+        # scores em ordem crescente; *_acima[i] conta os exemplos com
+        # score >= scores[i] (e têm um elemento a mais, zerado, no fim)
+        self.scores = scores
+        self.positivos_acima = positivos_acima
+        self.negativos_acima = negativos_acima
+
+    @classmethod
+    def de_scores(cls, y_true, y_proba):
+        y_true = np.asarray(y_true).astype(bool)
+        scores, grupo = np.unique(y_proba, return_inverse=True)
+        positivos = np.bincount(grupo, weights=y_true, minlength=len(scores))
+        negativos = np.bincount(grupo, weights=~y_true, minlength=len(scores))
+        return cls(scores, _acumulado_acima(positivos), _acumulado_acima(negativos))
+
+    def matriz(self, limiar):
+        """
+        [[TN, FP], [FN, TP]] recomendando quem tem score > `limiar`
+        (estrito, como o predict do modelo em 0.5).
+        """
+        i = np.searchsorted(self.scores, limiar, side='right')
+        tp, fp = int(self.positivos_acima[i]), int(self.negativos_acima[i])
+        fn = int(self.positivos_acima[0]) - tp
+        tn = int(self.negativos_acima[0]) - fp
+        return np.array([[tn, fp], [fn, tp]])
+
+    def metricas(self, limiar):
+        """precision, recall e f1 na linha de corte (0 quando indefinidas)."""
+        (_, fp), (fn, tp) = self.matriz(limiar)
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        f1 = 2 * tp / (2 * tp + fp + fn) if tp else 0.0
+        return {'precision': precision, 'recall': recall, 'f1': f1}
+
+    def salvar(self, caminho):
+        salvar_npz(caminho, scores=self.scores, positivos_acima=self.positivos_acima,
+                   negativos_acima=self.negativos_acima)
+
+    @classmethod
+    def carregar(cls, caminho):
+        with np.load(caminho) as npz:
+            return cls(npz['scores'], npz['positivos_acima'], npz['negativos_acima'])
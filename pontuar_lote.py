@@ -0,0 +1,252 @@
+"""
+DECISION AI - Pontuação em lote de todas as candidaturas de um prospects.json
+POSTECH Datathon 2026
+
+Uso: python pontuar_lote.py [data/prospects.json] [--saida scores] [--modelos models]
+                            [--contexto arquivo|historico] [--processos N]
+                            [--linhas-por-lote 65536]
+
+Lê as candidaturas em lotes, calcula as features e pontua com a floresta de
+models/floresta/ em um pool de processos; cada processo abre a floresta via
+memory-map, então as páginas do modelo são compartilhadas. A saída é uma
+pasta com um .npy por coluna (job_id, applicant_id, score) mais meta.json,
+escrita lote a lote e trocada de forma atômica no fim.
+
+  --contexto arquivo    features calculadas sobre o próprio arquivo, iguais
+                        às do treino (calcular_features) sobre ele inteiro
+  --contexto historico  cada candidatura contra models/historico.npz, como
+                        o /pontuar do serviço (backlog de candidaturas novas;
+                        também o que combina com treino --split temporal)
+
+A memória não cresce com o tamanho da entrada: a primeira passada lê o JSON
+uma vez, guarda só os ids de cada lote em disco e acumula as contagens por
+candidato e vaga; a segunda calcula as features e pontua um lote por vez,
+com no máximo 2 lotes por processo em andamento.
+"""
+
+import argparse
+import json
+import os
+import resource
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from cache_colunar import carregar_arrays, pasta_temporaria, trocar_pasta
+from features import FeaturesCandidatos, Historico, features_em_partes, features_novas
+from floresta import Floresta
+from ingestao import iterar_lotes_prospects, iterar_objeto
+from similaridade import IndiceTextos
+
+COLUNAS_LOTE = ['job_id', 'applicant_id', 'is_hired']
+LOTES_POR_PROCESSO = 2
+
+
+# ============================================================================
+# SAÍDA COLUNAR
+# ============================================================================
+class SaidaColunar:
+    """
+    Pasta com um .npy por coluna, de `n_linhas` conhecido de antemão,
+    preenchida por anexação na ordem das linhas. Uma coluna com dtype
+    (dtype, largura) é uma matriz de n_linhas x largura.
+    """
+
+    def __init__(self, pasta, n_linhas, **dtypes):
+        self.pasta = pasta
+        self.tmp = pasta_temporaria(pasta)
+        self.n_linhas = n_linhas
+        self.escritas = 0
+        self._arquivos = {}
+        for nome, dtype in dtypes.items():
+            dtype, largura = dtype if isinstance(dtype, tuple) else (dtype, None)
+            f = open(os.path.join(self.tmp, f"{nome}.npy"), 'wb')
+            np.lib.format.write_array_header_1_0(f, {
+                'descr': np.lib.format.dtype_to_descr(np.dtype(dtype)),
+                'fortran_order': False,
+                'shape': (n_linhas,) if largura is None else (n_linhas, largura),
+            })
+            self._arquivos[nome] = (f, np.dtype(dtype))
+
+    def escrever(self, **colunas):
+        for nome, (f, dtype) in self._arquivos.items():
+            f.write(np.ascontiguousarray(colunas[nome], dtype=dtype).tobytes())
+        self.escritas += len(next(iter(colunas.values())))
+
+    def fechar(self, **info):
+        for f, _ in self._arquivos.values():
+            f.close()
+        if self.escritas != self.n_linhas:
+            raise ValueError(f"{self.escritas} linhas escritas, {self.n_linhas} esperadas")
+        with open(os.path.join(self.tmp, 'meta.json'), 'w') as f:
+            json.dump({'colunas': list(self._arquivos), 'linhas': self.n_linhas, **info}, f)
+        trocar_pasta(self.tmp, self.pasta)
+
+
+def carregar_saida(pasta):
+    """DataFrame de uma saída de SaidaColunar (colunas via memory-map)."""
+    arrays, meta = carregar_arrays(pasta)
+    return pd.DataFrame({nome: arrays[nome] for nome in meta['colunas']}, copy=False)
+
+
+# ============================================================================
+# POOL (a floresta é aberta uma vez por processo)
+# ============================================================================
+_FLORESTA = {}
+
+
+def _iniciar_trabalhador(pasta_floresta):
+    _FLORESTA['modelo'] = Floresta.carregar(pasta_floresta)
+
+
+def _pontuar(X):
+    return _FLORESTA['modelo'].predict_proba(X)[:, 1]
+
+
+class _SemPool:
+    """Mesma interface do pool, no próprio processo (--processos 1)."""
+
+    class _Pronto:
+        def __init__(self, valor):
+            self._valor = valor
+
+        def result(self):
+            return self._valor
+
+    def submit(self, funcao, *args):
+        return self._Pronto(funcao(*args))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+# ============================================================================
+# PASSADAS
+# ============================================================================
+def separar_lotes(caminho, pasta_lotes, linhas_por_lote):
+    """
+    Primeira passada: grava job_id/applicant_id/is_hired de cada lote em
+    `pasta_lotes` e retorna (caminhos dos lotes, Historico do arquivo).
+    """
+    totais = Historico.vazio()
+    caminhos = []
+    for i, lote in enumerate(iterar_lotes_prospects(iterar_objeto(caminho), linhas_por_lote)):
+        if len(lote) == 0:
+            continue
+        totais.atualizar(lote)
+        caminhos.append(os.path.join(pasta_lotes, f"lote{i:06d}.npy"))
+        np.save(caminhos[-1], lote[COLUNAS_LOTE].to_numpy(dtype=np.int64), allow_pickle=False)
+    return caminhos, totais
+
+
+def calcular_lotes(caminhos, features, candidatos, totais=None, historico=None, indice_textos=None,
+                   dtype=np.float32):
+    """
+    Segunda passada: (lote, X em `dtype`) de cada lote gravado. Com
+    `totais`, features do próprio arquivo; senão, contra `historico`.
+    """
+    anteriores = Historico.vazio()
+    for caminho in caminhos:
+        lote = pd.DataFrame(np.load(caminho), columns=COLUNAS_LOTE)
+        if totais is not None:
+            X = features_em_partes(lote, totais, anteriores, candidatos, indice_textos)
+        else:
+            X = features_novas(lote, historico, candidatos, indice_textos)
+        yield lote, X[features].to_numpy(dtype=dtype)
+
+
+def pontuar_arquivo(caminho, saida, pasta_modelos='models', contexto='arquivo', processos=1,
+                    linhas_por_lote=1 << 16):
+    """Pontua todas as candidaturas de `caminho` em `saida`; retorna estatísticas."""
+    pasta_floresta = os.path.join(pasta_modelos, 'floresta')
+    floresta = Floresta.carregar(pasta_floresta)
+    features = floresta.features
+    # Floresta normalizada: a normalização é feita em float64, como no
+    # StandardScaler; passar por float32 antes mudaria os scores
+    dtype = np.float64 if floresta.normalizada else np.float32
+    candidatos = FeaturesCandidatos.carregar(os.path.join(pasta_modelos, 'candidatos.npz'))
+    caminho_textos = os.path.join(pasta_modelos, 'textos')
+    indice_textos = IndiceTextos.carregar(caminho_textos) if os.path.exists(caminho_textos) else None
+    historico = None
+    if contexto == 'historico':
+        historico = Historico.carregar(os.path.join(pasta_modelos, 'historico.npz'))
+
+    inicio = time.perf_counter()
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(saida))) as pasta_lotes:
+        caminhos, totais = separar_lotes(caminho, pasta_lotes, linhas_por_lote)
+        t_leitura = time.perf_counter() - inicio
+
+        escrita = SaidaColunar(saida, totais.n_linhas,
+                               job_id=np.int64, applicant_id=np.int64, score=np.float64)
+        if processos > 1:
+            pool = ProcessPoolExecutor(processos, initializer=_iniciar_trabalhador,
+                                       initargs=(pasta_floresta,))
+        else:
+            _iniciar_trabalhador(pasta_floresta)
+            pool = _SemPool()
+
+        # Lotes em andamento, na ordem; o mais antigo é escrito antes de
+        # mandar mais que LOTES_POR_PROCESSO por processo
+        pendentes = deque()
+        with pool:
+            lotes = calcular_lotes(caminhos, features, candidatos,
+                                   totais if contexto == 'arquivo' else None, historico,
+                                   indice_textos, dtype)
+            for lote, X in lotes:
+                pendentes.append((lote, pool.submit(_pontuar, X)))
+                if len(pendentes) >= LOTES_POR_PROCESSO * processos:
+                    lote, futuro = pendentes.popleft()
+                    escrita.escrever(job_id=lote['job_id'], applicant_id=lote['applicant_id'],
+                                     score=futuro.result())
+            while pendentes:
+                lote, futuro = pendentes.popleft()
+                escrita.escrever(job_id=lote['job_id'], applicant_id=lote['applicant_id'],
+                                 score=futuro.result())
+
+    tempo = time.perf_counter() - inicio
+    escrita.fechar(origem=os.path.abspath(caminho), contexto=contexto)
+    return {
+        'linhas': totais.n_linhas,
+        'lotes': len(caminhos),
+        'leitura_s': t_leitura,
+        'pontuacao_s': tempo - t_leitura,
+        'tempo_s': tempo,
+        'pico_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'pico_rss_processos_mb': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pontuação em lote do Decision AI")
+    parser.add_argument('prospects', nargs='?', default='data/prospects.json')
+    parser.add_argument('--saida', default='scores')
+    parser.add_argument('--modelos', default='models')
+    parser.add_argument('--contexto', choices=['arquivo', 'historico'], default='arquivo',
+                        help="arquivo: features do próprio arquivo, como no treino; "
+                             "historico: contra models/historico.npz, como o serviço")
+    parser.add_argument('--processos', type=int, default=os.cpu_count())
+    parser.add_argument('--linhas-por-lote', type=int, default=1 << 16)
+    args = parser.parse_args()
+
+    print("DECISION AI - Pontuação em lote\n")
+    r = pontuar_arquivo(args.prospects, args.saida, args.modelos, args.contexto,
+                        args.processos, args.linhas_por_lote)
+
+    print(f"  Candidaturas: {r['linhas']:,} em {r['lotes']} lotes")
+    print(f"  Leitura: {r['leitura_s']:.1f}s | Features + pontuação: {r['pontuacao_s']:.1f}s "
+          f"({args.processos} processos)")
+    print(f"  Vazão: {r['linhas'] / r['tempo_s']:,.0f} candidaturas/s")
+    print(f"  Pico de RSS: {r['pico_rss_mb']:.0f}MB (principal), "
+          f"{r['pico_rss_processos_mb']:.0f}MB (maior processo do pool)")
+    print(f"✅ Scores em {args.saida}/")
+
+
+if __name__ == '__main__':
+    main()
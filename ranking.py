@@ -0,0 +1,132 @@
+"""
+DECISION AI - Ranking dos melhores candidatos por vaga
+POSTECH Datathon 2026
+
+Todas as candidaturas são pontuadas em lotes vetorizados e, para cada vaga,
+só os K melhores candidatos ficam guardados, já ordenados. Uma consulta é
+um acesso a dict + fatia de array; candidaturas novas pontuadas depois
+atualizam apenas as vagas afetadas.
+"""
+
+import numpy as np
+
+from features import salvar_npz
+
+K_PADRAO = 50
+TAMANHO_LOTE = 1 << 16
+
+
+def pontuar_em_lotes(modelo, X, tamanho_lote=TAMANHO_LOTE):
+    """Probabilidade de contratação de cada linha de X (features cruas), lote a lote."""
+    scores = np.empty(len(X), dtype=np.float64)
+    for inicio in range(0, len(X), tamanho_lote):
+        lote = X.iloc[inicio:inicio + tamanho_lote]
+        scores[inicio:inicio + len(lote)] = modelo.predict_proba(lote)[:, 1]
+    return scores
+
+
+def _top_k_por_vaga(job_ids, applicant_ids, scores, k):
+    """
+    Mantém, por vaga, os k maiores scores (um por candidato), em ordem
+    decrescente. Retorna os três arrays agrupados por vaga.
+    """
+    # Candidato repetido na mesma vaga: fica o maior score
+    ordem = np.lexsort((-scores, applicant_ids, job_ids))
+    job_ids, applicant_ids, scores = job_ids[ordem], applicant_ids[ordem], scores[ordem]
+    primeiro = np.ones(len(job_ids), dtype=bool)
+    primeiro[1:] = (job_ids[1:] != job_ids[:-1]) | (applicant_ids[1:] != applicant_ids[:-1])
+    job_ids, applicant_ids, scores = job_ids[primeiro], applicant_ids[primeiro], scores[primeiro]
+
+    ordem = np.lexsort((-scores, job_ids))
+    job_ids, applicant_ids, scores = job_ids[ordem], applicant_ids[ordem], scores[ordem]
+
+    # Posição de cada linha dentro da sua vaga
+    inicio_grupo = np.ones(len(job_ids), dtype=bool)
+    inicio_grupo[1:] = job_ids[1:] != job_ids[:-1]
+    inicios = np.flatnonzero(inicio_grupo)
+    tamanhos = np.diff(np.append(inicios, len(job_ids)))
+    posicao = np.arange(len(job_ids)) - np.repeat(inicios, tamanhos)
+
+    manter = posicao < k
+    return job_ids[manter], applicant_ids[manter], scores[manter]
+
+
+class IndiceRanking:
+    """Top-K candidatos por vaga, consultável em O(1) + O(k)."""
+
+    def __init__(self, k=K_PADRAO):
+        self.k = k
+        # job_id -> (applicant_ids, scores), em ordem decrescente de score
+        self._vagas = {}
+
+    @classmethod
+    def construir(cls, job_ids, applicant_ids, scores, k=K_PADRAO):
+        """Índice a partir de todas as candidaturas pontuadas."""
+        indice = cls(k)
+        indice._carregar_agrupado(*_top_k_por_vaga(
+            np.asarray(job_ids, dtype=np.int64),
+            np.asarray(applicant_ids, dtype=np.int64),
+            np.asarray(scores, dtype=np.float64),
+            k,
+        ))
+        return indice
+
+    def _carregar_agrupado(self, job_ids, applicant_ids, scores):
+        inicio_grupo = np.ones(len(job_ids), dtype=bool)
+        inicio_grupo[1:] = job_ids[1:] != job_ids[:-1]
+        limites = np.append(np.flatnonzero(inicio_grupo), len(job_ids))
+        for inicio, fim in zip(limites[:-1].tolist(), limites[1:].tolist()):
+            self._vagas[int(job_ids[inicio])] = (applicant_ids[inicio:fim], scores[inicio:fim])
+
+    def __len__(self):
+        return len(self._vagas)
+
+    def top(self, job_id, k=None):
+        """Lista de (applicant_id, score) dos melhores candidatos da vaga."""
+        candidatos, scores = self._vagas.get(int(job_id), ((), ()))
+        k = self.k if k is None else min(k, self.k)
+        return list(zip(np.asarray(candidatos[:k]).tolist(), np.asarray(scores[:k]).tolist()))
+
+    def atualizar(self, job_ids, applicant_ids, scores):
+        """
+        Incorpora candidaturas pontuadas depois da construção. Só as vagas
+        presentes no lote são refeitas; um candidato já listado na vaga
+        fica com o score novo.
+        """
+        job_ids = np.asarray(job_ids, dtype=np.int64)
+        applicant_ids = np.asarray(applicant_ids, dtype=np.int64)
+        scores = np.asarray(scores, dtype=np.float64)
+
+        # Listas atuais das vagas afetadas, seguidas do lote novo
+        atuais = [(v, *self._vagas[v]) for v in np.unique(job_ids).tolist() if v in self._vagas]
+        job_ids = np.concatenate([np.full(len(ids), v) for v, ids, _ in atuais] + [job_ids])
+        applicant_ids = np.concatenate([ids for _, ids, _ in atuais] + [applicant_ids])
+        scores = np.concatenate([valores for _, _, valores in atuais] + [scores])
+
+        # Mesmo (vaga, candidato) mais de uma vez: fica a ocorrência mais recente
+        ordem = np.lexsort((-np.arange(len(job_ids)), applicant_ids, job_ids))
+        job_ids, applicant_ids, scores = job_ids[ordem], applicant_ids[ordem], scores[ordem]
+        recente = np.ones(len(job_ids), dtype=bool)
+        recente[1:] = (job_ids[1:] != job_ids[:-1]) | (applicant_ids[1:] != applicant_ids[:-1])
+
+        self._carregar_agrupado(*_top_k_por_vaga(
+            job_ids[recente], applicant_ids[recente], scores[recente], self.k
+        ))
+
+    def salvar(self, caminho):
+        vagas = sorted(self._vagas)
+        tamanhos = [len(self._vagas[v][0]) for v in vagas]
+        salvar_npz(
+            caminho,
+            k=np.int64(self.k),
+            ids_vagas=np.repeat(np.array(vagas, dtype=np.int64), tamanhos),
+            applicant_ids=np.concatenate([self._vagas[v][0] for v in vagas] or [np.empty(0, np.int64)]),
+            scores=np.concatenate([self._vagas[v][1] for v in vagas] or [np.empty(0)]),
+        )
+
+    @classmethod
+    def carregar(cls, caminho):
+        with np.load(caminho) as npz:
+            indice = cls(int(npz['k']))
+            indice._carregar_agrupado(npz['ids_vagas'], npz['applicant_ids'], npz['scores'])
+        return indice
@@ -0,0 +1,296 @@
+"""
+DECISION AI - Recuperação de candidatos para uma vaga
+POSTECH Datathon 2026
+
+Uso: python recuperacao.py [models]
+     (monta models/recuperacao a partir da floresta, agregados e textos)
+
+Pontuar todos os candidatos do applicants.json para uma vaga custa uma
+passada da floresta por candidato. A recuperação faz isso em duas etapas:
+
+  1. candidatos: os vizinhos aproximados da vaga no espaço de texto mais os
+     "destaques", os candidatos com maior score da floresta numa vaga sem
+     histórico e sem texto em comum, isto é, pelo que só depende deles
+     (histórico, CV). Entre os candidatos, a floresta só varia além disso
+     pela similaridade de texto, que é o que os vizinhos cobrem
+  2. re-ranking: features_novas + floresta sobre esses poucos centos
+
+Os destaques dependem do histórico: o score de cada CV na vaga neutra fica
+guardado, e atualizar_historico repontua só os candidatos cujas contagens
+mudaram. Carregado com um histórico diferente do usado na construção (um
+atualizar_historico.py depois do treino), o recuperador repontua todos.
+
+Vetores: os TF-IDF de similaridade.py projetados em DIMENSOES dimensões
+por uma projeção aleatória de sinais (+-1), gerada por hash da coluna e da
+dimensão, então não há matriz de projeção para guardar, e renormalizados
+(o produto interno aproxima o cosseno TF-IDF).
+
+Índice vetorial: IVF. Um k-means divide os vetores em listas; cada lista
+fica contígua no disco. Uma consulta compara a vaga com os centróides e
+percorre só as `n_sondas` listas mais próximas.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.cluster import MiniBatchKMeans
+
+from cache_colunar import carregar_arrays, salvar_arrays
+from features import features_novas
+
+DIMENSOES = 128
+SEMENTE = 42
+N_VIZINHOS = 200
+N_DESTAQUES = 200
+N_SONDAS = 16
+TAMANHO_LOTE = 4096
+
+# Vaga inexistente: sem candidaturas no histórico e sem texto no índice
+_VAGA_NEUTRA = -1
+
+_ARRAYS_VETORIAL = ['centroides', 'inicios', 'ids', 'vetores']
+
+
+# ============================================================================
+# PROJEÇÃO
+# ============================================================================
+def _projecao(colunas, dimensoes, semente=SEMENTE):
+    """Linhas da matriz de projeção (+-1/sqrt(d)) das colunas dadas, por splitmix64."""
+    deslocamento = np.uint64(semente * 0x9E3779B97F4A7C15 % (1 << 64))
+    x = (colunas.astype(np.uint64)[:, None] * np.uint64(dimensoes)
+         + np.arange(dimensoes, dtype=np.uint64) + deslocamento)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+    sinais = np.where(x >> np.uint64(63), 1.0, -1.0).astype(np.float32)
+    return sinais / np.float32(np.sqrt(dimensoes))
+
+
+def projetar(matriz, dimensoes=DIMENSOES, semente=SEMENTE):
+    """
+    Vetores densos (float32, norma 1; linhas vazias ficam zeradas) de uma
+    matriz CSR, em lotes de linhas: cada lote gera só as linhas da projeção
+    das colunas que usa.
+    """
+    resultado = np.zeros((matriz.shape[0], dimensoes), dtype=np.float32)
+    for inicio in range(0, matriz.shape[0], TAMANHO_LOTE):
+        bloco = matriz[inicio:inicio + TAMANHO_LOTE]
+        if bloco.nnz == 0:
+            continue
+        # Produto esparso x denso só sobre as colunas usadas no lote
+        colunas, compactas = np.unique(bloco.indices, return_inverse=True)
+        compacto = sparse.csr_matrix((bloco.data, compactas, bloco.indptr),
+                                     shape=(bloco.shape[0], len(colunas)))
+        resultado[inicio:inicio + bloco.shape[0]] = compacto @ _projecao(colunas, dimensoes, semente)
+
+    normas = np.linalg.norm(resultado, axis=1)
+    np.divide(resultado, normas[:, None], out=resultado, where=normas[:, None] > 0)
+    return resultado
+
+
+def _melhores(ids, scores, k):
+    """(ids, scores) dos k maiores scores, empates pelo menor id."""
+    if k < len(scores):
+        selecao = np.argpartition(-scores, k)[:k]
+        ids, scores = ids[selecao], scores[selecao]
+    ordem = np.lexsort((ids, -scores))
+    return ids[ordem], scores[ordem]
+
+
+# ============================================================================
+# ÍNDICE VETORIAL (IVF)
+# ============================================================================
+class IndiceVetorial:
+    """Vetores de norma 1 em listas invertidas por centróide do k-means."""
+
+    def __init__(self, centroides, inicios, ids, vetores):
+        self.centroides = centroides
+        # Lista i: linhas inicios[i]:inicios[i + 1] de ids e vetores
+        self.inicios = inicios
+        self.ids = ids
+        self.vetores = vetores
+
+    @classmethod
+    def construir(cls, ids, vetores, n_listas=None, semente=SEMENTE):
+        """Índice sobre os vetores não nulos; `n_listas` padrão ~ raiz do número de vetores."""
+        validos = np.flatnonzero(np.any(vetores != 0, axis=1))
+        ids, vetores = np.asarray(ids, dtype=np.int64)[validos], vetores[validos]
+        if len(vetores) == 0:
+            # Nenhum CV com texto: índice sem listas, a recuperação fica só
+            # com os destaques
+            return cls(np.zeros((0, vetores.shape[1]), dtype=np.float32), np.zeros(1, dtype=np.int64),
+                       ids, np.asarray(vetores, dtype=np.float32))
+        n_listas = min(n_listas or max(1, int(np.sqrt(len(vetores)))), len(vetores))
+
+        kmeans = MiniBatchKMeans(n_clusters=n_listas, batch_size=4096, n_init=3,
+                                 random_state=semente).fit(vetores)
+        centroides = kmeans.cluster_centers_.astype(np.float32)
+        normas = np.linalg.norm(centroides, axis=1, keepdims=True)
+        np.divide(centroides, normas, out=centroides, where=normas > 0)
+
+        # Cada vetor na lista do centróide de maior produto interno, o mesmo
+        # critério da consulta
+        listas = np.concatenate([
+            np.argmax(vetores[i:i + TAMANHO_LOTE] @ centroides.T, axis=1)
+            for i in range(0, len(vetores), TAMANHO_LOTE)
+        ])
+        ordem = np.argsort(listas, kind='stable')
+        inicios = np.searchsorted(listas[ordem], np.arange(n_listas + 1)).astype(np.int64)
+        return cls(centroides, inicios, ids[ordem], np.ascontiguousarray(vetores[ordem]))
+
+    def buscar(self, consulta, n, n_sondas=N_SONDAS):
+        """(ids, produtos internos) dos n vizinhos aproximados de `consulta`, em ordem."""
+        sondas = np.argsort(-(self.centroides @ consulta))[:n_sondas]
+        linhas = np.concatenate([np.arange(self.inicios[s], self.inicios[s + 1]) for s in sondas]
+                                + [np.empty(0, dtype=np.int64)])
+        return _melhores(self.ids[linhas], self.vetores[linhas] @ consulta, n)
+
+    def buscar_exato(self, consulta, n):
+        """Os n vizinhos exatos (varre todos os vetores), para comparação."""
+        return _melhores(np.asarray(self.ids), self.vetores @ consulta, n)
+
+    def arrays(self):
+        """Arrays do índice por nome (Recuperador.salvar grava junto com os destaques)."""
+        return {nome: getattr(self, nome) for nome in _ARRAYS_VETORIAL}
+
+
+# ============================================================================
+# RECUPERAÇÃO EM DUAS ETAPAS
+# ============================================================================
+class Recuperador:
+    """Melhores candidatos do applicants.json para uma vaga: índice vetorial + floresta."""
+
+    def __init__(self, vetorial, destaques, modelo, historico, candidatos, indice_textos,
+                 dimensoes=DIMENSOES, semente=SEMENTE, scores_neutros=None):
+        self.vetorial = vetorial
+        self.destaques = destaques
+        # Score de cada CV (na ordem de indice_textos.ids_cvs) na vaga neutra
+        self.scores_neutros = scores_neutros
+        self.modelo = modelo
+        self.historico = historico
+        self.candidatos = candidatos
+        self.indice_textos = indice_textos
+        self.dimensoes = dimensoes
+        self.semente = semente
+
+    @classmethod
+    def construir(cls, modelo, historico, candidatos, indice_textos, dimensoes=DIMENSOES,
+                  n_destaques=N_DESTAQUES, n_listas=None, semente=SEMENTE):
+        """Projeta os CVs, monta o IVF e pontua todos os candidatos na vaga neutra."""
+        ids = np.asarray(indice_textos.ids_cvs, dtype=np.int64)
+        # CVs sem nenhum termo dariam vetores nulos, que o IVF descarta: nem
+        # entram na matriz densa (a maioria dos candidatos não tem CV)
+        com_termos = np.flatnonzero(np.diff(indice_textos.cvs.indptr) > 0)
+        vetores = projetar(indice_textos.cvs[com_termos], dimensoes, semente)
+        vetorial = IndiceVetorial.construir(ids[com_termos], vetores, n_listas, semente)
+        recuperador = cls(vetorial, None, modelo, historico, candidatos, indice_textos,
+                          dimensoes, semente)
+        recuperador._destacar(n_destaques)
+        return recuperador
+
+    def _pontuar_neutra(self, applicant_ids):
+        """Scores na vaga neutra, em lotes de TAMANHO_LOTE candidatos."""
+        return np.concatenate([
+            self.pontuar(_VAGA_NEUTRA, applicant_ids[i:i + TAMANHO_LOTE])
+            for i in range(0, len(applicant_ids), TAMANHO_LOTE)
+        ]) if len(applicant_ids) else np.empty(0)
+
+    def _destacar(self, n_destaques):
+        """Pontua todos os CVs na vaga neutra e escolhe os destaques."""
+        ids = np.asarray(self.indice_textos.ids_cvs, dtype=np.int64)
+        self.scores_neutros = self._pontuar_neutra(ids)
+        self.destaques, _ = _melhores(ids, self.scores_neutros, n_destaques)
+
+    def atualizar_historico(self, historico):
+        """
+        Troca o histórico e refaz os destaques, repontuando só os candidatos
+        cujas aplicações ou contratações mudaram.
+        """
+        ids = np.asarray(self.indice_textos.ids_cvs, dtype=np.int64)
+        aplicacoes, contratacoes = self.historico.candidato(ids)
+        aplicacoes_novas, contratacoes_novas = historico.candidato(ids)
+        mudou = np.flatnonzero((aplicacoes != aplicacoes_novas) | (contratacoes != contratacoes_novas))
+
+        self.historico = historico
+        scores = np.array(self.scores_neutros)
+        scores[mudou] = self._pontuar_neutra(ids[mudou])
+        self.scores_neutros = scores
+        self.destaques, _ = _melhores(ids, scores, len(self.destaques))
+
+    def pontuar(self, job_id, applicant_ids):
+        """Score da floresta de cada candidato como candidatura nova à vaga."""
+        tabela = pd.DataFrame({'job_id': np.full(len(applicant_ids), job_id, dtype=np.int64),
+                               'applicant_id': applicant_ids})
+        X = features_novas(tabela, self.historico, self.candidatos, self.indice_textos)
+        return self.modelo.predict_proba(X[self.modelo.features])[:, 1]
+
+    def vetor_vaga(self, job_id):
+        """Vetor projetado do texto da vaga (None se a vaga não está no índice de textos)."""
+        linha = self.indice_textos.linhas_vagas([job_id])[0]
+        if linha < 0:
+            return None
+        return projetar(self.indice_textos.vagas[linha], self.dimensoes, self.semente)[0]
+
+    def candidatos_vaga(self, job_id, n_vizinhos=N_VIZINHOS, n_sondas=N_SONDAS):
+        """Primeira etapa: vizinhos de texto da vaga mais os destaques, sem repetição."""
+        vetor = self.vetor_vaga(job_id)
+        if vetor is None or not vetor.any() or len(self.vetorial.centroides) == 0:
+            return np.asarray(self.destaques)
+        vizinhos, _ = self.vetorial.buscar(vetor, n_vizinhos, n_sondas)
+        return np.union1d(vizinhos, self.destaques)
+
+    def recomendar(self, job_id, k=20, n_vizinhos=N_VIZINHOS, n_sondas=N_SONDAS):
+        """(applicant_ids, scores) dos k melhores candidatos da vaga, em ordem."""
+        ids = self.candidatos_vaga(job_id, n_vizinhos, n_sondas)
+        return _melhores(ids, self.pontuar(job_id, ids), k)
+
+    def forca_bruta(self, job_id, k=20):
+        """Os k melhores pontuando todos os candidatos (referência da recuperação)."""
+        ids = np.asarray(self.indice_textos.ids_cvs, dtype=np.int64)
+        return _melhores(ids, self.pontuar(job_id, ids), k)
+
+    def salvar(self, pasta):
+        """IVF, destaques e scores na vaga neutra em `pasta` (cache_colunar.salvar_arrays)."""
+        salvar_arrays(pasta, {**self.vetorial.arrays(), 'destaques': self.destaques,
+                              'scores_neutros': self.scores_neutros},
+                      dimensoes=self.dimensoes, semente=self.semente,
+                      listas=len(self.vetorial.centroides), vetores=len(self.vetorial.ids),
+                      historico_linhas=self.historico.n_linhas)
+
+    @classmethod
+    def carregar(cls, pasta, modelo, historico, candidatos, indice_textos):
+        """
+        Arrays via memory-map; modelo, agregados e textos já carregados pelo
+        chamador. Com um histórico diferente do da construção, refaz os destaques.
+        """
+        arrays, meta = carregar_arrays(pasta)
+        vetorial = IndiceVetorial(*(arrays[nome] for nome in _ARRAYS_VETORIAL))
+        recuperador = cls(vetorial, arrays['destaques'], modelo, historico, candidatos, indice_textos,
+                          meta['dimensoes'], meta['semente'], arrays.get('scores_neutros'))
+        if meta.get('historico_linhas') != historico.n_linhas or recuperador.scores_neutros is None:
+            recuperador._destacar(len(recuperador.destaques))
+        return recuperador
+
+
+def main():
+    from features import FeaturesCandidatos, Historico
+    from floresta import Floresta
+    from similaridade import IndiceTextos
+
+    pasta = sys.argv[1] if len(sys.argv) > 1 else 'models'
+    recuperador = Recuperador.construir(
+        Floresta.carregar(os.path.join(pasta, 'floresta')),
+        Historico.carregar(os.path.join(pasta, 'historico.npz')),
+        FeaturesCandidatos.carregar(os.path.join(pasta, 'candidatos.npz')),
+        IndiceTextos.carregar(os.path.join(pasta, 'textos')),
+    )
+    recuperador.salvar(os.path.join(pasta, 'recuperacao'))
+    print(f"{len(recuperador.vetorial.ids):,} CVs em {len(recuperador.vetorial.centroides)} listas, "
+          f"{len(recuperador.destaques)} destaques -> {pasta}/recuperacao")
+
+
+if __name__ == '__main__':
+    main()
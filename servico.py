@@ -0,0 +1,264 @@
+"""
+DECISION AI - Serviço de pontuação online
+POSTECH Datathon 2026
+
+Uso: python servico.py [--host 127.0.0.1] [--porta 8000] [--modelos models]
+
+    POST /pontuar   {"job_id": 10, "applicant_id": 31000, "cv": "..."}
+                    ou uma lista desses objetos (lote); "cv" é opcional
+    GET  /ranking?job_id=10&k=20
+                    melhores candidatos da vaga, do índice em models/ranking.npz
+    POST /ranking   mesmo corpo de /pontuar; pontua e inclui as candidaturas
+                    no ranking das suas vagas, regravando models/ranking.npz
+    GET  /candidatos?job_id=10&k=20
+                    melhores candidatos do applicants.json para a vaga, por
+                    recuperação em duas etapas (models/recuperacao)
+    POST /vagas     {"cv": "...", "k": 20}
+                    vagas com texto mais parecido com o CV (models/textos)
+    GET  /saude
+
+Modelo (com o pré-processamento embutido) e agregados de models/ são carregados uma vez na subida;
+cada requisição só consulta os agregados e roda o modelo sobre o lote. O
+histórico (models/historico.npz) é relido quando atualizar_historico.py o
+regrava, sem reiniciar o serviço; o ranking, quando outro processo (ou um
+novo treino) regrava models/ranking.npz. POST /ranking relê, atualiza e
+regrava o arquivo sob uma trava de arquivo, então vários processos do serviço
+não perdem as inclusões uns dos outros.
+/pontuar não altera nada; o ranking só muda por POST /ranking.
+"""
+
+import argparse
+import fcntl
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from features import FeaturesCandidatos, Historico, features_novas
+from floresta import Floresta
+from ranking import IndiceRanking
+from recuperacao import Recuperador
+from similaridade import IndiceTextos
+
+
+def _versao(caminho):
+    """(mtime, tamanho) do arquivo; muda quando ele é regravado."""
+    estado = os.stat(caminho)
+    return estado.st_mtime_ns, estado.st_size
+
+
+class Pontuador:
+    """Calcula probabilidade de contratação para lotes de candidaturas."""
+
+    def __init__(self, pasta='models'):
+        self.modelo = Floresta.carregar(os.path.join(pasta, 'floresta'))
+        self._caminho_historico = os.path.join(pasta, 'historico.npz')
+        self._versao_historico = _versao(self._caminho_historico)
+        self.historico = Historico.carregar(self._caminho_historico)
+        self._trava_historico = threading.Lock()
+        self.candidatos = FeaturesCandidatos.carregar(os.path.join(pasta, 'candidatos.npz'))
+        self.features = self.modelo.features
+
+        caminho_textos = os.path.join(pasta, 'textos')
+        self.textos = IndiceTextos.carregar(caminho_textos) if os.path.exists(caminho_textos) else None
+
+        caminho_recuperacao = os.path.join(pasta, 'recuperacao')
+        self.recuperador = None
+        if self.textos is not None and os.path.exists(caminho_recuperacao):
+            self.recuperador = Recuperador.carregar(caminho_recuperacao, self.modelo, self.historico,
+                                                    self.candidatos, self.textos)
+
+        self._caminho_ranking = os.path.join(pasta, 'ranking.npz')
+        self.ranking = None
+        self._versao_ranking = None
+        if os.path.exists(self._caminho_ranking):
+            self._versao_ranking = _versao(self._caminho_ranking)
+            self.ranking = IndiceRanking.carregar(self._caminho_ranking)
+        self._trava_ranking = threading.Lock()
+
+    def _recarregar_historico(self):
+        """Relê historico.npz se ele mudou desde a última leitura (gravação atômica)."""
+        versao = _versao(self._caminho_historico)
+        if versao == self._versao_historico:
+            return
+        with self._trava_historico:
+            if versao != self._versao_historico:
+                self.historico = Historico.carregar(self._caminho_historico)
+                if self.recuperador is not None:
+                    self.recuperador.atualizar_historico(self.historico)
+                self._versao_historico = versao
+
+    def _recarregar_ranking(self):
+        """Relê ranking.npz se ele mudou desde a última leitura; chamar com _trava_ranking."""
+        versao = _versao(self._caminho_ranking)
+        if versao != self._versao_ranking:
+            self.ranking = IndiceRanking.carregar(self._caminho_ranking)
+            self._versao_ranking = versao
+
+    def pontuar(self, candidaturas):
+        """Probabilidades para uma lista de dicts com job_id, applicant_id e cv."""
+        self._recarregar_historico()
+        tabela = pd.DataFrame({
+            'job_id': [_validar_id(c['job_id']) for c in candidaturas],
+            'applicant_id': [_validar_id(c['applicant_id']) for c in candidaturas],
+            'cv': [c.get('cv') for c in candidaturas],
+        })
+        X = features_novas(tabela, self.historico, self.candidatos, self.textos)[self.features]
+        return self.modelo.predict_proba(X)[:, 1]
+
+    def incluir_no_ranking(self, candidaturas):
+        """
+        Pontua as candidaturas, as inclui no ranking das suas vagas e regrava
+        ranking.npz (troca atômica); retorna as probabilidades.
+        """
+        if self.ranking is None:
+            raise ValueError("models/ranking.npz não encontrado; rode treinar_modelo.py")
+        probabilidades = self.pontuar(candidaturas)
+        job_ids = [_validar_id(c['job_id']) for c in candidaturas]
+        applicant_ids = [_validar_id(c['applicant_id']) for c in candidaturas]
+        # A trava de arquivo serializa as inclusões entre processos: cada um
+        # parte do arquivo mais recente. Leituras não travam: cada vaga é
+        # trocada por inteiro no dict
+        with self._trava_ranking, open(self._caminho_ranking + '.trava', 'w') as trava:
+            fcntl.flock(trava, fcntl.LOCK_EX)
+            self._recarregar_ranking()
+            self.ranking.atualizar(job_ids, applicant_ids, probabilidades)
+            self.ranking.salvar(self._caminho_ranking)
+            self._versao_ranking = _versao(self._caminho_ranking)
+        return probabilidades
+
+    def melhores(self, job_id, k=None):
+        """Melhores candidatos da vaga como lista de dicts applicant_id/score."""
+        if self.ranking is None:
+            raise ValueError("models/ranking.npz não encontrado; rode treinar_modelo.py")
+        if _versao(self._caminho_ranking) != self._versao_ranking:
+            with self._trava_ranking:
+                self._recarregar_ranking()
+        return [{'applicant_id': a, 'score': s} for a, s in self.ranking.top(job_id, k)]
+
+    def candidatos_para_vaga(self, job_id, k=20):
+        """Melhores candidatos de todo o applicants.json para a vaga, como dicts applicant_id/score."""
+        if self.recuperador is None:
+            raise ValueError("models/recuperacao não encontrado; rode treinar_modelo.py")
+        self._recarregar_historico()
+        applicant_ids, scores = self.recuperador.recomendar(job_id, k)
+        return [{'applicant_id': a, 'score': s} for a, s in zip(applicant_ids.tolist(), scores.tolist())]
+
+    def vagas_para_cv(self, cv, k=20):
+        """Vagas mais parecidas com o texto do CV, como lista de dicts job_id/similaridade."""
+        if self.textos is None:
+            raise ValueError("models/textos não encontrado; rode treinar_modelo.py")
+        job_ids, similaridades = self.textos.vagas_para_texto(str(cv), k)
+        return [{'job_id': j, 'similaridade': s} for j, s in zip(job_ids.tolist(), similaridades.tolist())]
+
+
+def _validar_id(valor):
+    """job_id ou applicant_id da requisição, que precisa ser um inteiro de 64 bits."""
+    if isinstance(valor, bool) or not isinstance(valor, int) or not -(1 << 63) <= valor < (1 << 63):
+        raise ValueError(f"id deve ser um inteiro de 64 bits, não {valor!r}")
+    return valor
+
+
+def _validar_k(k):
+    """`k` da requisição, que precisa ser um inteiro positivo."""
+    if isinstance(k, bool) or not isinstance(k, int) or k < 1:
+        raise ValueError(f"k deve ser um inteiro positivo, não {k!r}")
+    return k
+
+
+class _Handler(BaseHTTPRequestHandler):
+    pontuador = None
+
+    def _responder(self, status, corpo):
+        dados = json.dumps(corpo).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(dados)))
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/saude':
+            self._responder(200, {'status': 'ok'})
+        elif url.path in ('/ranking', '/candidatos'):
+            inicio = time.perf_counter()
+            try:
+                parametros = parse_qs(url.query)
+                job_id = _validar_id(int(parametros['job_id'][0]))
+                if url.path == '/ranking':
+                    k = _validar_k(int(parametros['k'][0])) if 'k' in parametros else None
+                    candidatos = self.pontuador.melhores(job_id, k)
+                else:
+                    k = _validar_k(int(parametros['k'][0])) if 'k' in parametros else 20
+                    candidatos = self.pontuador.candidatos_para_vaga(job_id, k)
+            except (ValueError, KeyError) as e:
+                self._responder(400, {'erro': f"requisição inválida: {e!r}"})
+                return
+            self._responder(200, {
+                'job_id': job_id,
+                'candidatos': candidatos,
+                'tempo_ms': (time.perf_counter() - inicio) * 1000,
+            })
+        else:
+            self._responder(404, {'erro': 'rota não encontrada'})
+
+    def do_POST(self):
+        if self.path not in ('/pontuar', '/ranking', '/vagas'):
+            self._responder(404, {'erro': 'rota não encontrada'})
+            return
+
+        inicio = time.perf_counter()
+        try:
+            tamanho = int(self.headers.get('Content-Length', 0))
+            corpo = json.loads(self.rfile.read(tamanho))
+            if self.path == '/vagas':
+                resposta = {'vagas': self.pontuador.vagas_para_cv(corpo['cv'], _validar_k(corpo.get('k', 20)))}
+            else:
+                candidaturas = corpo if isinstance(corpo, list) else [corpo]
+                pontuar = (self.pontuador.pontuar if self.path == '/pontuar'
+                           else self.pontuador.incluir_no_ranking)
+                resposta = {'probabilidades': pontuar(candidaturas).tolist()}
+        except (ValueError, KeyError, TypeError) as e:
+            self._responder(400, {'erro': f"requisição inválida: {e!r}"})
+            return
+
+        resposta['tempo_ms'] = (time.perf_counter() - inicio) * 1000
+        self._responder(200, resposta)
+
+    def log_message(self, format, *args):
+        # Log por requisição no stderr pesa na latência sob carga
+        pass
+
+
+def criar_servidor(pontuador, host='127.0.0.1', porta=8000):
+    """Servidor HTTP (uma thread por conexão) em volta de `pontuador`."""
+    handler = type('Handler', (_Handler,), {'pontuador': pontuador})
+    return ThreadingHTTPServer((host, porta), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serviço de pontuação do Decision AI")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8000)
+    parser.add_argument('--modelos', default='models')
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    pontuador = Pontuador(args.modelos)
+    print(f"Modelo carregado em {time.perf_counter() - inicio:.2f}s")
+
+    servidor = criar_servidor(pontuador, args.host, args.porta)
+    print(f"Servindo em http://{args.host}:{args.porta}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        servidor.server_close()
+
+
+if __name__ == '__main__':
+    main()
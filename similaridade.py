@@ -0,0 +1,184 @@
+"""
+DECISION AI - Similaridade de texto entre vaga e CV
+POSTECH Datathon 2026
+
+Uso: python similaridade.py [data] [models/textos]
+     (monta o índice de vagas.json e applicants.json)
+
+Vagas (título, atividades, competências) e CVs viram vetores TF-IDF
+esparsos sobre unigramas com hashing: sem vocabulário para guardar, e um
+texto novo é vetorizado sozinho. Os vetores têm norma 1, então a
+similaridade de cosseno é um produto interno.
+
+O índice guarda o IDF e as matrizes CSR de vagas e de CVs, um .npy por
+array, lidos via memory-map como a floresta. Consultas:
+
+  similaridade(job_ids, applicant_ids)  cosseno de cada candidatura,
+                                        linha a linha sobre as duas
+                                        matrizes, em lotes
+  vagas_para_texto(texto, k)            um CV novo contra todas as vagas:
+                                        um produto matriz-vetor
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+from cache_colunar import carregar_arrays, salvar_arrays
+from skills import tokenizar
+
+# Colunas do hashing: colisões são raras com vocabulários de ~10^5 termos
+N_DIMENSOES = 1 << 20
+TAMANHO_LOTE = 1 << 16
+
+_MATRIZES = ['vagas', 'cvs']
+_PARTES_CSR = ['data', 'indices', 'indptr']
+
+
+def _termos(texto):
+    return [t for t in (t.strip('.') for t in tokenizar(texto)) if t]
+
+
+_HASHING = HashingVectorizer(
+    n_features=N_DIMENSOES, tokenizer=_termos, token_pattern=None, lowercase=False,
+    alternate_sign=False, norm=None, dtype=np.float32,
+)
+
+
+def _contagens(textos):
+    """Matriz CSR textos x termos com 1 + log(frequência) (TF sublinear)."""
+    X = _HASHING.transform(textos)
+    np.log(X.data, out=X.data)
+    X.data += 1
+    return X
+
+
+class IndiceTextos:
+    """Vetores TF-IDF de vagas e CVs, por job_id e applicant_id."""
+
+    def __init__(self, idf, ids_vagas, vagas, ids_cvs, cvs):
+        self.idf = idf
+        self.ids_vagas = ids_vagas
+        self.vagas = vagas
+        self.ids_cvs = ids_cvs
+        self.cvs = cvs
+        self._indice_vagas = pd.Index(ids_vagas)
+        self._indice_cvs = pd.Index(ids_cvs)
+
+    @classmethod
+    def construir(cls, textos_vagas, textos_cvs):
+        """Ajusta o IDF em vagas + CVs (dicts id -> texto) e vetoriza os dois."""
+        vagas = _contagens(list(textos_vagas.values()))
+        cvs = _contagens(list(textos_cvs.values()))
+
+        # IDF suavizado, como o TfidfTransformer do sklearn
+        n_documentos = vagas.shape[0] + cvs.shape[0]
+        frequencia = (np.bincount(vagas.indices, minlength=N_DIMENSOES)
+                      + np.bincount(cvs.indices, minlength=N_DIMENSOES))
+        idf = (np.log((1 + n_documentos) / (1 + frequencia)) + 1).astype(np.float32)
+
+        indice = cls(idf, np.fromiter(textos_vagas, dtype=np.int64, count=len(textos_vagas)), None,
+                     np.fromiter(textos_cvs, dtype=np.int64, count=len(textos_cvs)), None)
+        indice.vagas = indice._ponderar(vagas)
+        indice.cvs = indice._ponderar(cvs)
+        return indice
+
+    def _ponderar(self, contagens):
+        contagens.data *= self.idf[contagens.indices]
+        return normalize(contagens, copy=False)
+
+    def vetorizar(self, textos):
+        """Vetores (CSR, norma 1) de textos avulsos, com o IDF do índice."""
+        return self._ponderar(_contagens(textos))
+
+    @staticmethod
+    def _cosseno_linhas(A, B):
+        return np.asarray(A.multiply(B).sum(axis=1), dtype=np.float64).ravel()
+
+    def linhas_vagas(self, job_ids):
+        """Linha de cada vaga na matriz `vagas` (-1 se não está no índice)."""
+        return self._indice_vagas.get_indexer(np.asarray(job_ids))
+
+    def linhas_cvs(self, applicant_ids):
+        """Linha de cada candidato na matriz `cvs` (-1 se não está no índice)."""
+        return self._indice_cvs.get_indexer(np.asarray(applicant_ids))
+
+    def similaridade(self, job_ids, applicant_ids):
+        """Cosseno vaga x CV de cada candidatura (0 sem vaga ou CV no índice)."""
+        linhas_vagas = self.linhas_vagas(job_ids)
+        linhas_cvs = self.linhas_cvs(applicant_ids)
+        resultado = np.zeros(len(linhas_vagas))
+        validas = np.flatnonzero((linhas_vagas >= 0) & (linhas_cvs >= 0))
+        for inicio in range(0, len(validas), TAMANHO_LOTE):
+            lote = validas[inicio:inicio + TAMANHO_LOTE]
+            resultado[lote] = self._cosseno_linhas(self.vagas[linhas_vagas[lote]],
+                                                   self.cvs[linhas_cvs[lote]])
+        return resultado
+
+    def similaridade_textos(self, job_ids, textos):
+        """Cosseno entre cada vaga e um CV dado em texto (0 se a vaga não existe)."""
+        linhas_vagas = self.linhas_vagas(job_ids)
+        resultado = np.zeros(len(linhas_vagas))
+        validas = np.flatnonzero(linhas_vagas >= 0)
+        if len(validas):
+            vetores = self.vetorizar([textos[i] for i in validas])
+            resultado[validas] = self._cosseno_linhas(self.vagas[linhas_vagas[validas]], vetores)
+        return resultado
+
+    def vagas_para_texto(self, texto, k=None):
+        """(job_ids, similaridades) das vagas mais parecidas com `texto`, em ordem."""
+        vetor = self.vetorizar([texto])
+        denso = np.zeros(N_DIMENSOES, dtype=np.float32)
+        denso[vetor.indices] = vetor.data
+        scores = self.vagas @ denso
+        if k is not None and k < len(scores):
+            melhores = np.argpartition(-scores, k)[:k]
+        else:
+            melhores = np.arange(len(scores))
+        # Empates pelo menor job_id, para a ordem não depender da partição
+        melhores = melhores[np.lexsort((self.ids_vagas[melhores], -scores[melhores]))]
+        return self.ids_vagas[melhores], scores[melhores].astype(np.float64)
+
+    def salvar(self, pasta):
+        """IDF, ids e as partes das matrizes CSR em `pasta` (cache_colunar.salvar_arrays)."""
+        arrays = {'idf': self.idf, 'ids_vagas': self.ids_vagas, 'ids_cvs': self.ids_cvs}
+        for nome in _MATRIZES:
+            matriz = getattr(self, nome)
+            arrays.update({f"{nome}_{parte}": getattr(matriz, parte) for parte in _PARTES_CSR})
+        salvar_arrays(pasta, arrays, dimensoes=N_DIMENSOES, vagas=len(self.ids_vagas),
+                      cvs=len(self.ids_cvs))
+
+    @classmethod
+    def carregar(cls, pasta):
+        """Índice sobre os arrays de `pasta`, abertos via memory-map."""
+        arrays, meta = carregar_arrays(pasta)
+        if meta['dimensoes'] != N_DIMENSOES:
+            raise ValueError(f"{pasta}: índice com {meta['dimensoes']} dimensões, esperado {N_DIMENSOES}")
+        matrizes = {
+            nome: sparse.csr_matrix(tuple(arrays[f"{nome}_{parte}"] for parte in _PARTES_CSR),
+                                    shape=(meta[nome], N_DIMENSOES))
+            for nome in _MATRIZES
+        }
+        return cls(arrays['idf'], arrays['ids_vagas'], matrizes['vagas'], arrays['ids_cvs'],
+                   matrizes['cvs'])
+
+
+def main():
+    from ingestao import ler_cvs, ler_textos_vagas
+
+    pasta = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    destino = sys.argv[2] if len(sys.argv) > 2 else 'models/textos'
+    textos_vagas = ler_textos_vagas(os.path.join(pasta, 'vagas.json'))
+    cv_dict, _ = ler_cvs(os.path.join(pasta, 'applicants.json'))
+    indice = IndiceTextos.construir(textos_vagas, cv_dict)
+    indice.salvar(destino)
+    print(f"{len(indice.ids_vagas):,} vagas, {len(indice.ids_cvs):,} CVs -> {destino}")
+
+
+if __name__ == '__main__':
+    main()
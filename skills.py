@@ -0,0 +1,104 @@
+"""
+DECISION AI - Extração de skills dos CVs
+POSTECH Datathon 2026
+
+Cada CV único é colocado em minúsculas e tokenizado uma única vez; os
+tokens são cruzados com o vocabulário inteiro por consulta em dicionário,
+então o custo por CV não cresce com o número de skills. Os termos casam
+por palavra inteira ("java" não casa com "javascript").
+"""
+
+import string
+
+import numpy as np
+from scipy import sparse
+
+# Skill -> termos que a indicam. Os termos passam pela mesma tokenização dos
+# CVs, então "pl/sql" vira ("pl", "sql") e "node.js" fica um token só
+SKILLS = {
+    'python': ['python'],
+    'java': ['java'],
+    'sql': ['sql', 'mysql', 'postgresql', 'plsql', 'tsql'],
+    'sap': ['sap'],
+}
+
+# Pontuação vira espaço, exceto + e # (c++, c#), ponto (node.js, asp.net) e _
+_SEPARADORES = str.maketrans({
+    c: ' ' for c in string.punctuation + '•·–—“”‘’«»…' if c not in '+#._'
+})
+
+
+def tokenizar(texto):
+    """Tokens em minúsculas de `texto` (podem ter pontos nas pontas)."""
+    return texto.lower().translate(_SEPARADORES).split()
+
+
+def _normalizar(tokens):
+    return tuple(t for t in (t.strip('.') for t in tokens) if t)
+
+
+class ExtratorSkills:
+    """Casa um vocabulário de skills contra CVs em uma passada por CV."""
+
+    def __init__(self, vocabulario=SKILLS):
+        if not isinstance(vocabulario, dict):
+            vocabulario = {termo: [termo] for termo in vocabulario}
+        self.skills = list(vocabulario)
+
+        # Termo de um token -> skills; termos compostos ficam indexados pelo
+        # primeiro token, para só serem testados onde ele aparece
+        self._simples = {}
+        self._compostos = {}
+        for i, termos in enumerate(vocabulario.values()):
+            for termo in termos:
+                tokens = _normalizar(tokenizar(termo))
+                if len(tokens) == 1:
+                    self._simples.setdefault(tokens[0], set()).add(i)
+                elif tokens:
+                    self._compostos.setdefault(tokens[0], []).append((tokens, i))
+
+    def skills_do_texto(self, texto):
+        """Índices (em self.skills) das skills presentes em `texto`."""
+        tokens = tokenizar(texto)
+        unicos = set(tokens)
+        # Pontos só contam dentro do token: "sql." -> "sql", e as partes
+        # de "java.util" também casam ("java", "util")
+        for token in [t for t in unicos if '.' in t]:
+            unicos.add(token.strip('.'))
+            unicos.update(token.split('.'))
+
+        encontradas = set()
+        for token in unicos.intersection(self._simples):
+            encontradas |= self._simples[token]
+
+        # Termos compostos só são testados onde o primeiro token aparece
+        primeiros = unicos.intersection(self._compostos)
+        if primeiros:
+            tokens = [t.strip('.') for t in tokens]
+            for pos, token in enumerate(tokens):
+                if token in primeiros:
+                    for termo, i in self._compostos[token]:
+                        if tuple(tokens[pos:pos + len(termo)]) == termo:
+                            encontradas.add(i)
+        return encontradas
+
+    def extrair(self, cv_dict):
+        """
+        Matriz esparsa candidato x skill (CSR, int8) para os CVs de `cv_dict`.
+
+        Retorna (ids, matriz); a linha i corresponde ao candidato ids[i].
+        """
+        ids = np.fromiter(cv_dict.keys(), dtype=np.int64, count=len(cv_dict))
+        indptr = [0]
+        indices = []
+        for texto in cv_dict.values():
+            if texto:
+                indices.extend(sorted(self.skills_do_texto(texto)))
+            indptr.append(len(indices))
+
+        matriz = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int8), indices, indptr),
+            shape=(len(ids), len(self.skills))
+        )
+        return ids, matriz
+
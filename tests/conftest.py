@@ -0,0 +1,31 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+# Dados sintéticos dos testes que precisam de models/ treinado
+ESCALA_MODELOS = 0.05
+
+
+@pytest.fixture(scope='session')
+def _modelos_treinados(tmp_path_factory):
+    from gerar_dados import gerar
+
+    pasta = tmp_path_factory.mktemp('treino')
+    gerar(str(pasta / 'data'), ESCALA_MODELOS)
+    subprocess.run([sys.executable, os.path.join(RAIZ, 'treinar_modelo.py')],
+                   cwd=pasta, check=True, capture_output=True, text=True)
+    return pasta / 'models'
+
+
+@pytest.fixture(scope='module')
+def pasta_modelos(_modelos_treinados, tmp_path_factory):
+    """Cópia de um models/ treinado em dados pequenos, que o módulo pode alterar."""
+    pasta = tmp_path_factory.mktemp('models') / 'models'
+    shutil.copytree(_modelos_treinados, pasta)
+    return pasta
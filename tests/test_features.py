@@ -0,0 +1,82 @@
+"""Modo incremental (Historico + features_novas) x recálculo em lote (calcular_features)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from features import FeaturesCandidatos, Historico, calcular_features, features_novas
+from similaridade import IndiceTextos
+
+PALAVRAS = ['python', 'java', 'sql', 'postgresql', 'sap', 'excel', 'aws', 'gestão', 'inglês']
+DIA = 86400
+
+
+@pytest.fixture(scope='module')
+def dados():
+    rng = np.random.default_rng(7)
+    n = 300
+    df = pd.DataFrame({
+        'job_id': rng.integers(1, 25, n),
+        'applicant_id': rng.integers(100, 160, n),
+        'is_hired': (rng.random(n) < 0.15).astype(np.int64),
+        'data_candidatura': rng.integers(0, 12, n) * DIA,
+    })
+    # Candidatos sem CV (fora do store) também aparecem na tabela
+    cv_dict = {a: ' '.join(rng.choice(PALAVRAS, rng.integers(1, 6))) for a in range(100, 150)}
+    textos_vagas = {v: ' '.join(rng.choice(PALAVRAS, 3)) for v in range(1, 25)}
+    candidatos = FeaturesCandidatos.de_cvs(cv_dict)
+    indice_textos = IndiceTextos.construir(textos_vagas, cv_dict)
+    return df, cv_dict, candidatos, indice_textos
+
+
+@pytest.mark.parametrize('caso', ['existente', 'candidato novo', 'vaga nova', 'sem cv no store'])
+@pytest.mark.parametrize('com_cv', [False, True])
+def test_features_novas_igual_ao_lote(dados, caso, com_cv):
+    df, cv_dict, candidatos, indice_textos = dados
+    job_id, applicant_id = int(df['job_id'].iat[5]), int(df['applicant_id'].iat[5])
+    if caso == 'candidato novo':
+        applicant_id = 999
+    elif caso == 'vaga nova':
+        job_id = 999
+    elif caso == 'sem cv no store':
+        applicant_id = int(df.loc[df['applicant_id'] >= 150, 'applicant_id'].iat[0])
+
+    nova = pd.DataFrame({'job_id': [job_id], 'applicant_id': [applicant_id], 'is_hired': [0]})
+    lote, features = calcular_features(pd.concat([df, nova], ignore_index=True), candidatos,
+                                       indice_textos=indice_textos)
+    esperado = lote.iloc[[-1]].reset_index(drop=True)
+
+    entrada = nova[['job_id', 'applicant_id']].copy()
+    if com_cv:
+        entrada['cv'] = [cv_dict.get(applicant_id, '')]
+    obtido = features_novas(entrada, Historico.de_prospects(df), candidatos, indice_textos)[features]
+    pd.testing.assert_frame_equal(esperado, obtido, check_dtype=False)
+
+
+def test_historico_atualizado_igual_ao_recalculado(dados):
+    df = dados[0]
+    historico = Historico.vazio()
+    ordem = np.concatenate([historico.atualizar(df.iloc[i:i + 37]) for i in range(0, len(df), 37)])
+    recalculado = Historico.de_prospects(df)
+
+    np.testing.assert_array_equal(ordem, df.groupby('job_id').cumcount().to_numpy() + 1)
+    assert historico.n_linhas == recalculado.n_linhas
+    for nome in ('aplicacoes', 'contratacoes'):
+        assert (dict(zip(historico.ids_candidatos, getattr(historico, nome)))
+                == dict(zip(recalculado.ids_candidatos, getattr(recalculado, nome))))
+    assert (dict(zip(historico.ids_vagas, historico.candidaturas_vaga))
+            == dict(zip(recalculado.ids_vagas, recalculado.candidaturas_vaga)))
+
+
+def test_dia_a_dia_igual_ao_ponto_no_tempo(dados):
+    df, _, candidatos, indice_textos = dados
+    X, features = calcular_features(df, candidatos, ponto_no_tempo=True, indice_textos=indice_textos)
+
+    # Como o serviço: pontua o dia e só então o anexa ao histórico
+    historico = Historico.vazio()
+    obtido = []
+    for _, dia in df.groupby('data_candidatura', sort=True):
+        obtido.append(features_novas(dia, historico, candidatos, indice_textos).set_index(dia.index))
+        historico.atualizar(dia)
+    obtido = pd.concat(obtido).loc[df.index, features]
+    pd.testing.assert_frame_equal(X, obtido, check_dtype=False)
@@ -0,0 +1,49 @@
+"""Floresta achatada x RandomForestClassifier do sklearn."""
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+from floresta import TAMANHO_BLOCO, Floresta
+
+FEATURES = [f"f{i}" for i in range(6)]
+
+
+def _dados(n, rng):
+    X = rng.normal(size=(n, len(FEATURES))) * [1, 10, 100, 0.1, 1, 5] + [0, 50, -20, 0, 3, 0]
+    y = (X[:, 0] + X[:, 1] / 10 + rng.normal(size=n) > 5).astype(int)
+    # Faltantes no treino: as árvores aprendem para que lado eles vão
+    X[rng.random(n) < 0.05, 2] = np.nan
+    return X, y
+
+
+@pytest.fixture(scope='module')
+def dados():
+    rng = np.random.default_rng(3)
+    X, y = _dados(2000, rng)
+    # Mais linhas que um bloco de predict_proba
+    X_teste, _ = _dados(TAMANHO_BLOCO + 500, rng)
+    X_teste[::7, 0] = np.nan
+    return X, y, X_teste
+
+
+@pytest.mark.parametrize('normalizar', [False, True])
+def test_predict_proba_igual_ao_sklearn(dados, tmp_path, normalizar):
+    X, y, X_teste = dados
+    scaler = StandardScaler().fit(X) if normalizar else None
+    entrada = X if scaler is None else scaler.transform(X)
+    modelo = RandomForestClassifier(n_estimators=15, max_depth=8, class_weight='balanced',
+                                    random_state=0, n_jobs=-1).fit(entrada, y)
+    # Com n_jobs=1 o sklearn soma as árvores na ordem, como a Floresta
+    modelo.n_jobs = 1
+    esperado = modelo.predict_proba(X_teste if scaler is None else scaler.transform(X_teste))
+
+    floresta = Floresta.de_modelo(modelo, scaler, FEATURES)
+    floresta.salvar(str(tmp_path / 'floresta'))
+    carregada = Floresta.carregar(str(tmp_path / 'floresta'))
+
+    assert carregada.normalizada == normalizar and carregada.features == FEATURES
+    np.testing.assert_array_equal(carregada.classes_, modelo.classes_)
+    for f in (floresta, carregada):
+        np.testing.assert_array_equal(f.predict_proba(X_teste), esperado)
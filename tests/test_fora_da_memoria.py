@@ -0,0 +1,67 @@
+"""Treino fora da memória x em memória, em dados sintéticos pequenos."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from conftest import RAIZ
+from gerar_dados import gerar
+
+ESCALA = 0.2
+MEMORIA_MB = 1024
+
+
+def _treinar(pasta, *args):
+    shutil.rmtree(os.path.join(pasta, 'cache'), ignore_errors=True)
+    subprocess.run([sys.executable, os.path.join(RAIZ, 'treinar_modelo.py'), *args],
+                   cwd=pasta, check=True, capture_output=True, text=True)
+    with open(os.path.join(pasta, 'models', 'resumo.json')) as f:
+        metricas = json.load(f)['metrics']
+    with open(os.path.join(pasta, 'models', 'execucao.json')) as f:
+        return metricas, json.load(f)
+
+
+@pytest.fixture(scope='module')
+def treinos(tmp_path_factory, monkeypatch_modulo):
+    from cache_colunar import CacheColunar
+    from treinar_modelo import ARQUIVOS_DADOS
+
+    pasta = tmp_path_factory.mktemp('fora_da_memoria')
+    gerar(str(pasta / 'data'), ESCALA)
+    monkeypatch_modulo.chdir(pasta)
+
+    em_memoria, _ = _treinar(pasta)
+    cache = CacheColunar(ARQUIVOS_DADOS)
+    df, info = cache.carregar_df('features')
+    X_memoria = df[info['features']].to_numpy(np.float32)
+
+    fora, execucao = _treinar(pasta, '--fora-da-memoria', '--memoria-mb', str(MEMORIA_MB))
+    X_fora = np.load(os.path.join(cache.arquivo('matriz'), 'X.npy'))
+    return em_memoria, fora, execucao, X_memoria, X_fora
+
+
+@pytest.fixture(scope='module')
+def monkeypatch_modulo():
+    with pytest.MonkeyPatch.context() as mp:
+        yield mp
+
+
+def test_matriz_igual_as_features_em_memoria(treinos):
+    _, _, _, X_memoria, X_fora = treinos
+    np.testing.assert_array_equal(X_fora, X_memoria)
+
+
+def test_metricas_dentro_da_tolerancia(treinos):
+    em_memoria, fora, _, _, _ = treinos
+    assert fora['auc'] == pytest.approx(em_memoria['auc'], abs=0.02)
+    assert fora['f1'] == pytest.approx(em_memoria['f1'], abs=0.1)
+
+
+def test_pico_abaixo_do_limite(treinos):
+    _, _, execucao, _, _ = treinos
+    assert execucao['pico_rss_processo_mb'] <= MEMORIA_MB
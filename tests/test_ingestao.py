@@ -0,0 +1,83 @@
+"""Leitura incremental (ingestao.py) x carregador original com json.load."""
+
+import json
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+from conftest import RAIZ
+from ingestao import (datas_para_epoch, iterar_lotes_prospects, iterar_objeto, ler_prospects,
+                      desdobrar_prospects)
+
+sys.path.insert(0, os.path.join(RAIZ, 'benchmarks'))
+from bench_ingestao import carregar_legado, carregar_streaming  # noqa: E402
+
+VAGAS = {'10': {'informacoes_basicas': {'titulo_vaga': 'Analista SAP'}}, '11': {}, '12': {}}
+
+PROSPECTS = {
+    '10': {'titulo': 'Analista SAP', 'prospects': [
+        {'codigo': '31000', 'situacao_candidado': 'Contratado pela Decision',
+         'data_candidatura': '25-03-2021', 'recrutador': 'Ana', 'comentario': ''},
+        {'codigo': '31001', 'situacao_candidado': 'Não Aprovado pelo Cliente',
+         'data_candidatura': '26-03-2021', 'recrutador': 'Ana', 'comentario': 'Foi CONTRATADO'},
+        # Código vazio, inválido ou ausente: a candidatura sai da tabela
+        {'codigo': '', 'situacao_candidado': 'Prospect'},
+        {'codigo': 'abc', 'situacao_candidado': 'Prospect'},
+        {'situacao_candidado': 'Prospect'},
+        # Campos ausentes, nulos e data inválida
+        {'codigo': '31002'},
+        {'codigo': '31003', 'comentario': None, 'data_candidatura': '31-02-2021'},
+    ]},
+    '11': {'titulo': 'Sem candidatos', 'prospects': []},
+    '12': {'titulo': 'Desenvolvedor — Júnior', 'prospects': [
+        {'codigo': '31000', 'situacao_candidado': 'Encaminhado ao Requisitante',
+         'data_candidatura': '01-04-2021', 'recrutador': 'José Ç', 'comentario': 'ok "aspas" {}'},
+    ]},
+}
+
+APPLICANTS = {
+    '31000': {'cv_pt': 'python sql'},
+    '31001': {'cv_pt': ''},
+    '31002': {},
+    'x': {'cv_pt': 'id inválido'},
+}
+
+
+@pytest.fixture
+def pasta(tmp_path):
+    for nome, dados in (('vagas', VAGAS), ('prospects', PROSPECTS), ('applicants', APPLICANTS)):
+        with open(tmp_path / f"{nome}.json", 'w', encoding='utf-8') as f:
+            json.dump(dados, f, ensure_ascii=False, indent=2)
+    return tmp_path
+
+
+def test_streaming_igual_ao_legado(pasta):
+    n_legado, df_legado, cv_legado = carregar_legado(pasta)
+    n_stream, df_stream, cv_stream = carregar_streaming(pasta)
+    # A ingestão já entrega data_candidatura como epoch (int64)
+    df_legado['data_candidatura'] = datas_para_epoch(df_legado['data_candidatura'].tolist())
+
+    assert n_legado == n_stream == len(VAGAS)
+    pd.testing.assert_frame_equal(df_legado, df_stream)
+    assert cv_legado == cv_stream
+    assert len(df_stream) == 5 and df_stream['is_hired'].tolist() == [1, 1, 0, 0, 0]
+
+
+@pytest.mark.parametrize('tamanho_bloco', [1, 7, 64])
+def test_iterar_objeto_em_blocos_pequenos(pasta, tamanho_bloco):
+    # Blocos menores que um registro atravessam chaves, strings e escapes
+    registros = list(iterar_objeto(pasta / 'prospects.json', tamanho_bloco))
+    assert registros == list(PROSPECTS.items())
+
+
+@pytest.mark.parametrize('tamanho_lote', [1, 2, 100])
+def test_lotes_pequenos_iguais_a_tabela_inteira(pasta, tamanho_lote):
+    df, n_jobs = ler_prospects(pasta / 'prospects.json')
+    assert n_jobs == len(PROSPECTS)
+    # Com lotes de 1 e 2 candidaturas, o último lote sai vazio
+    em_lotes, _ = desdobrar_prospects(PROSPECTS.items(), tamanho_lote)
+    pd.testing.assert_frame_equal(em_lotes, df)
+    partes = iterar_lotes_prospects(iterar_objeto(pasta / 'prospects.json'), tamanho_lote)
+    assert sum(len(parte) for parte in partes) == len(df)
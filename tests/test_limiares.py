@@ -0,0 +1,57 @@
+"""CurvaLimiar x matriz de confusão e métricas do sklearn, linha de corte a linha de corte."""
+
+import numpy as np
+import pytest
+from sklearn.metrics import confusion_matrix, f1_score, precision_score, recall_score
+
+from limiares import CurvaLimiar
+
+
+def _limiares(y_proba):
+    # Grade regular, as bordas 0 e 1 e os próprios scores (empates no corte)
+    return np.unique(np.concatenate([np.linspace(0, 1, 101), [0.0, 1.0], y_proba]))
+
+
+def _conferir(y, y_proba):
+    curva = CurvaLimiar.de_scores(y, y_proba)
+    for limiar in _limiares(y_proba):
+        y_pred = y_proba > limiar
+        np.testing.assert_array_equal(curva.matriz(limiar), confusion_matrix(y, y_pred, labels=[0, 1]))
+        metricas = curva.metricas(limiar)
+        assert metricas['precision'] == pytest.approx(precision_score(y, y_pred, zero_division=0))
+        assert metricas['recall'] == pytest.approx(recall_score(y, y_pred, zero_division=0))
+        assert metricas['f1'] == pytest.approx(f1_score(y, y_pred, zero_division=0))
+
+
+@pytest.mark.parametrize('semente', [0, 1, 2])
+def test_igual_ao_sklearn_com_empates(semente):
+    rng = np.random.default_rng(semente)
+    y = (rng.random(500) < 0.1).astype(int)
+    # Scores de floresta: frações de árvores, com muitos empates, inclusive em 0 e 1
+    y_proba = np.round(np.clip(rng.normal(0.2 + 0.5 * y, 0.25), 0, 1) * 20) / 20
+    assert len(np.unique(y_proba)) < len(y_proba)
+    _conferir(y, y_proba)
+
+
+def test_teste_sem_positivos():
+    y_proba = np.random.default_rng(3).random(100)
+    _conferir(np.zeros(100, dtype=int), y_proba)
+    curva = CurvaLimiar.de_scores(np.zeros(100, dtype=int), y_proba)
+    assert curva.metricas(0.5) == {'precision': 0.0, 'recall': 0.0, 'f1': 0.0}
+
+
+@pytest.mark.parametrize('limiar, esperado', [(0.0, [[1, 2], [0, 2]]), (1.0, [[3, 0], [2, 0]])])
+def test_bordas(limiar, esperado):
+    # Corte estrito: em 0, só quem tem score 0 fica de fora; em 1, ninguém é recomendado
+    curva = CurvaLimiar.de_scores([0, 0, 0, 1, 1], [0.0, 0.5, 1.0, 0.5, 1.0])
+    np.testing.assert_array_equal(curva.matriz(limiar), esperado)
+
+
+def test_salvar_carregar(tmp_path):
+    rng = np.random.default_rng(4)
+    y, y_proba = (rng.random(200) < 0.2).astype(int), rng.random(200)
+    curva = CurvaLimiar.de_scores(y, y_proba)
+    curva.salvar(str(tmp_path / 'limiares.npz'))
+    carregada = CurvaLimiar.carregar(str(tmp_path / 'limiares.npz'))
+    for limiar in _limiares(y_proba):
+        np.testing.assert_array_equal(carregada.matriz(limiar), curva.matriz(limiar))
@@ -0,0 +1,80 @@
+"""Recuperação em duas etapas: destaques com histórico atualizado e treino sem CVs."""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import RAIZ
+from features import FeaturesCandidatos, Historico
+from floresta import Floresta
+from gerar_dados import gerar
+from recuperacao import DIMENSOES, IndiceVetorial, Recuperador
+from servico import Pontuador
+from similaridade import IndiceTextos
+
+ARTEFATOS = ['floresta', 'historico.npz', 'candidatos.npz', 'textos', 'recuperacao',
+             'ranking.npz', 'limiares.npz', 'resumo.json']
+
+
+def test_indice_vetorial_sem_vetores():
+    vetorial = IndiceVetorial.construir(np.arange(3), np.zeros((3, DIMENSOES), dtype=np.float32))
+    assert len(vetorial.centroides) == 0 and len(vetorial.ids) == 0
+    ids, scores = vetorial.buscar(np.ones(DIMENSOES, dtype=np.float32), 10)
+    assert len(ids) == len(scores) == 0
+
+
+def test_treino_sem_cvs(tmp_path):
+    gerar(str(tmp_path / 'data'), 0.05, fracao_cv=0.0)
+    subprocess.run([sys.executable, os.path.join(RAIZ, 'treinar_modelo.py')],
+                   cwd=tmp_path, check=True, capture_output=True, text=True)
+    for nome in ARTEFATOS:
+        assert os.path.exists(tmp_path / 'models' / nome), nome
+
+    pontuador = Pontuador(str(tmp_path / 'models'))
+    recuperador = pontuador.recuperador
+    assert len(recuperador.vetorial.centroides) == 0
+    job_id = next(iter(pontuador.ranking._vagas))
+    # Sem listas no IVF, a primeira etapa fica só com os destaques
+    np.testing.assert_array_equal(recuperador.candidatos_vaga(job_id), recuperador.destaques)
+    assert len(pontuador.candidatos_para_vaga(job_id, 5)) == 5
+
+
+@pytest.fixture(scope='module')
+def artefatos(pasta_modelos):
+    return (Floresta.carregar(str(pasta_modelos / 'floresta')),
+            FeaturesCandidatos.carregar(str(pasta_modelos / 'candidatos.npz')),
+            IndiceTextos.carregar(str(pasta_modelos / 'textos')))
+
+
+def _historico_com_contratacoes(pasta_modelos, recuperador):
+    """Histórico do treino mais cinco contratações de cada um dos 20 piores na vaga neutra."""
+    ids = np.asarray(recuperador.indice_textos.ids_cvs)
+    piores = ids[np.argsort(recuperador.scores_neutros)[:20]]
+    delta = pd.DataFrame({'job_id': 1, 'applicant_id': np.repeat(piores, 5), 'is_hired': 1})
+    historico = Historico.carregar(str(pasta_modelos / 'historico.npz'))
+    historico.atualizar(delta)
+    return historico
+
+
+def test_destaques_refeitos_com_historico_novo(pasta_modelos, artefatos):
+    modelo, candidatos, textos = artefatos
+    historico = Historico.carregar(str(pasta_modelos / 'historico.npz'))
+    recuperador = Recuperador.carregar(str(pasta_modelos / 'recuperacao'), modelo, historico,
+                                       candidatos, textos)
+    antes = np.array(recuperador.destaques)
+    novo = _historico_com_contratacoes(pasta_modelos, recuperador)
+
+    recuperador.atualizar_historico(novo)
+    esperado = Recuperador.construir(modelo, novo, candidatos, textos)
+    np.testing.assert_array_equal(recuperador.destaques, esperado.destaques)
+    np.testing.assert_array_equal(recuperador.scores_neutros, esperado.scores_neutros)
+    assert not np.array_equal(recuperador.destaques, antes)
+
+    # Carregado depois de um atualizar_historico.py, refaz os destaques sozinho
+    carregado = Recuperador.carregar(str(pasta_modelos / 'recuperacao'), modelo, novo,
+                                     candidatos, textos)
+    np.testing.assert_array_equal(carregado.destaques, esperado.destaques)
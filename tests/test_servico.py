@@ -0,0 +1,143 @@
+"""Serviço de pontuação sobre modelos treinados em dados sintéticos pequenos."""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from conftest import RAIZ
+from servico import Pontuador, criar_servidor
+
+
+@pytest.fixture(scope='module')
+def pontuador(pasta_modelos):
+    return Pontuador(str(pasta_modelos))
+
+
+@pytest.fixture(scope='module')
+def url(pontuador):
+    servidor = criar_servidor(pontuador, porta=0)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{servidor.server_address[1]}"
+    servidor.shutdown()
+    servidor.server_close()
+
+
+def _pedir(url, caminho, corpo=None):
+    # Corpo em bytes vai como está (JSON que json.dumps não gera)
+    dados = corpo if corpo is None or isinstance(corpo, bytes) else json.dumps(corpo).encode()
+    try:
+        with urlopen(Request(url + caminho, data=dados)) as resposta:
+            return resposta.status, json.load(resposta)
+    except HTTPError as e:
+        return e.code, json.load(e)
+
+
+def _vaga_com_espaco_no_ranking(pontuador):
+    """Vaga com menos de k candidatos no ranking: qualquer candidatura nova entra."""
+    return next(v for v in pontuador.ranking._vagas
+                if len(pontuador.melhores(v)) < pontuador.ranking.k)
+
+
+def test_pontuar_nao_altera_ranking(pontuador, url):
+    job_id = _vaga_com_espaco_no_ranking(pontuador)
+    antes = pontuador.melhores(job_id)
+    status, corpo = _pedir(url, '/pontuar', {'job_id': job_id, 'applicant_id': 99999999})
+    assert status == 200 and len(corpo['probabilidades']) == 1
+    assert pontuador.melhores(job_id) == antes
+
+
+def test_post_ranking_inclui_candidatura(pontuador, url):
+    job_id = _vaga_com_espaco_no_ranking(pontuador)
+    novo = 99999998
+    status, corpo = _pedir(url, '/ranking', {'job_id': job_id, 'applicant_id': novo})
+    assert status == 200
+    assert {'applicant_id': novo, 'score': corpo['probabilidades'][0]} in pontuador.melhores(job_id)
+
+
+def test_post_ranking_persiste_e_chega_a_outros_processos(pontuador):
+    job_id = _vaga_com_espaco_no_ranking(pontuador)
+    # Outro processo do serviço sobre a mesma pasta
+    outro = Pontuador(os.path.dirname(pontuador._caminho_ranking))
+
+    score, = outro.incluir_no_ranking([{'job_id': job_id, 'applicant_id': 99999996}])
+    assert {'applicant_id': 99999996, 'score': score} in pontuador.melhores(job_id)
+
+    # Inclusões dos dois lados se somam no arquivo, que sobrevive a um reinício
+    score_2, = pontuador.incluir_no_ranking([{'job_id': job_id, 'applicant_id': 99999995}])
+    reiniciado = Pontuador(os.path.dirname(pontuador._caminho_ranking))
+    ranking = reiniciado.melhores(job_id)
+    assert {'applicant_id': 99999996, 'score': score} in ranking
+    assert {'applicant_id': 99999995, 'score': score_2} in ranking
+
+
+@pytest.mark.parametrize('caminho', ['/ranking', '/candidatos'])
+@pytest.mark.parametrize('k', ['-1', '0', '2.5', 'x'])
+def test_k_invalido_na_query(pontuador, url, caminho, k):
+    job_id = _vaga_com_espaco_no_ranking(pontuador)
+    status, _ = _pedir(url, f"{caminho}?job_id={job_id}&k={k}")
+    assert status == 400
+
+
+@pytest.mark.parametrize('k', [0, -2, 2.5, '3', True, None])
+def test_k_invalido_em_vagas(url, k):
+    status, _ = _pedir(url, '/vagas', {'cv': 'python sql', 'k': k})
+    assert status == 400
+
+
+@pytest.mark.parametrize('caminho', ['/pontuar', '/ranking'])
+@pytest.mark.parametrize('campo', ['job_id', 'applicant_id'])
+@pytest.mark.parametrize('valor', [1e30, 2**70, -2**63 - 1, 10.9, 10.0, True, None, '10'])
+def test_id_invalido_no_corpo(pontuador, url, caminho, campo, valor):
+    candidatura = {'job_id': _vaga_com_espaco_no_ranking(pontuador), 'applicant_id': 31000, campo: valor}
+    status, _ = _pedir(url, caminho, candidatura)
+    assert status == 400
+
+
+@pytest.mark.parametrize('caminho', ['/pontuar', '/ranking'])
+def test_id_infinito_no_corpo(url, caminho):
+    status, _ = _pedir(url, caminho, b'{"job_id": Infinity, "applicant_id": 31000}')
+    assert status == 400
+
+
+@pytest.mark.parametrize('caminho', ['/ranking', '/candidatos'])
+@pytest.mark.parametrize('job_id', ['99999999999999999999999', '10.9', 'x'])
+def test_id_invalido_na_query(url, caminho, job_id):
+    status, _ = _pedir(url, f"{caminho}?job_id={job_id}")
+    assert status == 400
+
+
+def test_k_valido(pontuador, url):
+    job_id = _vaga_com_espaco_no_ranking(pontuador)
+    status, corpo = _pedir(url, f"/ranking?job_id={job_id}&k=1")
+    assert status == 200 and len(corpo['candidatos']) == 1
+    status, corpo = _pedir(url, '/vagas', {'cv': 'python sql', 'k': 3})
+    assert status == 200 and len(corpo['vagas']) == 3
+
+
+def test_historico_regravado_e_relido(pontuador, tmp_path):
+    job_id = _vaga_com_espaco_no_ranking(pontuador)
+    candidatura = {'job_id': job_id, 'applicant_id': 99999997}
+    antes = pontuador.historico.n_linhas
+
+    # Duas candidaturas anteriores do mesmo candidato, uma contratada
+    delta = {str(job_id + 1): {'prospects': [
+        {'codigo': '99999997', 'situacao_candidado': 'Contratado pela Decision'},
+        {'codigo': '99999997', 'situacao_candidado': 'Prospect'},
+    ]}}
+    with open(tmp_path / 'delta.json', 'w') as f:
+        json.dump(delta, f)
+    subprocess.run([sys.executable, os.path.join(RAIZ, 'atualizar_historico.py'),
+                    str(tmp_path / 'delta.json'), '--historico', pontuador._caminho_historico],
+                   check=True, capture_output=True, text=True)
+
+    pontuador.pontuar([candidatura])
+    assert pontuador.historico.n_linhas == antes + 2
+    assert pontuador.recuperador is None or pontuador.recuperador.historico is pontuador.historico
+    aplicacoes, contratacoes = pontuador.historico.candidato([99999997])
+    assert (aplicacoes[0], contratacoes[0]) == (2, 1)
@@ -0,0 +1,78 @@
+"""Regras de tokenização e casamento do ExtratorSkills."""
+
+import numpy as np
+import pytest
+
+from skills import SKILLS, ExtratorSkills, tokenizar
+
+VOCABULARIO = {
+    'node': ['node.js'],
+    'dotnet': ['.net'],
+    'sap_fi': ['sap fi'],
+    'c++': ['c++'],
+    'c#': ['c#'],
+}
+
+
+def _skills(extrator, texto):
+    return sorted(extrator.skills[i] for i in extrator.skills_do_texto(texto))
+
+
+@pytest.mark.parametrize('texto, esperado', [
+    # Palavra inteira: java não casa dentro de javascript
+    ('javascript', []),
+    ('Java e JavaScript', ['java']),
+    # / e - separam: pl/sql e T-SQL trazem o token sql
+    ('pl/sql', ['sql']),
+    ('PL/SQL.', ['sql']),
+    ('T-SQL', ['sql']),
+    ('MySQL, PostgreSQL', ['sql']),
+    # Pontos nas pontas saem; tokens com ponto também casam pelas partes
+    ('Java, Python.', ['java', 'python']),
+    ('java.util', ['java']),
+    ('SAP', ['sap']),
+    # Perda conhecida: versão colada ao nome forma outro token
+    ('java8', []),
+    ('python3', []),
+])
+def test_vocabulario_padrao(texto, esperado):
+    assert _skills(ExtratorSkills(SKILLS), texto) == esperado
+
+
+@pytest.mark.parametrize('texto, esperado', [
+    # node.js é um token só; sem o ponto, ou sem o .js, não casa
+    ('node.js', ['node']),
+    ('Node.JS.', ['node']),
+    ('nodejs', []),
+    ('node', []),
+    # .net vira o termo "net": casa em asp.net e também na palavra net
+    ('.net', ['dotnet']),
+    ('asp.net', ['dotnet']),
+    ('net income', ['dotnet']),
+    ('internet', []),
+    # Termo composto: tokens seguidos, na ordem, com pontuação entre eles
+    ('SAP FI', ['sap_fi']),
+    ('sap, fi', ['sap_fi']),
+    ('sap mm fi', []),
+    ('fi sap', []),
+    # + e # fazem parte do token
+    ('c++ e c#', ['c#', 'c++']),
+    ('c', []),
+])
+def test_termos_com_pontuacao_e_compostos(texto, esperado):
+    assert _skills(ExtratorSkills(VOCABULARIO), texto) == esperado
+
+
+def test_tokenizar():
+    assert tokenizar('Node.JS, C++ e C# (pl/sql)!') == ['node.js', 'c++', 'e', 'c#', 'pl', 'sql']
+
+
+def test_extrair():
+    extrator = ExtratorSkills(SKILLS)
+    ids, matriz = extrator.extrair({7: 'python e sql', 8: '', 9: 'java8, SAP'})
+    np.testing.assert_array_equal(ids, [7, 8, 9])
+    colunas = {nome: i for i, nome in enumerate(extrator.skills)}
+    esperado = np.zeros((3, len(SKILLS)), dtype=np.int8)
+    esperado[0, [colunas['python'], colunas['sql']]] = 1
+    esperado[2, colunas['sap']] = 1
+    np.testing.assert_array_equal(matriz.toarray(), esperado)
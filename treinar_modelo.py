@@ -1,214 +1,564 @@
 """
 DECISION AI - Treino FINAL CORRETO
 POSTECH Datathon 2026
+
+Uso: python treinar_modelo.py [--desbalanceamento smote|smote-balltree|pesos|bagging]
+                              [--cv sem-vazamento|reamostrada] [--reaproveitar-dobras] [--cpus N]
+                              [--normalizar] [--split aleatorio|temporal]
+                              [--perfil ETAPA ...] [--tracemalloc]
+                              [--fora-da-memoria [--memoria-mb 2048]]
+
+As features vêm de features.py, compartilhado com o serviço de pontuação;
+importar este módulo não dispara o treino.
+
+A floresta não usa normalização: os splits das árvores só dependem da
+ordem dos valores de cada feature. Por padrão o treino roda direto sobre a
+matriz de features em float32 (o dtype que as árvores usam por dentro), sem
+StandardScaler e sem cópias em float64; --normalizar volta ao caminho
+antigo. Nos dois casos models/floresta/ é o único artefato do modelo e
+recebe as features cruas.
+
+Com --split temporal, as features comportamentais são calculadas no ponto
+no tempo de cada candidatura (só dias anteriores, como o serviço as vê) e o
+teste são as candidaturas mais recentes, em vez de um sorteio.
+
+Cada execução mede suas etapas (instrumentacao.py: tempo, CPU, pico de RSS,
+linhas) em models/execucao.json e no histórico models/execucoes.jsonl, que
+o dashboard plota; --perfil grava o cProfile das etapas escolhidas.
+
+Com --fora-da-memoria, para volumes que não cabem na RAM, o pico de RSS
+fica abaixo de --memoria-mb: features em lotes para uma matriz em disco,
+subamostras balanceadas no lugar do SMOTE e floresta ajustada em blocos
+(fora_da_memoria.py). Gera os mesmos artefatos em models/.
 """
 
 import pandas as pd
 import numpy as np
+import argparse
 import json
+import os
 import pickle
-from sklearn.model_selection import train_test_split, cross_val_score, StratifiedKFold
+import sys
+import time
+from sklearn.model_selection import train_test_split, StratifiedKFold
 from sklearn.preprocessing import StandardScaler
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import (confusion_matrix, f1_score, precision_score, 
+from sklearn.metrics import (confusion_matrix, f1_score, precision_score,
                             recall_score, roc_auc_score)
-from imblearn.over_sampling import SMOTE
+from ingestao import ler_prospects, ler_cvs, ler_textos_vagas
+from cache_colunar import CacheColunar
+from desbalanceamento import ESTRATEGIAS, criar_modelo, reamostrador
+from features import FeaturesCandidatos, Historico, calcular_features
+from floresta import Floresta
+from fora_da_memoria import (MEMORIA_MB, MatrizFeatures, linhas_por_bloco, linhas_por_lote,
+                             pontuar_matriz, treinar_em_blocos)
+from instrumentacao import TODAS, Relatorio
+from limiares import CurvaLimiar
+from ranking import IndiceRanking, pontuar_em_lotes
+from recuperacao import Recuperador
+from similaridade import IndiceTextos
+from validacao import divisao_temporal, dobras_sem_vazamento, dobras_simples, validar
 import warnings
 warnings.filterwarnings('ignore')
 
-print("DECISION AI - Iniciando treino\n")
-
-# ============================================================================
-# 1. CARREGAR E PROCESSAR DADOS
-# ============================================================================
-print("[1/5] Carregando dados...")
+ARQUIVOS_DADOS = ['data/vagas.json', 'data/prospects.json', 'data/applicants.json']
 
-with open('data/vagas.json') as f:
-    vagas = json.load(f)
-with open('data/prospects.json') as f:
-    prospects_dict = json.load(f)
-with open('data/applicants.json') as f:
-    applicants = json.load(f)
+# Faixas do histograma de scores do dashboard
+BINS_HISTOGRAMA = 30
 
-print(f"  Vagas: {len(vagas):,}")
-print(f"  Jobs com prospects: {len(prospects_dict):,}")
-print(f"  Applicants: {len(applicants):,}")
 
 # ============================================================================
-# 2. DESDOBRAR PROSPECTS (job -> lista de candidatos)
+# 1. CARREGAR E PROCESSAR DADOS
 # ============================================================================
-print("\n[2/5] Processando prospects...")
-
-data_list = []
-for job_id, job_data in prospects_dict.items():
-    job_id_int = int(job_id)
-    prospects_list = job_data.get('prospects', [])
-    
-    for prospect in prospects_list:
-        try:
-            # Extrair código do candidato
-            codigo = prospect.get('codigo', '0')
-            applicant_id = int(codigo) if codigo and codigo != '' else 0
-            
-            # Verificar se foi contratado (comentário contém "contratado")
-            comentario = str(prospect.get('comentario', '')).lower()
-            situacao = str(prospect.get('situacao_candidado', '')).lower()
-            is_hired = 1 if ('contratado' in comentario or 'contratado' in situacao) else 0
-            
-            if applicant_id > 0:
-                data_list.append({
-                    'job_id': job_id_int,
-                    'applicant_id': applicant_id,
-                    'is_hired': is_hired,
-                    'data_candidatura': prospect.get('data_candidatura', ''),
-                    'recrutador': prospect.get('recrutador', '')
-                })
-        except:
-            continue
-
-df = pd.DataFrame(data_list)
-
-print(f"  Total de candidaturas: {len(df):,}")
-print(f"  Candidatos únicos: {df['applicant_id'].nunique():,}")
-print(f"  Vagas com candidatos: {df['job_id'].nunique():,}")
-print(f"  Taxa de contratação: {df['is_hired'].mean():.2%}")
+def carregar_dados(cache, usar_cache, relatorio=None):
+    """
+    Passos 1-2: tabela de prospects, CVs e textos das vagas (cv_dict e
+    textos_vagas são None vindo do cache). Cada leitura é uma etapa de
+    `relatorio` (instrumentacao.Relatorio).
+    """
+    relatorio = relatorio or Relatorio()
+    print("[1/5] Carregando dados...")
+
+    cv_dict = textos_vagas = None
+    if usar_cache:
+        with relatorio.etapa('cache_prospects') as etapa:
+            df, contagens = cache.carregar_df('prospects')
+            etapa.linhas_saida = len(df)
+        print(f"  ✓ Cache {cache.chave[:12]} (dados inalterados)")
+    else:
+        # Leitura do JSON e desdobramento acontecem juntos, em streaming
+        with relatorio.etapa('leitura_prospects') as etapa:
+            df, n_jobs = ler_prospects('data/prospects.json')
+            etapa.linhas_entrada, etapa.linhas_saida = n_jobs, len(df)
+        with relatorio.etapa('leitura_cvs') as etapa:
+            cv_dict, n_applicants = ler_cvs('data/applicants.json')
+            etapa.linhas_saida = n_applicants
+        with relatorio.etapa('leitura_vagas') as etapa:
+            textos_vagas = ler_textos_vagas('data/vagas.json')
+            etapa.linhas_saida = len(textos_vagas)
+        contagens = {
+            'vagas': len(textos_vagas),
+            'jobs': n_jobs,
+            'applicants': n_applicants,
+        }
+        with relatorio.etapa('gravar_cache_prospects', len(df)):
+            cache.salvar_df('prospects', df, **contagens)
+
+    print(f"  Vagas: {contagens['vagas']:,}")
+    print(f"  Jobs com prospects: {contagens['jobs']:,}")
+    print(f"  Applicants: {contagens['applicants']:,}")
+
+    # ========================================================================
+    # 2. DESDOBRAR PROSPECTS (job -> lista de candidatos)
+    # ========================================================================
+    print("\n[2/5] Processando prospects...")
+
+    # O desdobramento é feito durante a leitura (ingestao.ler_prospects)
+
+    print(f"  Total de candidaturas: {len(df):,}")
+    print(f"  Candidatos únicos: {df['applicant_id'].nunique():,}")
+    print(f"  Vagas com candidatos: {df['job_id'].nunique():,}")
+    print(f"  Taxa de contratação: {df['is_hired'].mean():.2%}")
+
+    return df, cv_dict, textos_vagas
+
 
 # ============================================================================
 # 3. FEATURE ENGINEERING
 # ============================================================================
-print("\n[3/5] Criando features...")
-
-# Comportamentais
-df['total_aplicacoes'] = df.groupby('applicant_id')['applicant_id'].transform('count')
-df['total_contratacoes'] = df.groupby('applicant_id')['is_hired'].transform('sum')
-df['taxa_sucesso'] = (df['total_contratacoes'] / df['total_aplicacoes']).fillna(0)
-df['ordem_aplicacao'] = df.groupby('job_id').cumcount() + 1
-
-# CVs dos candidatos
-cv_dict = {}
-for k, v in applicants.items():
-    try:
-        cv_dict[int(k)] = str(v.get('cv_pt', ''))
-    except:
-        continue
-
-df['cv'] = df['applicant_id'].map(cv_dict).fillna('')
-df['cv_tamanho'] = df['cv'].str.len()
-
-# Skills
-skills = ['python', 'java', 'sql', 'sap']
-for skill in skills:
-    df[f'has_{skill}'] = df['cv'].str.lower().str.contains(skill, na=False).astype(int)
-
-# Limpar
-df = df.fillna(0)
-df = df.replace([np.inf, -np.inf], 0)
-
-# Features finais
-features = ['total_aplicacoes', 'taxa_sucesso', 'ordem_aplicacao', 
-            'cv_tamanho'] + [f'has_{skill}' for skill in skills]
-
-X = df[features]
-y = df['is_hired']
-
-print(f"  Features: {len(features)}")
-print(f"  Registros: {len(X):,}")
-print(f"  Positivos: {y.sum():,} ({y.mean():.2%})")
-
-if len(X) == 0 or y.sum() == 0:
-    print("\n❌ ERRO: Não há dados suficientes para treinar!")
-    print("Verifique se os arquivos JSON estão corretos.")
-    exit(1)
+def _criar_stores(cv_dict, textos_vagas, cache, relatorio):
+    """Store de features de CV e índice TF-IDF, gravados no cache."""
+    # CVs: features calculadas uma vez por candidato e juntadas por
+    # índice, sem copiar o texto do CV para cada candidatura
+    with relatorio.etapa('features_cv', len(cv_dict)) as etapa:
+        candidatos = FeaturesCandidatos.de_cvs(cv_dict)
+        candidatos.salvar(cache.arquivo('candidatos.npz'))
+        etapa.linhas_saida = len(candidatos.ids)
+    with relatorio.etapa('indice_textos', len(textos_vagas) + len(cv_dict)) as etapa:
+        indice_textos = IndiceTextos.construir(textos_vagas, cv_dict)
+        indice_textos.salvar(cache.arquivo('textos'))
+        etapa.linhas_saida = len(indice_textos.ids_vagas) + len(indice_textos.ids_cvs)
+    return candidatos, indice_textos
+
+
+def _carregar_stores(cache):
+    return (FeaturesCandidatos.carregar(cache.arquivo('candidatos.npz')),
+            IndiceTextos.carregar(cache.arquivo('textos')))
+
+
+def _nome_features(ponto_no_tempo):
+    return 'features_ponto_no_tempo' if ponto_no_tempo else 'features'
+
+
+def em_cache(cache, ponto_no_tempo=False, fora_da_memoria=False):
+    """Se os passos 1-3 podem ser lidos do cache."""
+    tabelas = ['matriz'] if fora_da_memoria else ['prospects', _nome_features(ponto_no_tempo)]
+    return all(cache.contem(nome) for nome in tabelas + ['candidatos.npz', 'textos'])
+
+
+def criar_features(df, cv_dict, textos_vagas, cache, usar_cache, ponto_no_tempo=False,
+                   relatorio=None):
+    """
+    Passo 3: retorna X, y, nomes das features, o store de candidatos e o
+    índice TF-IDF de vagas e CVs (similaridade.py). Com `ponto_no_tempo`,
+    cada candidatura vê só o passado (ver features.py).
+    """
+    relatorio = relatorio or Relatorio()
+    print("\n[3/5] Criando features...")
+
+    if usar_cache:
+        with relatorio.etapa('cache_features') as etapa:
+            candidatos, indice_textos = _carregar_stores(cache)
+            df_features, info = cache.carregar_df(_nome_features(ponto_no_tempo))
+            features = info['features']
+            X = df_features[features]
+            y = df_features['is_hired']
+            etapa.linhas_saida = len(X)
+    else:
+        candidatos, indice_textos = _criar_stores(cv_dict, textos_vagas, cache, relatorio)
+        with relatorio.etapa('features', len(df)) as etapa:
+            X, features = calcular_features(df, candidatos, ponto_no_tempo, indice_textos)
+            y = df['is_hired']
+            etapa.linhas_saida = len(X)
+        with relatorio.etapa('gravar_cache_features', len(X)):
+            cache.salvar_df(_nome_features(ponto_no_tempo), X.assign(is_hired=y), features=features)
+
+    print(f"  Features: {len(features)}")
+    print(f"  Registros: {len(X):,}")
+    print(f"  Positivos: {y.sum():,} ({y.mean():.2%})")
+
+    return X, y, features, candidatos, indice_textos
+
 
 # ============================================================================
 # 4. SPLIT E TREINO
 # ============================================================================
-print("\n[4/5] Treinando modelo...")
-
-# Split
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.2, random_state=42, stratify=y
-)
-
-print(f"  Train: {len(X_train):,} ({y_train.mean():.2%} positivos)")
-print(f"  Test: {len(X_test):,} ({y_test.mean():.2%} positivos)")
-
-# SMOTE
-smote = SMOTE(random_state=42)
-X_train_bal, y_train_bal = smote.fit_resample(X_train, y_train)
-print(f"  Após SMOTE: {len(X_train_bal):,} (50% positivos)")
-
-# Normalizar
-scaler = StandardScaler()
-X_train_scaled = scaler.fit_transform(X_train_bal)
-X_test_scaled = scaler.transform(X_test)
-
-# Modelo
-model = RandomForestClassifier(
-    n_estimators=100,
-    max_depth=10,
-    random_state=42,
-    class_weight='balanced',
-    n_jobs=-1
-)
-
-model.fit(X_train_scaled, y_train_bal)
-print("  ✓ Modelo treinado")
-
-# Validação cruzada
-cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
-cv_scores = cross_val_score(model, X_train_scaled, y_train_bal,
-                            cv=cv, scoring='f1', n_jobs=-1)
-print(f"  ✓ CV F1-Score: {cv_scores.mean():.4f} ± {cv_scores.std():.4f}")
+def treinar(X, y, estrategia='smote', cv_modo='sem-vazamento', reaproveitar_dobras=False,
+            n_jobs=-1, pasta_dobras=None, normalizar=False, datas=None, relatorio=None):
+    """
+    Passo 4: split, balanceamento (desbalanceamento.py), normalização
+    (só com `normalizar`), modelo e validação cruzada.
+
+    Com `datas` (data_candidatura de cada linha), o teste são as
+    candidaturas mais recentes (validacao.divisao_temporal); senão, 20%
+    sorteados e estratificados.
+
+    Dobras e modelo final dividem um único pool de `n_jobs` threads
+    (validacao.py). Com cv_modo='sem-vazamento', SMOTE e normalização são
+    refeitos dentro de cada dobra (SMOTE em cache em `pasta_dobras`); com
+    'reamostrada', as dobras saem do treino já balanceado, como antes, e
+    `reaproveitar_dobras` pode montar o modelo final com árvores das dobras.
+
+    Retorna (modelo, scaler ou None, X_test na entrada do modelo, y_test).
+    """
+    relatorio = relatorio or Relatorio()
+    print("\n[4/5] Treinando modelo...")
+
+    # float32 já é o dtype das árvores: o fit não converte (nem copia) X.
+    # Com normalização fica em float64, como o StandardScaler sempre rodou
+    with relatorio.etapa('split', len(X)) as etapa:
+        X = X.to_numpy(np.float64 if normalizar else np.float32)
+
+        if datas is None:
+            X_train, X_test, y_train, y_test = train_test_split(
+                X, y, test_size=0.2, random_state=42, stratify=y
+            )
+        else:
+            treino, teste, corte = divisao_temporal(datas, 0.2)
+            X_train, X_test, y_train, y_test = X[treino], X[teste], y.iloc[treino], y.iloc[teste]
+            print(f"  Split temporal: teste a partir de "
+                  f"{pd.Timestamp(corte, unit='s'):%d-%m-%Y}")
+        etapa.linhas_saida = len(X_train)
+
+    print(f"  Train: {len(X_train):,} ({y_train.mean():.2%} positivos)")
+    print(f"  Test: {len(X_test):,} ({y_test.mean():.2%} positivos)")
+
+    # Balanceamento
+    amostrador = reamostrador(estrategia)
+    if amostrador is None:
+        X_train_bal, y_train_bal = X_train, y_train
+        print(f"  Sem linhas sintéticas (estratégia '{estrategia}')")
+    else:
+        with relatorio.etapa('balanceamento', len(X_train)) as etapa:
+            X_train_bal, y_train_bal = amostrador.fit_resample(X_train, y_train)
+            etapa.linhas_saida = len(X_train_bal)
+        print(f"  Após SMOTE: {len(X_train_bal):,} ({y_train_bal.mean():.0%} positivos)")
+
+    # Normalizar
+    scaler = None
+    if normalizar:
+        with relatorio.etapa('normalizacao', len(X_train_bal)):
+            scaler = StandardScaler().fit(X_train_bal)
+            X_train_bal = scaler.transform(X_train_bal)
+            X_test = scaler.transform(X_test)
+
+    # Modelo
+    model = criar_modelo(estrategia, n_jobs=n_jobs)
+
+    # Validação cruzada + modelo final
+    cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
+    inicio = time.perf_counter()
+    # Dobras e modelo final dividem o mesmo pool: uma etapa só, com o
+    # detalhe de cada dobra
+    with relatorio.etapa('validacao_e_ajuste', len(X_train_bal)) as etapa:
+        if cv_modo == 'sem-vazamento':
+            dobras = dobras_sem_vazamento(X_train, y_train, cv, amostrador, pasta_dobras, normalizar)
+        else:
+            dobras = dobras_simples(X_train_bal, y_train_bal, cv)
+        final = None if reaproveitar_dobras else (X_train_bal, y_train_bal)
+        model, dobras = validar(model, dobras, final, n_jobs=n_jobs, reaproveitar=reaproveitar_dobras)
+        etapa.registrar(dobras=[
+            {'f1': float(d['f1']), 'linhas': int(d['linhas']), 'preparo_s': float(d['preparo_s']),
+             'em_cache': bool(d['em_cache']), 'tempo_s': d['tempo_s'], 'cpu_s': d['cpu_s']}
+            for d in dobras
+        ])
+    for i, dobra in enumerate(dobras, 1):
+        preparo = ''
+        if cv_modo == 'sem-vazamento' and amostrador is not None:
+            smote = 'em cache' if dobra['em_cache'] else f"{dobra['preparo_s']:.1f}s"
+            preparo = f"SMOTE {smote} | "
+        print(f"    Dobra {i}: F1 {dobra['f1']:.4f} | {preparo}{dobra['tempo_s']:.1f}s "
+              f"({dobra['cpu_s']:.1f}s de CPU)")
+    origem = "árvores das dobras" if reaproveitar_dobras else "ajuste sobre todo o treino"
+    print(f"  ✓ Modelo treinado ({origem}) em {time.perf_counter() - inicio:.1f}s")
+    cv_scores = np.array([dobra['f1'] for dobra in dobras])
+    print(f"  ✓ CV F1-Score ({cv_modo}): {cv_scores.mean():.4f} ± {cv_scores.std():.4f}")
+
+    return model, scaler, X_test, y_test
+
 
 # ============================================================================
 # 5. AVALIAR
 # ============================================================================
-print("\n[5/5] Avaliação final...")
-
-y_pred = model.predict(X_test_scaled)
-y_proba = model.predict_proba(X_test_scaled)[:, 1]
-
-cm = confusion_matrix(y_test, y_pred)
-prec = precision_score(y_test, y_pred)
-rec = recall_score(y_test, y_pred)
-f1 = f1_score(y_test, y_pred)
-auc = roc_auc_score(y_test, y_proba)
-
-print("\n" + "="*60)
-print("RESULTADOS FINAIS")
-print("="*60)
-print(f"Precision: {prec:.2%}")
-print(f"Recall:    {rec:.2%}")
-print(f"F1-Score:  {f1:.2%}")
-print(f"ROC-AUC:   {auc:.2%}")
-print(f"\nConfusion Matrix:")
-print(f"  TN: {cm[0,0]:,}   FP: {cm[0,1]:,}")
-print(f"  FN: {cm[1,0]:,}   TP: {cm[1,1]:,}")
-
-# Salvar
-import os
-os.makedirs('models', exist_ok=True)
-
-with open('models/model.pkl', 'wb') as f:
-    pickle.dump(model, f)
-with open('models/scaler.pkl', 'wb') as f:
-    pickle.dump(scaler, f)
-
-data = {
-    'X_test': X_test_scaled,
-    'y_test': y_test.values,
-    'y_pred': y_pred,
-    'y_proba': y_proba,
-    'metrics': {'precision': prec, 'recall': rec, 'f1': f1, 'auc': auc},
-    'confusion_matrix': cm,
-    'features': features
-}
-
-with open('models/results.pkl', 'wb') as f:
-    pickle.dump(data, f)
-
-print("\n✅ Arquivos salvos em models/")
-print("="*60)
-print("CONCLUÍDO! Rode: streamlit run app.py")
-print("="*60)
\ No newline at end of file
+def avaliar(model, X_test, y_test, relatorio=None):
+    """Passo 5: métricas no conjunto de teste."""
+    relatorio = relatorio or Relatorio()
+    print("\n[5/5] Avaliação final...")
+
+    with relatorio.etapa('avaliacao', len(X_test)):
+        y_pred = model.predict(X_test)
+        y_proba = model.predict_proba(X_test)[:, 1]
+
+    return metricas(y_test, y_pred, y_proba)
+
+
+def metricas(y_test, y_pred, y_proba):
+    """Imprime e retorna as métricas de teste no formato de avaliar()."""
+    cm = confusion_matrix(y_test, y_pred)
+    prec = precision_score(y_test, y_pred)
+    rec = recall_score(y_test, y_pred)
+    f1 = f1_score(y_test, y_pred)
+    auc = roc_auc_score(y_test, y_proba)
+
+    print("\n" + "="*60)
+    print("RESULTADOS FINAIS")
+    print("="*60)
+    print(f"Precision: {prec:.2%}")
+    print(f"Recall:    {rec:.2%}")
+    print(f"F1-Score:  {f1:.2%}")
+    print(f"ROC-AUC:   {auc:.2%}")
+    print(f"\nConfusion Matrix:")
+    print(f"  TN: {cm[0,0]:,}   FP: {cm[0,1]:,}")
+    print(f"  FN: {cm[1,0]:,}   TP: {cm[1,1]:,}")
+
+    return {
+        'y_pred': y_pred,
+        'y_proba': y_proba,
+        'metrics': {'precision': prec, 'recall': rec, 'f1': f1, 'auc': auc},
+        'confusion_matrix': cm,
+    }
+
+
+def resumir(y_test, resultados):
+    """Só o que o dashboard mostra: métricas, matriz e histogramas já contados."""
+    y_test = np.asarray(y_test)
+    y_proba = resultados['y_proba']
+    bordas = np.linspace(0, 1, BINS_HISTOGRAMA + 1)
+    return {
+        'metrics': {nome: float(valor) for nome, valor in resultados['metrics'].items()},
+        'confusion_matrix': resultados['confusion_matrix'].tolist(),
+        'histograma': {
+            'bordas': bordas.tolist(),
+            'negativos': np.histogram(y_proba[y_test == 0], bins=bordas)[0].tolist(),
+            'positivos': np.histogram(y_proba[y_test == 1], bins=bordas)[0].tolist(),
+        },
+    }
+
+
+def salvar(model, scaler, df, X, candidatos, indice_textos, X_test, y_test, resultados, features,
+           relatorio=None):
+    """Grava modelo, agregados do serviço, ranking e resultados em models/."""
+    relatorio = relatorio or Relatorio()
+    os.makedirs('models', exist_ok=True)
+
+    # Floresta achatada em arrays (floresta.py) no lugar do pickle do sklearn,
+    # com nomes das features e o scaler (se houver) no mesmo artefato
+    floresta = Floresta.de_modelo(model, scaler, features)
+    _salvar_servico(floresta, Historico.de_prospects(df), candidatos, indice_textos, relatorio)
+
+    # Top-K candidatos por vaga, com todas as candidaturas pontuadas
+    with relatorio.etapa('ranking', len(X)):
+        scores = pontuar_em_lotes(floresta, X)
+        IndiceRanking.construir(df['job_id'], df['applicant_id'], scores).salvar('models/ranking.npz')
+
+    _salvar_resultados(X_test, y_test, resultados, features)
+
+
+def _salvar_servico(floresta, historico, candidatos, indice_textos, relatorio):
+    """Modelo, agregados e índices que o serviço carrega de models/."""
+    with relatorio.etapa('salvar_modelo', historico.n_linhas):
+        floresta.salvar('models/floresta')
+        historico.salvar('models/historico.npz')
+        candidatos.salvar('models/candidatos.npz')
+        indice_textos.salvar('models/textos')
+
+    # Índice vetorial de CVs e destaques para buscar candidatos por vaga
+    with relatorio.etapa('recuperacao', len(indice_textos.ids_cvs)):
+        Recuperador.construir(floresta, historico, candidatos, indice_textos).salvar('models/recuperacao')
+
+
+def _salvar_resultados(X_test, y_test, resultados, features):
+    """Resultados do teste para análise e para o dashboard."""
+    y_test = pd.Series(y_test)
+    data = {
+        'X_test': X_test,
+        'y_test': y_test.values,
+        **resultados,
+        'features': features
+    }
+
+    # Arrays completos do teste ficam para análise; o dashboard lê só o resumo
+    with open('models/results.pkl', 'wb') as f:
+        pickle.dump(data, f)
+    with open('models/resumo.json.tmp', 'w') as f:
+        json.dump(resumir(y_test, resultados), f)
+    os.replace('models/resumo.json.tmp', 'models/resumo.json')
+    # Scores do teste ordenados, para o dashboard variar a linha de corte
+    CurvaLimiar.de_scores(y_test, resultados['y_proba']).salvar('models/limiares.npz')
+
+    print("\n✅ Arquivos salvos em models/")
+
+
+# ============================================================================
+# FORA DA MEMÓRIA
+# ============================================================================
+def treinar_fora_da_memoria(cache, usar_cache, memoria_mb=MEMORIA_MB, n_jobs=-1, relatorio=None):
+    """
+    Passos 1-5 e gravação com o pico de RSS limitado a `memoria_mb` (ver
+    fora_da_memoria.py): matriz de features em disco, subamostras
+    balanceadas no lugar do SMOTE e floresta ajustada bloco a bloco. O
+    teste são os mesmos 20% sorteados e estratificados do treino em
+    memória; não há validação cruzada.
+    """
+    relatorio = relatorio or Relatorio()
+    print("[1/5] Carregando dados (fora da memória)...")
+
+    if usar_cache:
+        with relatorio.etapa('cache_features') as etapa:
+            candidatos, indice_textos = _carregar_stores(cache)
+            matriz = MatrizFeatures(cache.arquivo('matriz'))
+            etapa.linhas_saida = len(matriz)
+        print(f"  ✓ Cache {cache.chave[:12]} (dados inalterados)")
+    else:
+        with relatorio.etapa('leitura_cvs') as etapa:
+            cv_dict, etapa.linhas_saida = ler_cvs('data/applicants.json')
+        with relatorio.etapa('leitura_vagas') as etapa:
+            textos_vagas = ler_textos_vagas('data/vagas.json')
+            etapa.linhas_saida = len(textos_vagas)
+        candidatos, indice_textos = _criar_stores(cv_dict, textos_vagas, cache, relatorio)
+        del cv_dict, textos_vagas
+
+        print("\n[2-3/5] Desdobrando prospects e criando features em lotes...")
+        with relatorio.etapa('matriz') as etapa:
+            linhas_lote = linhas_por_lote(memoria_mb)
+            matriz = MatrizFeatures.construir('data/prospects.json', cache.arquivo('matriz'),
+                                              candidatos, indice_textos, linhas_lote)
+            etapa.linhas_saida = len(matriz)
+            etapa.registrar(linhas_por_lote=linhas_lote)
+
+    y = matriz.y
+    print(f"  Candidaturas: {len(matriz):,}")
+    print(f"  Features: {len(matriz.features)}")
+    print(f"  Positivos: {int(y.sum()):,} ({y.mean():.2%})")
+    if len(matriz) == 0 or y.sum() == 0:
+        print("\n❌ ERRO: Não há dados suficientes para treinar!")
+        sys.exit(1)
+
+    print("\n[4/5] Treinando modelo em blocos...")
+    with relatorio.etapa('split', len(matriz)) as etapa:
+        treino, teste = train_test_split(np.arange(len(matriz)), test_size=0.2, random_state=42,
+                                         stratify=y)
+        etapa.linhas_saida = len(treino)
+    print(f"  Train: {len(treino):,} ({y[treino].mean():.2%} positivos)")
+    print(f"  Test: {len(teste):,} ({y[teste].mean():.2%} positivos)")
+
+    with relatorio.etapa('ajuste_em_blocos', len(treino)) as etapa:
+        n_linhas = linhas_por_bloco(memoria_mb, len(matriz.features), int(y[treino].sum()), n_jobs)
+        model, tempos = treinar_em_blocos(criar_modelo('pesos', n_jobs=n_jobs), matriz, treino,
+                                          n_linhas, n_jobs)
+        etapa.registrar(linhas_por_bloco=n_linhas, blocos=len(tempos))
+    print(f"  ✓ {len(tempos)} blocos de {n_linhas:,} linhas (metade positivos) "
+          f"em {sum(tempos):.1f}s de CPU")
+    floresta = Floresta.de_modelo(model, None, matriz.features)
+
+    # Uma passada pela matriz pontua o teste e o ranking
+    print("\n[5/5] Avaliação final...")
+    with relatorio.etapa('avaliacao', len(matriz)):
+        proba = pontuar_matriz(floresta, matriz)
+        y_test = y[teste]
+        y_pred = floresta.classes_[np.argmax(proba[teste], axis=1)]
+    resultados = metricas(y_test, y_pred, proba[teste, 1])
+
+    os.makedirs('models', exist_ok=True)
+    _salvar_servico(floresta, matriz.historico, candidatos, indice_textos, relatorio)
+    with relatorio.etapa('ranking', len(matriz)):
+        IndiceRanking.construir(matriz.job_ids, matriz.applicant_ids, proba[:, 1]).salvar(
+            'models/ranking.npz'
+        )
+    # X_test ficaria do tamanho de 20% da matriz: no lugar, as linhas do teste
+    _salvar_resultados(None, y_test, {**resultados, 'linhas_teste': teste}, matriz.features)
+
+
+def treinar_em_memoria(args, cache, usar_cache, relatorio):
+    """Passos 1-5 e gravação com pandas, tudo em memória."""
+    temporal = args.split == 'temporal'
+    df, cv_dict, textos_vagas = carregar_dados(cache, usar_cache, relatorio)
+    X, y, features, candidatos, indice_textos = criar_features(
+        df, cv_dict, textos_vagas, cache, usar_cache, temporal, relatorio
+    )
+    del cv_dict, textos_vagas
+
+    if len(X) == 0 or y.sum() == 0:
+        print("\n❌ ERRO: Não há dados suficientes para treinar!")
+        print("Verifique se os arquivos JSON estão corretos.")
+        sys.exit(1)
+
+    model, scaler, X_test, y_test = treinar(
+        X, y, args.desbalanceamento, args.cv, args.reaproveitar_dobras, args.cpus,
+        cache.arquivo('dobras'), args.normalizar,
+        df['data_candidatura'].to_numpy() if temporal else None, relatorio
+    )
+    resultados = avaliar(model, X_test, y_test, relatorio)
+    salvar(model, scaler, df, X, candidatos, indice_textos, X_test, y_test, resultados, features,
+           relatorio)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Treino do Decision AI")
+    parser.add_argument('--desbalanceamento', choices=ESTRATEGIAS, default='smote',
+                        help="tratamento do desbalanceamento de classes (ver desbalanceamento.py)")
+    parser.add_argument('--cv', choices=['sem-vazamento', 'reamostrada'], default='sem-vazamento',
+                        help="sem-vazamento: SMOTE e normalização dentro de cada dobra; "
+                             "reamostrada: dobras do treino já balanceado (F1 otimista)")
+    parser.add_argument('--reaproveitar-dobras', action='store_true',
+                        help="monta o modelo final com árvores das dobras (só com --cv reamostrada)")
+    parser.add_argument('--cpus', type=int, default=-1,
+                        help="threads do pool de treino (padrão: todos os núcleos)")
+    parser.add_argument('--normalizar', action='store_true',
+                        help="StandardScaler antes da floresta, em float64 (caminho antigo)")
+    parser.add_argument('--split', choices=['aleatorio', 'temporal'], default='aleatorio',
+                        help="temporal: features no ponto no tempo e teste com as candidaturas "
+                             "mais recentes")
+    parser.add_argument('--perfil', action='append', default=[], metavar='ETAPA',
+                        help=f"cProfile da etapa em models/perfis/<etapa>.prof (repetível; "
+                             f"'{TODAS}' para todas)")
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help="pico de memória alocada pelo Python por etapa (mais lento)")
+    parser.add_argument('--fora-da-memoria', action='store_true',
+                        help="matriz de features em disco, subamostras balanceadas no lugar de "
+                             "--desbalanceamento e floresta em blocos (ver fora_da_memoria.py)")
+    parser.add_argument('--memoria-mb', type=int, default=MEMORIA_MB,
+                        help="limite de RSS do treino com --fora-da-memoria")
+    args = parser.parse_args()
+    temporal = args.split == 'temporal'
+    if args.reaproveitar_dobras and args.cv != 'reamostrada':
+        # Cada dobra sem vazamento tem sua própria reamostragem (e scaler):
+        # as árvores não combinam
+        parser.error("--reaproveitar-dobras exige --cv reamostrada")
+    if args.fora_da_memoria and (temporal or args.normalizar or args.reaproveitar_dobras):
+        # A matriz em disco só tem as features sobre o arquivo inteiro, cruas
+        parser.error("--fora-da-memoria não combina com --split temporal, --normalizar "
+                     "nem --reaproveitar-dobras")
+
+    print("DECISION AI - Iniciando treino\n")
+
+    # Prospects desdobrados e matriz de features ficam em cache colunar,
+    # indexado pelo hash dos JSONs: se os dados não mudaram, pula os passos 1-3
+    cache = CacheColunar(ARQUIVOS_DADOS)
+    usar_cache = em_cache(cache, temporal, args.fora_da_memoria)
+    relatorio = Relatorio({**vars(args), 'cache': usar_cache}, args.perfil, 'models/perfis',
+                          args.tracemalloc)
+
+    if args.fora_da_memoria:
+        treinar_fora_da_memoria(cache, usar_cache, args.memoria_mb, args.cpus, relatorio)
+    else:
+        treinar_em_memoria(args, cache, usar_cache, relatorio)
+    relatorio.imprimir()
+    relatorio.salvar('models')
+
+    print("="*60)
+    print("CONCLUÍDO! Rode: streamlit run app.py")
+    print("="*60)
+
+
+if __name__ == '__main__':
+    main()
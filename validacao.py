@@ -0,0 +1,196 @@
+"""
+DECISION AI - Validação cruzada com um único pool de workers
+POSTECH Datathon 2026
+
+Cada floresta (uma por dobra, mais a final) é dividida em blocos de
+árvores, e todos os blocos de todas as florestas vão para o mesmo pool de
+threads de tamanho n_jobs. Assim dobras x árvores nunca passam de n_jobs
+threads (antes: cross_val_score com n_jobs=-1 sobre uma floresta também
+com n_jobs=-1). Os blocos e suas sementes não dependem de n_jobs, então o
+resultado é o mesmo em qualquer máquina.
+
+Com reaproveitar=True a floresta final não é treinada: ela junta
+n_estimators / k árvores de cada floresta das dobras, e o dado é ajustado
+k vezes em vez de k + 1.
+
+Os dados de cada dobra vêm de um de dois preparos:
+
+  dobras_simples        divide X como veio (por exemplo, já com SMOTE)
+  dobras_sem_vazamento  reamostragem (SMOTE) e, se pedida, normalização
+                        ajustadas só no treino de cada dobra, como um
+                        pipeline do imblearn; a reamostragem de cada dobra
+                        fica em cache no disco
+"""
+
+import hashlib
+import os
+import time
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import f1_score
+from sklearn.preprocessing import StandardScaler
+
+from features import salvar_npz
+
+# Árvores por tarefa do pool
+ARVORES_POR_TAREFA = 10
+
+
+# ============================================================================
+# SPLIT TEMPORAL
+# ============================================================================
+def divisao_temporal(datas, fracao_teste=0.2):
+    """
+    Índices (treino, teste, corte): o teste são as candidaturas mais
+    recentes, a partir da data `corte`, com cerca de `fracao_teste` das
+    linhas. Um mesmo dia nunca fica dos dois lados.
+    """
+    datas = np.asarray(datas, dtype=np.int64)
+    corte = np.sort(datas)[int(len(datas) * (1 - fracao_teste))]
+    return np.flatnonzero(datas < corte), np.flatnonzero(datas >= corte), corte
+
+
+# ============================================================================
+# PREPARO DAS DOBRAS
+# ============================================================================
+def dobras_simples(X, y, cv):
+    """Dobras de (X, y) sem nenhum ajuste dentro delas."""
+    X, y = np.asarray(X), np.asarray(y)
+    return [
+        {'X': X[treino], 'y': y[treino], 'X_validacao': X[validacao], 'y_validacao': y[validacao],
+         'preparo_s': 0.0, 'em_cache': False}
+        for treino, validacao in cv.split(X, y)
+    ]
+
+
+def _hash_dobra(X, y, reamostrador):
+    h = hashlib.sha256(repr(reamostrador).encode())
+    h.update(np.ascontiguousarray(X).tobytes())
+    h.update(np.ascontiguousarray(y).tobytes())
+    return h.hexdigest()
+
+
+def _reamostrar_em_cache(indice, X, y, reamostrador, pasta):
+    """Reamostragem do treino de uma dobra, lida de `pasta` se já foi calculada."""
+    if reamostrador is None:
+        return X, y, False
+
+    caminho = None
+    if pasta is not None:
+        caminho = os.path.join(pasta, f"dobra{indice}_{_hash_dobra(X, y, reamostrador)[:16]}.npz")
+        if os.path.exists(caminho):
+            with np.load(caminho) as npz:
+                return npz['X'], npz['y'], True
+
+    X_bal, y_bal = reamostrador.fit_resample(X, y)
+    if caminho is not None:
+        os.makedirs(pasta, exist_ok=True)
+        salvar_npz(caminho, X=X_bal, y=y_bal)
+    return X_bal, y_bal, False
+
+
+def dobras_sem_vazamento(X, y, cv, reamostrador, pasta_cache=None, normalizar=False):
+    """
+    Dobras com `reamostrador` (ex.: SMOTE; None = nenhum) e, com
+    `normalizar`, StandardScaler ajustados só no treino de cada uma; a
+    validação é apenas transformada. X mantém o dtype recebido. A
+    reamostragem (a parte cara, k-NN) é guardada em `pasta_cache` por
+    índice da dobra e hash dos dados e do reamostrador.
+    """
+    X, y = np.asarray(X), np.asarray(y)
+    dobras = []
+    for i, (treino, validacao) in enumerate(cv.split(X, y)):
+        inicio = time.perf_counter()
+        X_bal, y_bal, em_cache = _reamostrar_em_cache(i, X[treino], y[treino], reamostrador, pasta_cache)
+        X_validacao = X[validacao]
+        if normalizar:
+            scaler = StandardScaler().fit(X_bal)
+            X_bal, X_validacao = scaler.transform(X_bal), scaler.transform(X_validacao)
+        dobras.append({
+            'X': X_bal, 'y': y_bal,
+            'X_validacao': X_validacao, 'y_validacao': y[validacao],
+            'preparo_s': time.perf_counter() - inicio, 'em_cache': em_cache,
+        })
+    return dobras
+
+
+# ============================================================================
+# AJUSTE
+# ============================================================================
+def ajustar_bloco(modelo, X, y, n_arvores, semente):
+    """Floresta de `n_arvores` com a semente do bloco; retorna (floresta, início, fim)."""
+    bloco = clone(modelo).set_params(n_estimators=n_arvores, random_state=semente, n_jobs=1)
+    inicio = time.perf_counter()
+    bloco.fit(X, y)
+    return bloco, inicio, time.perf_counter()
+
+
+def juntar(modelo, blocos, arvores, n_jobs):
+    """Floresta ajustada com `arvores`, com os parâmetros originais de `modelo`."""
+    floresta = blocos[0]
+    floresta.estimators_ = arvores
+    floresta.set_params(**{**modelo.get_params(), 'n_estimators': len(arvores), 'n_jobs': n_jobs})
+    return floresta
+
+
+def todas_arvores(blocos):
+    """Árvores de todos os blocos, na ordem."""
+    return [arvore for bloco in blocos for arvore in bloco.estimators_]
+
+
+def validar(modelo, dobras, final=None, n_jobs=-1, reaproveitar=False):
+    """
+    F1 de cada dobra (de dobras_simples / dobras_sem_vazamento) e a
+    floresta final, ajustada sobre `final` = (X, y) ou, com `reaproveitar`,
+    montada com árvores das dobras.
+
+    Retorna (modelo_final, resultados); cada resultado tem f1, linhas,
+    preparo_s, em_cache, tempo_s (do primeiro ao último bloco terminado)
+    e cpu_s (soma dos blocos).
+    """
+    if (final is None) != reaproveitar:
+        raise ValueError("passe `final` (X, y) ou reaproveitar=True, um dos dois")
+
+    n_arvores = modelo.get_params()['n_estimators']
+    conjuntos = [(d['X'], d['y']) for d in dobras] + ([] if reaproveitar else [final])
+    tamanhos = [min(ARVORES_POR_TAREFA, n_arvores - i) for i in range(0, n_arvores, ARVORES_POR_TAREFA)]
+    sementes = np.random.default_rng(modelo.get_params()['random_state']).integers(
+        np.iinfo(np.int32).max, size=(len(conjuntos), len(tamanhos))
+    )
+
+    tarefas = [(f, b) for f in range(len(conjuntos)) for b in range(len(tamanhos))]
+    saidas = Parallel(n_jobs=n_jobs, prefer='threads')(
+        delayed(ajustar_bloco)(modelo, *conjuntos[f], tamanhos[b], int(sementes[f, b]))
+        for f, b in tarefas
+    )
+    por_floresta = [[] for _ in conjuntos]
+    for (f, _), saida in zip(tarefas, saidas):
+        por_floresta[f].append(saida)
+
+    resultados, florestas = [], []
+    for dobra, saidas_dobra in zip(dobras, por_floresta):
+        blocos, inicios, fins = zip(*saidas_dobra)
+        floresta = juntar(modelo, blocos, todas_arvores(blocos), n_jobs)
+        florestas.append(floresta)
+        resultados.append({
+            'f1': f1_score(dobra['y_validacao'], floresta.predict(dobra['X_validacao'])),
+            'linhas': len(dobra['y']),
+            'preparo_s': dobra['preparo_s'],
+            'em_cache': dobra['em_cache'],
+            'tempo_s': max(fins) - min(inicios),
+            'cpu_s': sum(fim - inicio for inicio, fim in zip(inicios, fins)),
+        })
+
+    if reaproveitar:
+        # n_estimators / k árvores de cada dobra (as primeiras, na ordem)
+        fatias = np.array_split(np.arange(n_arvores), len(florestas))
+        arvores = [arvore for floresta, fatia in zip(florestas, fatias)
+                   for arvore in floresta.estimators_[:len(fatia)]]
+        final = juntar(modelo, [florestas[0]], arvores, n_jobs)
+    else:
+        blocos = [bloco for bloco, _, _ in por_floresta[-1]]
+        final = juntar(modelo, blocos, todas_arvores(blocos), n_jobs)
+
+    return final, resultados